@@ -16,12 +16,26 @@ de cada ação possível em cada estado do jogo. Com o tempo, o agente aprende q
 ações levam a melhores resultados e ajusta sua estratégia automaticamente.
 """
 
+import json
 import random
 import pickle
 from typing import List, Tuple, Dict
 from pathlib import Path
 
 
+def gravar_arquivos(arquivos: Dict[Path, bytes]):
+    """
+    Grava em disco arquivos já serializados, criando as pastas necessárias.
+
+    Args:
+        arquivos: Dicionário {caminho: conteúdo}, como o devolvido por
+            AgenteQLearning.serializar_memoria().
+    """
+    for caminho_arquivo, conteudo in arquivos.items():
+        caminho_arquivo.parent.mkdir(parents=True, exist_ok=True)
+        caminho_arquivo.write_bytes(conteudo)
+
+
 class AgenteQLearning:
     """
     Agente de Aprendizado por Reforço que utiliza Q-Learning para jogar Jogo da Velha.
@@ -69,6 +83,9 @@ class AgenteQLearning:
         >>> print(f"Agente escolheu a ação: {acao_escolhida}")
     """
 
+    # Extensão preferida para os arquivos de memória (usada nos checkpoints)
+    EXTENSAO_MEMORIA = ".pkl"
+
     def __init__(self,
                  alpha: float = 0.5,
                  gamma: float = 1.0,
@@ -253,7 +270,9 @@ class AgenteQLearning:
             return self._escolher_melhor_acao(estado, acoes_validas)
         
         # Estratégia Epsilon-Greedy: exploração vs exploração
-        if random.random() < self.epsilon:
+        # Lê epsilon uma única vez; ele só muda entre partidas (reduzir_epsilon)
+        epsilon = self.epsilon
+        if epsilon > 0.0 and random.random() < epsilon:
             # Exploração: escolhe uma ação aleatória
             return random.choice(acoes_validas)
         else:
@@ -396,10 +415,13 @@ class AgenteQLearning:
             epsilon = max(epsilon_minimo, epsilon * taxa_decaimento_epsilon)
 
         Note:
-            Este método é chamado automaticamente após cada partida durante
-            o treinamento em massa. Para aprendizado interativo, o decaimento
-            pode ser controlado manualmente.
+            Este método é chamado automaticamente uma vez por partida (e não a
+            cada jogada) durante o treinamento em massa. Para aprendizado
+            interativo, o decaimento pode ser controlado manualmente.
         """
+        # Depois de atingir o mínimo, epsilon não muda mais: nada a calcular
+        if self.epsilon == self.epsilon_minimo:
+            return
         self.epsilon = max(self.epsilon_minimo, self.epsilon * self.taxa_decaimento_epsilon)
 
     def salvar_memoria(self, caminho: str):
@@ -411,12 +433,15 @@ class AgenteQLearning:
         aprendizado de onde parou, sem precisar treinar novamente do zero.
 
         O arquivo é salvo em formato binário (pickle), o que permite preservar
-        a estrutura completa da tabela Q (dicionários aninhados).
+        a estrutura completa da tabela Q (dicionários aninhados). Ao lado dele
+        é gravado um pequeno arquivo JSON com os metadados do treinamento
+        (epsilon e estatísticas), para que um checkpoint possa ser retomado
+        exatamente de onde parou.
 
         Args:
             caminho: Caminho do arquivo onde a tabela Q será salva.
                 Se o diretório não existir, ele será criado automaticamente.
-                Exemplo: "modelos/agente_x.pkl"
+                Exemplo: "modelos/agente_x.pkl" (metadados em "modelos/agente_x.json")
 
         Note:
             Este método não imprime mensagens de confirmação, permitindo que
@@ -428,10 +453,81 @@ class AgenteQLearning:
             >>> # ... treinar o agente ...
             >>> agente.salvar_memoria("modelos/meu_agente.pkl")
         """
+        gravar_arquivos(self.serializar_memoria(caminho))
+
+    def serializar_memoria(self, caminho: str) -> Dict[Path, bytes]:
+        """
+        Serializa a memória do agente em bytes, sem gravar nada em disco.
+
+        É a primeira metade de salvar_memoria(): o resultado é uma "fotografia"
+        da tabela Q e dos metadados naquele instante. O Treinador usa esta
+        separação para gravar os checkpoints em segundo plano enquanto o
+        treinamento continua alterando a tabela.
+
+        Args:
+            caminho: Caminho do arquivo da tabela Q (define o formato e o
+                nome do arquivo JSON de metadados).
+
+        Returns:
+            Dicionário {caminho: conteúdo} com a tabela Q e os metadados,
+            pronto para gravar_arquivos().
+        """
         caminho_arquivo = Path(caminho)
-        caminho_arquivo.parent.mkdir(parents=True, exist_ok=True)
-        with open(caminho_arquivo, 'wb') as arquivo:
-            pickle.dump(self.tabela_q, arquivo)
+        # Metadados ficam em um arquivo separado, legível e barato de escrever
+        metadados = json.dumps(self._obter_metadados(), ensure_ascii=False, indent=2)
+        return {
+            caminho_arquivo: self._serializar_tabela(caminho_arquivo),
+            caminho_arquivo.with_suffix('.json'): metadados.encode('utf-8'),
+        }
+
+    def _serializar_tabela(self, caminho_arquivo: Path) -> bytes:
+        """
+        Serializa a tabela Q para o arquivo informado (pickle do dicionário).
+
+        Args:
+            caminho_arquivo: Caminho do arquivo de destino.
+
+        Returns:
+            Conteúdo do arquivo da tabela Q.
+
+        Note:
+            Este é um método privado (prefixo _) usado por serializar_memoria().
+            Subclasses com outra forma de armazenamento podem sobrescrevê-lo.
+        """
+        # O protocolo mais recente do pickle é o mais rápido e compacto
+        return pickle.dumps(self.tabela_q, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _carregar_tabela(self, caminho_arquivo: Path):
+        """
+        Lê a tabela Q de um arquivo gravado a partir de _serializar_tabela().
+
+        Args:
+            caminho_arquivo: Caminho do arquivo de origem.
+
+        Note:
+            Este é um método privado (prefixo _) usado por carregar().
+        """
+        with open(caminho_arquivo, 'rb') as arquivo:
+            self.tabela_q = pickle.load(arquivo)
+
+    def _obter_metadados(self) -> Dict[str, float]:
+        """
+        Retorna os metadados de treinamento que acompanham a tabela Q salva.
+
+        Returns:
+            Dicionário com o epsilon atual e os contadores de estatísticas.
+
+        Note:
+            Este é um método privado (prefixo _) usado internamente pelos
+            métodos salvar_memoria() e carregar().
+        """
+        return {
+            'epsilon': self.epsilon,
+            'partidas_treinadas': self.partidas_treinadas,
+            'vitorias': self.vitorias,
+            'derrotas': self.derrotas,
+            'empates': self.empates,
+        }
 
     @classmethod
     def carregar(cls, caminho: str, **kwargs) -> 'AgenteQLearning':
@@ -458,6 +554,10 @@ class AgenteQLearning:
             Se o arquivo não existir, o agente começará do zero, mas manterá
             os parâmetros especificados em **kwargs.
 
+            Se existir o arquivo de metadados (.json) ao lado da tabela Q, o
+            epsilon e as estatísticas também são restaurados. Um epsilon passado
+            explicitamente em **kwargs sempre tem prioridade sobre o salvo.
+
         Example:
             >>> # Carregar agente com parâmetros padrão
             >>> agente = AgenteQLearning.carregar("modelos/agente_x.pkl")
@@ -472,14 +572,40 @@ class AgenteQLearning:
         agente = cls(**kwargs)
         caminho_arquivo = Path(caminho)
         if caminho_arquivo.exists():
-            with open(caminho_arquivo, 'rb') as arquivo:
-                agente.tabela_q = pickle.load(arquivo)
+            agente._carregar_tabela(caminho_arquivo)
+
+            # Restaura os metadados do treinamento, se foram salvos junto
+            caminho_metadados = caminho_arquivo.with_suffix('.json')
+            if caminho_metadados.exists():
+                with open(caminho_metadados, 'r', encoding='utf-8') as arquivo:
+                    metadados = json.load(arquivo)
+                if 'epsilon' not in kwargs:
+                    agente.epsilon = metadados.get('epsilon', agente.epsilon)
+                agente.partidas_treinadas = metadados.get('partidas_treinadas', 0)
+                agente.vitorias = metadados.get('vitorias', 0)
+                agente.derrotas = metadados.get('derrotas', 0)
+                agente.empates = metadados.get('empates', 0)
+
             print(f"✅ Memória do Agente ({agente.simbolo}) carregada de: {caminho_arquivo}")
         else:
             print(f"⚠️  Aviso: Nenhum arquivo de memória encontrado em {caminho}. "
                   f"O Agente ({agente.simbolo}) começará do zero.")
         return agente
 
+    def contar_estados_conhecidos(self) -> int:
+        """
+        Retorna quantos estados diferentes o agente já conhece.
+
+        Returns:
+            Número de estados presentes na tabela Q.
+
+        Note:
+            Use este método em vez de len(agente.tabela_q) para exibir
+            estatísticas: subclasses com tabela Q densa respondem sem precisar
+            montar o dicionário completo.
+        """
+        return len(self.tabela_q)
+
     def imprimir_estatisticas(self):
         """
         Imprime as estatísticas de treinamento do agente de forma formatada.
@@ -512,7 +638,7 @@ class AgenteQLearning:
         print(f"📊 ESTATÍSTICAS DO AGENTE ({self.simbolo})")
         print(f"{'='*50}")
         print(f"Partidas treinadas:   {self.partidas_treinadas:,}")
-        print(f"Estados conhecidos:   {len(self.tabela_q):,}")
+        print(f"Estados conhecidos:   {self.contar_estados_conhecidos():,}")
         print(f"Curiosidade (Epsilon):{self.epsilon:.4f}")
         print(f"\n--- Desempenho ---")
         print(f"Vitórias:   {self.vitorias:>6} ({taxa_vitoria*100:>5.1f}%)")
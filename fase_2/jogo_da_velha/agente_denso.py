@@ -0,0 +1,199 @@
+"""
+Módulo: 🧠 agente_denso.py
+Projeto: 📘 AI Game Learning
+
+Este módulo implementa o AgenteQLearningDenso: o mesmo agente Q-Learning do
+módulo agente.py, mas com a Tabela Q guardada em uma matriz NumPy densa em
+vez de um dicionário de dicionários. Vale apenas para o tabuleiro 3x3.
+
+Por que uma matriz? O 3x3 tem no máximo 3**9 = 19.683 tabuleiros e 9 ações.
+A tabela inteira ocupa 19.683 × 9 × 4 bytes ≈ 700 KB (float32), menos do que
+a sobrecarga de milhares de dicionários, e cada consulta vira um acesso por
+índice: valores[codigo_do_estado, acao]. Veja tabela_q_densa.py para a
+codificação dos estados.
+
+O agente denso é compatível com todo o resto do projeto:
+- O atributo tabela_q continua existindo (como propriedade) e devolve a
+  tabela no formato de dicionário, para mesclagem, jogo e modelos finais.
+- Os checkpoints são gravados com np.savez (.npz), muito mais rápido que
+  serializar o dicionário com pickle.
+- O kernel de treino (kernels.py) treina diretamente sobre as matrizes do
+  agente, sem nenhuma conversão.
+
+Na escolha de ações e no aprendizado Monte Carlo, o agente aceita tanto a
+tupla do tabuleiro quanto o código do estado em base 3 (um int). O Treinador usa o código, que o
+ambiente já mantém atualizado (codigo_estado): assim os históricos de jogadas
+guardam ints em vez de tuplas e nenhum estado precisa ser recodificado.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+import io
+import random
+
+import numpy as np
+
+from .agente import AgenteQLearning
+from .tabela_q_densa import codificar_estado, matriz_para_tabela, tabela_para_matriz
+
+
+# Estado aceito pelo agente denso: tupla do tabuleiro ou seu código em base 3
+Estado = Union[Tuple, int]
+
+
+def _codigo(estado: Estado) -> int:
+    """Devolve o código em base 3 do estado (que pode já ser o código)."""
+    return estado if isinstance(estado, int) else codificar_estado(estado)
+
+
+class AgenteQLearningDenso(AgenteQLearning):
+    """
+    Agente Q-Learning do 3x3 com Tabela Q em matriz densa (float32).
+
+    Possui a mesma interface do AgenteQLearning (escolher_acao, aprendizado
+    Monte Carlo, salvar/carregar, estatísticas), mudando apenas onde os
+    valores Q ficam guardados.
+
+    Attributes:
+        valores (np.ndarray): Matriz float32 (19683, 9) com os valores Q,
+            indexada por [codigo_do_estado, acao].
+        conhecidos (np.ndarray): Array bool (19683,) que marca os estados já
+            visitados pelo agente (equivale às chaves da tabela em dicionário).
+        tabela_q (Dict[Tuple, Dict[int, float]]): Propriedade que monta (e
+            recebe) a tabela no formato de dicionário. Cada leitura gera uma
+            cópia nova: alterações no dicionário devolvido não afetam o agente.
+
+    Example:
+        >>> agente = AgenteQLearningDenso(jogador=1)
+        >>> estado = (0, 0, 0, 0, 0, 0, 0, 0, 0)
+        >>> acao = agente.escolher_acao(estado, list(range(9)))
+    """
+
+    # Checkpoints do agente denso são gravados como matrizes NumPy
+    EXTENSAO_MEMORIA = ".npz"
+
+    @property
+    def tabela_q(self) -> Dict[Tuple, Dict[int, float]]:
+        """Tabela Q no formato de dicionário {estado: {acao: valor_q}}."""
+        return matriz_para_tabela(self.valores, self.conhecidos)
+
+    @tabela_q.setter
+    def tabela_q(self, tabela_q: Dict[Tuple, Dict[int, float]]):
+        self.valores, self.conhecidos = tabela_para_matriz(tabela_q)
+
+    def obter_valor_q(self, estado: Estado, acao: int) -> float:
+        """
+        Obtém o valor Q de uma ação em um estado, marcando o estado como conhecido.
+
+        Args:
+            estado: Tupla do tabuleiro ou código do estado em base 3.
+            acao: Índice da ação (posição no tabuleiro de 0 a 8).
+
+        Returns:
+            Valor Q da ação no estado (0.0 se ainda não foi aprendido).
+        """
+        codigo = _codigo(estado)
+        self.conhecidos[codigo] = True
+        return float(self.valores[codigo, acao])
+
+    def atualizar_valor_q(self, estado: Estado, acao: int, recompensa: float, proximo_estado: Estado, finalizado: bool):
+        """
+        Atualiza o valor Q com a mesma fórmula do AgenteQLearning.
+
+        É o método chamado por processar_aprendizado_monte_carlo() para cada
+        jogada do histórico, que pode guardar tuplas ou códigos de estado.
+
+        Args:
+            estado: Estado do tabuleiro antes da ação ser executada.
+            acao: Ação que foi tomada no estado.
+            recompensa: Recompensa imediata recebida após executar a ação.
+            proximo_estado: Estado do tabuleiro após a ação ser executada.
+            finalizado: Se True, não há valor futuro a considerar.
+        """
+        codigo = _codigo(estado)
+        self.conhecidos[codigo] = True
+        opiniao_antiga = float(self.valores[codigo, acao])
+
+        melhor_valor_futuro = 0.0 if finalizado else self._obter_melhor_valor_q_futuro(proximo_estado)
+        valor_real_da_jogada = recompensa + self.gamma * melhor_valor_futuro
+
+        self.valores[codigo, acao] = opiniao_antiga + self.alpha * (valor_real_da_jogada - opiniao_antiga)
+
+    def _obter_melhor_valor_q_futuro(self, estado: Tuple) -> float:
+        """
+        Obtém o maior valor Q entre as casas livres de um estado futuro.
+
+        Args:
+            estado: Tupla representando o estado futuro do tabuleiro.
+
+        Returns:
+            O maior valor Q das casas livres, ou 0.0 se o estado é desconhecido
+            ou não tem casas livres.
+        """
+        codigo = codificar_estado(estado)
+        casas_livres = [casa for casa, valor in enumerate(estado) if valor == 0]
+        if not self.conhecidos[codigo] or not casas_livres:
+            return 0.0
+        return float(self.valores[codigo, casas_livres].max())
+
+    def _escolher_melhor_acao(self, estado: Estado, acoes_validas: List[int]) -> int:
+        """
+        Escolhe a ação de maior valor Q lendo uma única linha da matriz.
+
+        Args:
+            estado: Tupla do tabuleiro ou código do estado em base 3.
+            acoes_validas: Lista de índices de ações válidas.
+
+        Returns:
+            Índice da ação com o maior valor Q (desempate aleatório).
+        """
+        codigo = _codigo(estado)
+        self.conhecidos[codigo] = True
+        linha = self.valores[codigo].tolist()
+
+        valor_maximo_q = max(linha[acao] for acao in acoes_validas)
+        melhores_acoes = [acao for acao in acoes_validas if linha[acao] == valor_maximo_q]
+        return random.choice(melhores_acoes)
+
+    def _serializar_tabela(self, caminho_arquivo: Path) -> bytes:
+        """
+        Serializa a tabela: matrizes NumPy (.npz) ou dicionário em pickle (.pkl).
+
+        Arquivos .npz são a forma rápida, usada nos checkpoints. Qualquer
+        outra extensão grava o dicionário, compatível com jogar.py e
+        mesclar_modelos.py.
+
+        Args:
+            caminho_arquivo: Caminho do arquivo de destino.
+
+        Returns:
+            Conteúdo do arquivo da tabela Q.
+        """
+        if caminho_arquivo.suffix == ".npz":
+            buffer = io.BytesIO()
+            np.savez(buffer, valores=self.valores, conhecidos=self.conhecidos)
+            return buffer.getvalue()
+        return super()._serializar_tabela(caminho_arquivo)
+
+    def _carregar_tabela(self, caminho_arquivo: Path):
+        """
+        Lê a tabela gravada a partir de _serializar_tabela() (.npz ou pickle).
+
+        Args:
+            caminho_arquivo: Caminho do arquivo de origem.
+        """
+        if caminho_arquivo.suffix == ".npz":
+            with np.load(caminho_arquivo) as dados:
+                self.valores = dados['valores'].astype(np.float32)
+                self.conhecidos = dados['conhecidos'].astype(bool)
+        else:
+            super()._carregar_tabela(caminho_arquivo)
+
+    def contar_estados_conhecidos(self) -> int:
+        """
+        Retorna quantos estados o agente já conhece, sem montar o dicionário.
+
+        Returns:
+            Número de estados marcados em `conhecidos`.
+        """
+        return int(np.count_nonzero(self.conhecidos))
@@ -20,11 +20,55 @@ aleatoriamente a cada partida para aumentar a diversidade do treinamento.
 
 💡 Implementado com NumPy para eficiência computacional, mas mantendo a lógica
    clara e didática, facilitando a compreensão do funcionamento.
+
+💡 As variáveis do caminho quente (executar_jogada, obter_acoes_validas) têm
+   anotações de tipo e as tabelas do módulo são Final. Isso permite, se
+   desejado, compilar este módulo para C com o mypyc (pip install mypy):
+       mypyc fase_2/jogo_da_velha/ambiente.py
+   O código Python continua sendo a implementação de referência.
 """
 
 import random
 import numpy as np
-from typing import List, Tuple, Optional
+from typing import Final, List, Tuple, Optional
+
+
+def _gerar_tabela_vitoria(mascaras_de_vitoria: List[int], numero_de_casas: int) -> List[bool]:
+    """
+    Pré-calcula, para toda máscara de bits possível, se ela contém uma vitória.
+
+    Cada jogador é representado por uma máscara de bits (bit i ligado = o
+    jogador ocupa a casa i). Para o 3x3 existem apenas 2**9 = 512 máscaras,
+    então vale a pena responder "esta máscara venceu?" uma única vez e depois
+    apenas consultar a tabela durante o jogo.
+
+    Args:
+        mascaras_de_vitoria: Máscaras de bits das combinações vencedoras.
+        numero_de_casas: Total de casas do tabuleiro (define 2**n máscaras).
+
+    Returns:
+        Lista onde o índice é a máscara do jogador e o valor indica vitória.
+    """
+    return [
+        any(mascara & linha == linha for linha in mascaras_de_vitoria)
+        for mascara in range(1 << numero_de_casas)
+    ]
+
+
+# Tabela de vitória do tabuleiro tradicional (3x3), calculada ao importar o módulo
+_MASCARAS_DE_VITORIA_3X3: Final[List[int]] = [
+    0b000000111, 0b000111000, 0b111000000,  # linhas
+    0b001001001, 0b010010010, 0b100100100,  # colunas
+    0b100010001, 0b001010100,               # diagonais
+]
+TABELA_VITORIA_3X3: Final[List[bool]] = _gerar_tabela_vitoria(_MASCARAS_DE_VITORIA_3X3, 9)
+
+# Casas livres de cada máscara de casas livres do 3x3 (bit i ligado = casa i vazia):
+# obter_acoes_validas() vira uma consulta em vez de uma varredura do tabuleiro
+_ACOES_POR_MASCARA_3X3: Final[List[Tuple[int, ...]]] = [
+    tuple(casa for casa in range(9) if mascara >> casa & 1)
+    for mascara in range(1 << 9)
+]
 
 
 class AmbienteJogoDaVelha:
@@ -55,7 +99,9 @@ class AmbienteJogoDaVelha:
     Attributes:
         dimensao (int): Tamanho do tabuleiro (ex: 3 para 3x3, 4 para 4x4).
         numero_de_casas (int): Total de casas no tabuleiro (dimensão²).
-        tabuleiro (np.ndarray): Array NumPy representando o estado atual do tabuleiro.
+        tabuleiro (np.ndarray): Array NumPy (int8) representando o estado atual do tabuleiro.
+        codigo_estado (int): Estado atual codificado como número na base 3
+            (casa i contribui com valor * 3**i), mantido a cada jogada.
         jogador_atual (int): Jogador que deve jogar agora (1 para 'X', 2 para 'O').
         partida_finalizada (bool): Indica se a partida terminou.
         vencedor (Optional[int]): Vencedor da partida (1, 2, 0 para empate, None se não terminou).
@@ -101,6 +147,37 @@ class AmbienteJogoDaVelha:
         # Isso é feito uma vez na inicialização para eficiência
         self.combinacoes_de_vitoria: List[List[int]] = self._gerar_combinacoes_de_vitoria()
 
+        # Tabuleiro alocado uma única vez: cada nova partida apenas o zera no
+        # lugar, evitando criar milhões de arrays durante o treinamento
+        self.tabuleiro: np.ndarray = np.zeros(self.numero_de_casas, dtype=np.int8)
+
+        # Potências de 3 usadas para manter o código do estado incrementalmente
+        # (cada casa é um "dígito" na base 3: 0 vazio, 1 'X', 2 'O')
+        self._potencias_de_tres: List[int] = [3 ** casa for casa in range(self.numero_de_casas)]
+        self.codigo_estado: int = 0
+
+        # Representação em bits das combinações de vitória. Para cada casa,
+        # guardamos só as combinações que passam por ela: após uma jogada basta
+        # testar essas (no 3x3 a tabela pré-calculada responde direto)
+        self._mascaras_de_vitoria: List[int] = [
+            sum(1 << posicao for posicao in combinacao)
+            for combinacao in self.combinacoes_de_vitoria
+        ]
+        self._vitorias_por_casa: List[List[int]] = [
+            [mascara for mascara in self._mascaras_de_vitoria if mascara >> casa & 1]
+            for casa in range(self.numero_de_casas)
+        ]
+        self._tabela_vitoria: Optional[List[bool]] = (
+            TABELA_VITORIA_3X3 if dimensao == 3 else None
+        )
+
+        # Máscara com todas as casas livres (tabuleiro vazio) e, no 3x3, a
+        # tabela que traduz uma máscara de casas livres na lista de ações
+        self._mascara_tabuleiro_vazio: int = (1 << self.numero_de_casas) - 1
+        self._acoes_por_mascara: Optional[List[Tuple[int, ...]]] = (
+            _ACOES_POR_MASCARA_3X3 if dimensao == 3 else None
+        )
+
         # Inicializa o ambiente para uma nova partida
         self.reiniciar_partida()
 
@@ -180,9 +257,23 @@ class AmbienteJogoDaVelha:
         Note:
             Este método deve ser chamado no início de cada nova partida.
             Ele não afeta as combinações de vitória (que são fixas).
+
+            O array do tabuleiro é reaproveitado entre partidas (zerado com
+            fill), então referências a `ambiente.tabuleiro` guardadas por fora
+            refletem sempre a partida atual. Use obter_estado() para uma cópia.
         """
-        # Cria um novo tabuleiro vazio (todas as posições = 0)
-        self.tabuleiro: np.ndarray = np.zeros(self.numero_de_casas, dtype=int)
+        # Esvazia o tabuleiro no lugar (todas as posições = 0), sem nova alocação
+        self.tabuleiro.fill(0)
+        self.codigo_estado = 0
+
+        # Máscaras de bits das peças de cada jogador (índice 1='X', 2='O')
+        # e contador de jogadas, usado para detectar o empate sem varrer o tabuleiro
+        self._mascaras_jogadores: List[int] = [0, 0, 0]
+        self._jogadas_realizadas: int = 0
+
+        # Máscara de bits das casas livres (bit i ligado = casa i vazia),
+        # atualizada a cada jogada para obter_acoes_validas()
+        self.casas_livres: int = self._mascara_tabuleiro_vazio
         
         # Escolhe aleatoriamente qual jogador começa (1='X' ou 2='O')
         # Isso aumenta a diversidade do treinamento
@@ -228,10 +319,16 @@ class AmbienteJogoDaVelha:
             >>> ambiente.reiniciar_partida()
             >>> acoes = ambiente.obter_acoes_validas()
             >>> # Retorna [0, 1, 2, 3, 4, 5, 6, 7, 8] para um tabuleiro vazio 3x3
+
+        Note:
+            O tabuleiro não é varrido: as casas vazias vêm da máscara de bits
+            casas_livres, mantida por executar_jogada(). No 3x3 a lista é
+            lida de uma tabela pré-calculada com as 512 máscaras possíveis.
         """
-        # Encontra todos os índices onde o valor é 0 (casa vazia)
-        indices_vazios = np.where(self.tabuleiro == 0)[0]
-        return indices_vazios.tolist()
+        casas_livres: int = self.casas_livres
+        if self._acoes_por_mascara is not None:
+            return list(self._acoes_por_mascara[casas_livres])
+        return [casa for casa in range(self.numero_de_casas) if casas_livres >> casa & 1]
     
     def obter_estado_como_tupla(self) -> Tuple:
         """
@@ -249,8 +346,12 @@ class AmbienteJogoDaVelha:
             Este método é usado principalmente pelo agente para indexar
             sua Tabela Q. A imutabilidade da tupla garante que o estado
             não mude acidentalmente.
+
+            Usamos tolist() para que a tupla contenha inteiros nativos do Python
+            e não escalares do NumPy. Isso deixa o hash das chaves mais barato e
+            torna o salvamento da Tabela Q (pickle) muito mais rápido e compacto.
         """
-        return tuple(self.tabuleiro)
+        return tuple(self.tabuleiro.tolist())
 
     def executar_jogada(self, acao: int) -> Tuple[np.ndarray, float, bool]:
         """
@@ -305,18 +406,31 @@ class AmbienteJogoDaVelha:
             )
 
         # Executa a jogada: marca a posição com o símbolo do jogador atual
-        self.tabuleiro[acao] = self.jogador_atual
+        jogador: int = self.jogador_atual
+        self.tabuleiro[acao] = jogador
+        self.codigo_estado += jogador * self._potencias_de_tres[acao]
+        mascara: int = self._mascaras_jogadores[jogador] | (1 << acao)
+        self._mascaras_jogadores[jogador] = mascara
+        self.casas_livres &= ~(1 << acao)
+        self._jogadas_realizadas += 1
         
         # Inicializa a recompensa como 0.0 (padrão: partida continua ou empate)
-        recompensa = 0.0
+        recompensa: float = 0.0
 
-        # Verifica se o jogador atual venceu após esta jogada
-        if self._verificar_vitoria(self.jogador_atual):
+        # Verifica se o jogador atual venceu após esta jogada.
+        # Só as combinações que passam pela casa jogada podem ter sido completadas
+        venceu: bool
+        if self._tabela_vitoria is not None:
+            venceu = self._tabela_vitoria[mascara]
+        else:
+            venceu = any(mascara & linha == linha for linha in self._vitorias_por_casa[acao])
+
+        if venceu:
             self.partida_finalizada = True
-            self.vencedor = self.jogador_atual
+            self.vencedor = jogador
             recompensa = 1.0  # Recompensa positiva para o vencedor
         # Verifica se o tabuleiro está cheio (empate)
-        elif len(self.obter_acoes_validas()) == 0:
+        elif self._jogadas_realizadas == self.numero_de_casas:
             self.partida_finalizada = True
             self.vencedor = 0  # 0 representa empate
             # Recompensa permanece 0.0 para empate
@@ -326,31 +440,6 @@ class AmbienteJogoDaVelha:
         
         return self.obter_estado(), recompensa, self.partida_finalizada
 
-    def _verificar_vitoria(self, jogador: int) -> bool:
-        """
-        Verifica se um jogador específico venceu a partida.
-
-        Verifica todas as combinações de vitória possíveis para determinar
-        se o jogador especificado completou alguma linha, coluna ou diagonal.
-
-        Args:
-            jogador: Identificador do jogador a verificar (1 para 'X', 2 para 'O').
-
-        Returns:
-            True se o jogador venceu (completou uma combinação vencedora),
-            False caso contrário.
-
-        Note:
-            Este é um método privado (prefixo _) usado internamente pelo
-            método executar_jogada() para verificar vitória após cada jogada.
-        """
-        # Verifica se alguma das combinações de vitória está completa
-        # Uma combinação está completa se todas as posições têm o mesmo jogador
-        for combinacao in self.combinacoes_de_vitoria:
-            if all(self.tabuleiro[posicao] == jogador for posicao in combinacao):
-                return True
-        return False
-
     def _alternar_jogador(self):
         """
         Alterna o jogador atual para o próximo turno.
@@ -0,0 +1,401 @@
+"""
+Módulo: 🎲 autojogo.py
+Projeto: 📘 AI Game Learning
+
+Este módulo reúne as rotinas que apenas *jogam* partidas de self-play, sem
+aprender com elas. Cada partida jogada é devolvida como um resultado contendo
+o vencedor e o histórico de jogadas (estado, ação) de cada agente.
+
+Separar "jogar" de "aprender" é o que permite distribuir a geração das
+partidas entre vários processos: cada processo recebe uma cópia congelada
+das tabelas Q e do epsilon dos agentes, joga um lote de partidas e devolve
+os históricos. O processo principal (o Treinador) aplica o aprendizado Monte
+Carlo de forma centralizada, na mesma ordem em que as partidas chegam.
+
+Há três formas de jogar um lote:
+- jogar_partidas(): uma partida de cada vez, usando o ambiente e os agentes.
+- jogar_partidas_vetorizadas(): várias partidas ao mesmo tempo, com todos os
+  tabuleiros em um único array NumPy (B, casas). Escolha de ações, máscaras de
+  casas livres e detecção de vitória são feitas em operações vetorizadas.
+- jogar_partidas_memoria_compartilhada(): como jogar_partidas(), mas lendo as
+  Tabelas Q densas (3x3) direto da memória compartilhada, sem cópias.
+
+💡 As funções deste módulo ficam no nível do módulo (e não dentro de classes)
+   porque o multiprocessing precisa conseguir serializá-las (pickle) para
+   enviá-las aos processos trabalhadores.
+"""
+
+import random
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .ambiente import AmbienteJogoDaVelha
+from .agente import AgenteQLearning
+from .agente_denso import AgenteQLearningDenso
+from .tabela_q_densa import NUMERO_DE_CASAS_3X3, NUMERO_DE_ESTADOS_3X3, POTENCIAS_DE_TRES
+
+
+# Histórico de um agente em uma partida: lista de (estado, ação). O estado é
+# a tupla do tabuleiro ou, com Tabelas Q densas (3x3), o código em base 3 (int)
+Historico = List[Tuple[Union[Tuple, int], int]]
+
+# Resultado de uma partida: (vencedor, histórico do agente X, histórico do agente O)
+ResultadoPartida = Tuple[int, Historico, Historico]
+
+# Tabela Q aceita pela versão vetorizada: dicionário {estado: {acao: valor}}
+# ou, no 3x3, a matriz densa (19683, 9) de um AgenteQLearningDenso
+TabelaQ = Union[Dict[Tuple, Dict[int, float]], np.ndarray]
+
+
+def jogar_partidas(
+    semente: int,
+    numero_de_partidas: int,
+    dimensao: int,
+    tabela_x: TabelaQ,
+    epsilon_x: float,
+    tabela_o: TabelaQ,
+    epsilon_o: float,
+    tamanho_lote: int = 1,
+) -> List[ResultadoPartida]:
+    """
+    Joga um lote de partidas de self-play sem aplicar aprendizado.
+
+    Esta função é executada dentro dos processos trabalhadores. Ela recria
+    o ambiente e os agentes a partir de uma "fotografia" (tabelas Q e epsilon)
+    e joga as partidas com a mesma estratégia Epsilon-Greedy do treinamento.
+
+    Args:
+        semente: Semente do gerador aleatório deste lote. Cada processo deve
+            receber uma semente diferente para que as partidas não se repitam.
+        numero_de_partidas: Quantidade de partidas a serem jogadas.
+        dimensao: Dimensão do tabuleiro (3 para 3x3, 4 para 4x4, ...).
+        tabela_x: Tabela Q do agente X no início do lote. A matriz densa
+            só é aceita com tamanho_lote > 1 (versão vetorizada).
+        epsilon_x: Epsilon do agente X no início do lote.
+        tabela_o: Tabela Q do agente O no início do lote, como tabela_x.
+        epsilon_o: Epsilon do agente O no início do lote.
+        tamanho_lote: Se maior que 1, as partidas são jogadas em grupos
+            simultâneos desse tamanho com jogar_partidas_vetorizadas().
+            Padrão: 1 (uma partida de cada vez).
+
+    Returns:
+        Lista com um ResultadoPartida (vencedor, histórico X, histórico O)
+        para cada partida jogada, na ordem em que foram jogadas.
+
+    Note:
+        As tabelas e o epsilon ficam congelados durante todo o lote: o
+        aprendizado (e o decaimento do epsilon) só acontece no processo
+        principal, quando os resultados são processados.
+    """
+    if tamanho_lote > 1:
+        gerador = np.random.default_rng(semente)
+        resultados: List[ResultadoPartida] = []
+        for inicio in range(0, numero_de_partidas, tamanho_lote):
+            resultados.extend(jogar_partidas_vetorizadas(
+                min(tamanho_lote, numero_de_partidas - inicio), dimensao,
+                tabela_x, epsilon_x, tabela_o, epsilon_o, gerador,
+            ))
+        return resultados
+
+    random.seed(semente)
+
+    agente_x = AgenteQLearning(epsilon=epsilon_x, jogador=1)
+    agente_o = AgenteQLearning(epsilon=epsilon_o, jogador=2)
+    agente_x.tabela_q = tabela_x
+    agente_o.tabela_q = tabela_o
+
+    return _jogar_com_agentes(numero_de_partidas, AmbienteJogoDaVelha(dimensao=dimensao), agente_x, agente_o)
+
+
+def jogar_partidas_memoria_compartilhada(
+    semente: int,
+    numero_de_partidas: int,
+    nome_memoria_x: str,
+    epsilon_x: float,
+    nome_memoria_o: str,
+    epsilon_o: float,
+) -> List[ResultadoPartida]:
+    """
+    Joga um lote de partidas 3x3 lendo as Tabelas Q densas da memória compartilhada.
+
+    Em vez de receber uma cópia das tabelas (serializada com pickle a cada
+    bloco), o trabalhador recebe apenas o *nome* de dois blocos de memória
+    compartilhada (multiprocessing.shared_memory) onde estão as matrizes
+    (19683, 9) dos agentes. Todos os processos enxergam a mesma memória.
+
+    O trabalhador apenas lê as tabelas; quem escreve nelas é o processo
+    principal, ao aplicar o aprendizado. Não há trava: uma leitura pode ver
+    uma tabela "no meio" de uma atualização, o que para o Epsilon-Greedy é
+    equivalente a usar uma tabela levemente desatualizada.
+
+    Args:
+        semente: Semente do gerador aleatório deste lote.
+        numero_de_partidas: Quantidade de partidas a serem jogadas.
+        nome_memoria_x: Nome do bloco de memória com a tabela do agente X.
+        epsilon_x: Epsilon do agente X no início do lote.
+        nome_memoria_o: Nome do bloco de memória com a tabela do agente O.
+        epsilon_o: Epsilon do agente O no início do lote.
+
+    Returns:
+        Lista com um ResultadoPartida (vencedor, histórico X, histórico O)
+        para cada partida jogada, como em jogar_partidas(), com os estados
+        dos históricos como códigos em base 3 (ints, baratos de serializar).
+    """
+    random.seed(semente)
+
+    memoria_x = SharedMemory(name=nome_memoria_x)
+    memoria_o = SharedMemory(name=nome_memoria_o)
+    try:
+        agente_x = AgenteQLearningDenso(epsilon=epsilon_x, jogador=1)
+        agente_o = AgenteQLearningDenso(epsilon=epsilon_o, jogador=2)
+        agente_x.valores = matriz_em_memoria(memoria_x)
+        agente_o.valores = matriz_em_memoria(memoria_o)
+
+        resultados = _jogar_com_agentes(
+            numero_de_partidas, AmbienteJogoDaVelha(dimensao=3), agente_x, agente_o, usar_codigos=True
+        )
+
+        # As matrizes apontam para a memória compartilhada: solta as referências antes de fechar
+        del agente_x.valores, agente_o.valores
+        return resultados
+    finally:
+        memoria_x.close()
+        memoria_o.close()
+
+
+def matriz_em_memoria(memoria: SharedMemory) -> np.ndarray:
+    """
+    Enxerga um bloco de memória compartilhada como uma Tabela Q densa.
+
+    Args:
+        memoria: Bloco com pelo menos 19683 × 9 × 4 bytes.
+
+    Returns:
+        Array float32 (19683, 9) que usa a memória do bloco (sem cópia).
+    """
+    return np.ndarray((NUMERO_DE_ESTADOS_3X3, NUMERO_DE_CASAS_3X3), dtype=np.float32, buffer=memoria.buf)
+
+
+def _jogar_com_agentes(
+    numero_de_partidas: int,
+    ambiente: AmbienteJogoDaVelha,
+    agente_x: AgenteQLearning,
+    agente_o: AgenteQLearning,
+    usar_codigos: bool = False,
+) -> List[ResultadoPartida]:
+    """
+    Joga partidas uma a uma com os agentes informados, sem aprender.
+
+    Args:
+        numero_de_partidas: Quantidade de partidas a serem jogadas.
+        ambiente: Ambiente onde as partidas acontecem.
+        agente_x: Agente que joga como 'X'.
+        agente_o: Agente que joga como 'O'.
+        usar_codigos: Se True, os estados são os códigos em base 3 do
+            ambiente (apenas para agentes densos). Padrão: False (tuplas).
+
+    Returns:
+        Lista com um ResultadoPartida para cada partida jogada.
+    """
+    obter_estado = ambiente.obter_estado_como_tupla
+    obter_acoes = ambiente.obter_acoes_validas
+    jogar = ambiente.executar_jogada
+
+    resultados: List[ResultadoPartida] = []
+    for _ in range(numero_de_partidas):
+        ambiente.reiniciar_partida()
+        historicos: Dict[int, Historico] = {1: [], 2: []}
+
+        while not ambiente.partida_finalizada:
+            jogador = ambiente.jogador_atual
+            agente_atual = agente_x if jogador == 1 else agente_o
+
+            estado_atual = ambiente.codigo_estado if usar_codigos else obter_estado()
+            acao_escolhida = agente_atual.escolher_acao(estado_atual, obter_acoes(), em_treinamento=True)
+            historicos[jogador].append((estado_atual, acao_escolhida))
+            jogar(acao_escolhida)
+
+        resultados.append((ambiente.vencedor, historicos[1], historicos[2]))
+
+    return resultados
+
+
+def escolher_acoes_em_lote(
+    valores_q: np.ndarray,
+    casas_livres: np.ndarray,
+    epsilons: np.ndarray,
+    gerador: np.random.Generator,
+) -> np.ndarray:
+    """
+    Epsilon-Greedy para vários tabuleiros de uma vez.
+
+    Equivale a chamar AgenteQLearning.escolher_acao() uma vez por linha, mas
+    com poucas chamadas NumPy no lote inteiro em vez de várias chamadas ao
+    módulo random por tabuleiro.
+
+    Args:
+        valores_q: Matriz (B, casas) com os valores Q de cada tabuleiro.
+        casas_livres: Matriz bool (B, casas) com as casas vazias.
+        epsilons: Array (B,) com o epsilon de quem joga em cada tabuleiro.
+        gerador: Gerador aleatório do NumPy.
+
+    Returns:
+        Array (B,) com a ação escolhida para cada tabuleiro.
+    """
+    valores_q = np.where(casas_livres, valores_q, -np.inf)
+
+    # Ação gulosa: entre as casas com o maior Q, sorteia uma (desempate aleatório)
+    melhores = valores_q == valores_q.max(axis=1, keepdims=True)
+    acoes_gulosas = np.argmax(melhores * gerador.random(melhores.shape), axis=1)
+
+    # Ação aleatória: uma casa livre sorteada uniformemente
+    acoes_aleatorias = np.argmax(casas_livres * gerador.random(casas_livres.shape), axis=1)
+
+    # Sorteio do Epsilon-Greedy para todas as linhas de uma vez
+    explorar = gerador.random(len(epsilons)) < epsilons
+    return np.where(explorar, acoes_aleatorias, acoes_gulosas)
+
+
+def jogar_partidas_vetorizadas(
+    numero_de_partidas: int,
+    dimensao: int,
+    tabela_x: TabelaQ,
+    epsilon_x: float,
+    tabela_o: TabelaQ,
+    epsilon_o: float,
+    gerador: Optional[np.random.Generator] = None,
+) -> List[ResultadoPartida]:
+    """
+    Joga várias partidas simultaneamente, com os tabuleiros em um array NumPy.
+
+    Em vez de repetir o ciclo "estado → ação → jogada" uma partida por vez,
+    todas as partidas ainda em andamento avançam juntas a cada rodada:
+
+    1. As casas livres de todos os tabuleiros viram uma máscara (B, casas).
+    2. Os valores Q de cada tabuleiro são copiados para uma matriz (B, casas).
+    3. A ação gulosa (maior Q, com desempate aleatório), a ação aleatória e o
+       sorteio do Epsilon-Greedy são calculados para todas as linhas de uma vez
+       (escolher_acoes_em_lote).
+    4. As jogadas são aplicadas e a vitória é verificada em todos os
+       tabuleiros em uma única operação, com máscaras de bits (bitboards).
+
+    As regras são as mesmas do AmbienteJogoDaVelha: o jogador inicial é
+    sorteado, vence quem completar uma combinação e o tabuleiro cheio é empate.
+
+    Args:
+        numero_de_partidas: Quantidade de partidas simultâneas (B).
+        dimensao: Dimensão do tabuleiro (3 para 3x3, 4 para 4x4, ...).
+        tabela_x: Tabela Q do agente X (somente leitura): dicionário ou, no
+            3x3, a matriz densa de um AgenteQLearningDenso.
+        epsilon_x: Epsilon do agente X.
+        tabela_o: Tabela Q do agente O (somente leitura), como tabela_x.
+        epsilon_o: Epsilon do agente O.
+        gerador: Gerador aleatório do NumPy. Se None, um novo é criado.
+
+    Returns:
+        Lista com um ResultadoPartida (vencedor, histórico X, histórico O)
+        para cada partida, no mesmo formato de jogar_partidas(). Se as duas
+        tabelas forem matrizes densas, os estados dos históricos são os
+        códigos em base 3 (ints), como espera o AgenteQLearningDenso.
+
+    Note:
+        Com tabelas em dicionário, a consulta aos valores Q é feita linha a
+        linha, pois as chaves são tuplas. O ganho vem de tudo o que está ao
+        redor (máscaras, sorteios, argmax e verificação de vitória), que passa
+        a custar uma chamada NumPy por rodada em vez de uma por partida. Com
+        matrizes densas, até a consulta vira uma única indexação por código.
+    """
+    if gerador is None:
+        gerador = np.random.default_rng()
+
+    numero_de_casas = dimensao * dimensao
+    ambiente = AmbienteJogoDaVelha(dimensao=dimensao)
+
+    # Bitboards: as casas de cada jogador viram os bits de um uint64, e uma
+    # vitória é (mascara & linha) == linha para alguma das linhas de vitória.
+    # Tabuleiros com mais de 64 casas usam a comparação casa a casa.
+    usar_bitboards = numero_de_casas <= 64
+    if usar_bitboards:
+        linhas_de_vitoria = np.array(ambiente._mascaras_de_vitoria, dtype=np.uint64)
+        bits_das_casas = np.left_shift(np.uint64(1), np.arange(numero_de_casas, dtype=np.uint64))
+        mascaras_jogadores = np.zeros((3, numero_de_partidas), dtype=np.uint64)
+    else:
+        combinacoes = np.array(ambiente.combinacoes_de_vitoria, dtype=np.intp)
+    tabelas = (None, tabela_x, tabela_o)
+    epsilons = np.array([0.0, epsilon_x, epsilon_o])
+    alguma_densa = isinstance(tabela_x, np.ndarray) or isinstance(tabela_o, np.ndarray)
+    todas_densas = isinstance(tabela_x, np.ndarray) and isinstance(tabela_o, np.ndarray)
+
+    tabuleiros = np.zeros((numero_de_partidas, numero_de_casas), dtype=np.int8)
+    jogadores = gerador.integers(1, 3, size=numero_de_partidas).astype(np.int8)
+    ativas = np.ones(numero_de_partidas, dtype=bool)
+    vencedores = np.zeros(numero_de_partidas, dtype=np.int8)
+    historicos: List[Tuple[Historico, Historico, Historico]] = [
+        ([], [], []) for _ in range(numero_de_partidas)
+    ]
+
+    # Cada rodada coloca uma peça em todos os tabuleiros ativos
+    for _ in range(numero_de_casas):
+        indices = np.flatnonzero(ativas)
+        if indices.size == 0:
+            break
+
+        tabuleiros_ativos = tabuleiros[indices]
+        jogadores_ativos = jogadores[indices]
+        casas_livres = tabuleiros_ativos == 0
+
+        # Estados do histórico: códigos em base 3 (tabelas densas) ou tuplas
+        codigos = tabuleiros_ativos @ POTENCIAS_DE_TRES if alguma_densa else None
+        if todas_densas:
+            estados = codigos.tolist()
+        else:
+            estados = [tuple(linha) for linha in tabuleiros_ativos.tolist()]
+
+        # Copia os valores Q de cada estado para a matriz (B, casas)
+        valores_q = np.zeros(tabuleiros_ativos.shape)
+        for jogador in (1, 2):
+            tabela = tabelas[jogador]
+            if isinstance(tabela, np.ndarray):
+                # Matriz densa: uma indexação pelos códigos em base 3 das linhas do jogador
+                linhas = np.flatnonzero(jogadores_ativos == jogador)
+                valores_q[linhas] = tabela[codigos[linhas]]
+                continue
+            for linha in np.flatnonzero(jogadores_ativos == jogador).tolist():
+                acoes_conhecidas = tabela.get(estados[linha])
+                if acoes_conhecidas:
+                    for acao, valor in acoes_conhecidas.items():
+                        valores_q[linha, acao] = valor
+
+        acoes = escolher_acoes_em_lote(valores_q, casas_livres, epsilons[jogadores_ativos], gerador)
+
+        # Registra as jogadas no histórico de cada partida
+        for indice, jogador, estado, acao in zip(
+            indices.tolist(), jogadores_ativos.tolist(), estados, acoes.tolist()
+        ):
+            historicos[indice][jogador].append((estado, acao))
+
+        # Aplica as jogadas e verifica vitória/empate em todos os tabuleiros
+        tabuleiros[indices, acoes] = jogadores_ativos
+        tabuleiros_ativos = tabuleiros[indices]
+        if usar_bitboards:
+            mascaras_jogadores[jogadores_ativos, indices] |= bits_das_casas[acoes]
+            mascaras = mascaras_jogadores[jogadores_ativos, indices]
+            venceu = (
+                (mascaras[:, None] & linhas_de_vitoria) == linhas_de_vitoria
+            ).any(axis=1)
+        else:
+            venceu = (
+                tabuleiros_ativos[:, combinacoes] == jogadores_ativos[:, None, None]
+            ).all(axis=2).any(axis=1)
+        cheio = (tabuleiros_ativos != 0).all(axis=1)
+
+        vencedores[indices[venceu]] = jogadores_ativos[venceu]
+        ativas[indices[venceu | cheio]] = False
+        jogadores[indices] = 3 - jogadores_ativos
+
+    return [
+        (vencedor, historico[1], historico[2])
+        for vencedor, historico in zip(vencedores.tolist(), historicos)
+    ]
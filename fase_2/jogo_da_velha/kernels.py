@@ -0,0 +1,209 @@
+"""
+Módulo: 🚀 kernels.py
+Projeto: 📘 AI Game Learning
+
+Este módulo contém o "kernel" de treinamento do Jogo da Velha 3x3: uma função
+que joga e aprende partidas inteiras de self-play usando apenas inteiros,
+floats e arrays NumPy, sem objetos Python no caminho.
+
+Por que isso importa? No treinamento normal, cada jogada passa por vários
+métodos, dicionários e tuplas. Aqui o tabuleiro é representado por:
+- codigo: o estado em base 3 (índice da linha na Tabela Q densa)
+- mascaras de bits: as casas de cada jogador (bit i ligado = casa i ocupada)
+
+Com essa forma "enxuta", a função pode ser compilada para código nativo pelo
+Numba (biblioteca opcional). Se o Numba não estiver instalado, a mesma função
+roda como Python comum — mais lenta, mas com resultado equivalente.
+
+As Tabelas Q usadas aqui estão no formato denso de tabela_q_densa.py.
+
+Instalação opcional do Numba:
+    pip install numba
+"""
+
+import random
+
+import numpy as np
+
+from .ambiente import TABELA_VITORIA_3X3
+from .tabela_q_densa import NUMERO_DE_CASAS_3X3, POTENCIAS_DE_TRES
+
+# Tenta importar o Numba para compilar o kernel.
+# Se não estiver instalado, define NUMBA_DISPONIVEL como False e usa um
+# decorador que devolve a função sem alterações (Python puro).
+try:
+    from numba import njit
+    NUMBA_DISPONIVEL = True
+except ImportError:
+    NUMBA_DISPONIVEL = False
+
+    def njit(*args, **kwargs):
+        """Substituto do numba.njit quando o Numba não está instalado."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda funcao: funcao
+
+
+# Posições no array de parâmetros de cada agente
+ALPHA, GAMMA, EPSILON, EPSILON_MINIMO, TAXA_DECAIMENTO = 0, 1, 2, 3, 4
+
+# Versões em array das constantes, para uso dentro do kernel compilado
+TABELA_VITORIA = np.array(TABELA_VITORIA_3X3, dtype=np.bool_)
+POTENCIAS = POTENCIAS_DE_TRES.astype(np.int64)
+
+
+def parametros_do_agente(agente) -> np.ndarray:
+    """
+    Empacota os hiperparâmetros de um agente no array usado pelo kernel.
+
+    Args:
+        agente: AgenteQLearning de onde os parâmetros serão lidos.
+
+    Returns:
+        Array float64 [alpha, gamma, epsilon, epsilon_minimo, taxa_decaimento].
+        O kernel atualiza o epsilon (posição EPSILON) diretamente neste array.
+    """
+    return np.array([
+        agente.alpha,
+        agente.gamma,
+        agente.epsilon,
+        agente.epsilon_minimo,
+        agente.taxa_decaimento_epsilon,
+    ], dtype=np.float64)
+
+
+@njit(cache=True)
+def _escolher_acao(valores, codigo, livres, epsilon):
+    """
+    Epsilon-Greedy sobre a linha `codigo` da Tabela Q densa.
+
+    `livres` é a máscara de bits das casas vazias. O desempate entre ações
+    com o mesmo valor Q é aleatório (amostragem de reservatório), como no
+    AgenteQLearning.
+    """
+    if epsilon > 0.0 and random.random() < epsilon:
+        # Exploração: sorteia a k-ésima casa livre
+        quantidade = 0
+        for casa in range(NUMERO_DE_CASAS_3X3):
+            if livres >> casa & 1:
+                quantidade += 1
+        alvo = random.randrange(quantidade)
+        for casa in range(NUMERO_DE_CASAS_3X3):
+            if livres >> casa & 1:
+                if alvo == 0:
+                    return casa
+                alvo -= 1
+
+    # Aproveitamento: maior valor Q entre as casas livres
+    melhor_acao = -1
+    melhor_valor = 0.0
+    empates = 0
+    for casa in range(NUMERO_DE_CASAS_3X3):
+        if livres >> casa & 1:
+            valor = valores[codigo, casa]
+            if melhor_acao < 0 or valor > melhor_valor:
+                melhor_acao, melhor_valor, empates = casa, valor, 1
+            elif valor == melhor_valor:
+                empates += 1
+                if random.randrange(empates) == 0:
+                    melhor_acao = casa
+    return melhor_acao
+
+
+@njit(cache=True)
+def treinar_partidas_densas(
+    valores_x, conhecidos_x, parametros_x,
+    valores_o, conhecidos_o, parametros_o,
+    numero_de_partidas, tabela_vitoria, potencias,
+):
+    """
+    Joga e aprende `numero_de_partidas` partidas de self-play no 3x3.
+
+    Para cada partida:
+    1. Sorteia o jogador inicial e joga até a vitória ou o empate, com cada
+       agente escolhendo ações por Epsilon-Greedy na sua Tabela Q densa.
+    2. Aplica o aprendizado Monte Carlo em cada agente, percorrendo suas
+       jogadas de trás para frente: Q += alpha * (recompensa - Q), com a
+       recompensa descontada por gamma a cada passo.
+    3. Reduz o epsilon de cada agente (uma vez por partida).
+
+    Args:
+        valores_x, valores_o: Tabelas Q densas (19683, 9), atualizadas no lugar.
+        conhecidos_x, conhecidos_o: Estados visitados (19683,), atualizados no lugar.
+        parametros_x, parametros_o: Arrays de parametros_do_agente(); o epsilon
+            é atualizado no lugar.
+        numero_de_partidas: Quantidade de partidas a jogar.
+        tabela_vitoria: TABELA_VITORIA (512 entradas).
+        potencias: POTENCIAS (3**i para cada casa).
+
+    Returns:
+        Array int8 com o vencedor de cada partida (1, 2 ou 0 para empate).
+    """
+    vencedores = np.zeros(numero_de_partidas, dtype=np.int8)
+    historico_codigos = np.zeros(NUMERO_DE_CASAS_3X3, dtype=np.int64)
+    historico_acoes = np.zeros(NUMERO_DE_CASAS_3X3, dtype=np.int64)
+    historico_jogadores = np.zeros(NUMERO_DE_CASAS_3X3, dtype=np.int64)
+
+    for partida in range(numero_de_partidas):
+        codigo = 0
+        mascara_x = 0
+        mascara_o = 0
+        jogador = random.randrange(2) + 1
+        vencedor = 0
+        jogadas = 0
+
+        # --- Partida ---
+        while jogadas < NUMERO_DE_CASAS_3X3:
+            livres = 0b111111111 & ~(mascara_x | mascara_o)
+            if jogador == 1:
+                acao = _escolher_acao(valores_x, codigo, livres, parametros_x[EPSILON])
+            else:
+                acao = _escolher_acao(valores_o, codigo, livres, parametros_o[EPSILON])
+
+            historico_codigos[jogadas] = codigo
+            historico_acoes[jogadas] = acao
+            historico_jogadores[jogadas] = jogador
+            jogadas += 1
+
+            codigo += jogador * potencias[acao]
+            if jogador == 1:
+                mascara_x |= 1 << acao
+                venceu = tabela_vitoria[mascara_x]
+            else:
+                mascara_o |= 1 << acao
+                venceu = tabela_vitoria[mascara_o]
+
+            if venceu:
+                vencedor = jogador
+                break
+            jogador = 3 - jogador
+
+        vencedores[partida] = vencedor
+
+        # --- Aprendizado Monte Carlo (de trás para frente) ---
+        if vencedor == 1:
+            recompensa_x, recompensa_o = 1.0, -1.0
+        elif vencedor == 2:
+            recompensa_x, recompensa_o = -1.0, 1.0
+        else:
+            recompensa_x, recompensa_o = 0.0, 0.0
+
+        for indice in range(jogadas - 1, -1, -1):
+            estado = historico_codigos[indice]
+            acao = historico_acoes[indice]
+            if historico_jogadores[indice] == 1:
+                conhecidos_x[estado] = True
+                antigo = valores_x[estado, acao]
+                valores_x[estado, acao] = antigo + parametros_x[ALPHA] * (recompensa_x - antigo)
+                recompensa_x *= parametros_x[GAMMA]
+            else:
+                conhecidos_o[estado] = True
+                antigo = valores_o[estado, acao]
+                valores_o[estado, acao] = antigo + parametros_o[ALPHA] * (recompensa_o - antigo)
+                recompensa_o *= parametros_o[GAMMA]
+
+        # --- Decaimento do epsilon (uma vez por partida) ---
+        parametros_x[EPSILON] = max(parametros_x[EPSILON_MINIMO], parametros_x[EPSILON] * parametros_x[TAXA_DECAIMENTO])
+        parametros_o[EPSILON] = max(parametros_o[EPSILON_MINIMO], parametros_o[EPSILON] * parametros_o[TAXA_DECAIMENTO])
+
+    return vencedores
@@ -0,0 +1,110 @@
+"""
+Módulo: 🧮 tabela_q_densa.py
+Projeto: 📘 AI Game Learning
+
+Este módulo converte a Tabela Q do Jogo da Velha 3x3 entre duas representações:
+
+- Dicionário (a representação usada pelo AgenteQLearning):
+      {estado (tupla de 9 casas): {acao: valor_q}}
+- Matriz densa (usada pelos kernels compilados):
+      valores[codigo_do_estado, acao]  → array float32 com formato (19683, 9)
+      conhecidos[codigo_do_estado]     → array bool indicando estados já visitados
+
+Por que uma matriz? O 3x3 tem no máximo 3**9 = 19.683 tabuleiros possíveis
+e 9 ações, então a tabela inteira cabe em 19.683 × 9 × 4 bytes ≈ 700 KB.
+Cada estado vira um número (sua escrita na base 3) e consultar um valor Q
+passa a ser um simples acesso por índice, sem calcular hash de tuplas.
+
+Codificação do estado:
+    Cada casa é um "dígito" na base 3 (0 vazio, 1 'X', 2 'O') e a casa i
+    vale 3**i. Exemplo: X no centro (casa 4) → 1 × 3**4 = 81.
+    É a mesma codificação mantida pelo AmbienteJogoDaVelha em codigo_estado.
+"""
+
+from typing import Dict, Final, Tuple
+
+import numpy as np
+
+
+# Número de casas e de estados possíveis do tabuleiro 3x3
+NUMERO_DE_CASAS_3X3: Final = 9
+NUMERO_DE_ESTADOS_3X3: Final = 3 ** NUMERO_DE_CASAS_3X3
+
+# Valor de cada casa na codificação em base 3 (3**0, 3**1, ..., 3**8)
+POTENCIAS_DE_TRES: Final = 3 ** np.arange(NUMERO_DE_CASAS_3X3, dtype=np.int64)
+
+
+def codificar_estado(estado: Tuple[int, ...]) -> int:
+    """
+    Converte um tabuleiro 3x3 (tupla de 9 casas) no seu código em base 3.
+
+    Args:
+        estado: Tupla com 9 valores (0 vazio, 1 'X', 2 'O').
+
+    Returns:
+        Inteiro entre 0 e 19.682 que identifica o tabuleiro.
+
+    Example:
+        >>> codificar_estado((0, 0, 0, 0, 1, 0, 0, 0, 0))
+        81
+    """
+    codigo: int = 0
+    for casa, valor in enumerate(estado):
+        codigo += valor * 3 ** casa
+    return codigo
+
+
+def tabela_para_matriz(tabela_q: Dict[Tuple, Dict[int, float]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Converte uma Tabela Q em dicionário para a representação densa.
+
+    Args:
+        tabela_q: Tabela Q no formato {estado: {acao: valor_q}} de um
+            agente do tabuleiro 3x3.
+
+    Returns:
+        Tupla (valores, conhecidos):
+        - valores: array float32 (19683, 9) com os valores Q (0.0 se ausente)
+        - conhecidos: array bool (19683,) marcando os estados presentes na tabela
+    """
+    valores = np.zeros((NUMERO_DE_ESTADOS_3X3, NUMERO_DE_CASAS_3X3), dtype=np.float32)
+    conhecidos = np.zeros(NUMERO_DE_ESTADOS_3X3, dtype=bool)
+
+    for estado, acoes in tabela_q.items():
+        codigo = codificar_estado(estado)
+        conhecidos[codigo] = True
+        for acao, valor in acoes.items():
+            valores[codigo, acao] = valor
+
+    return valores, conhecidos
+
+
+def matriz_para_tabela(valores: np.ndarray, conhecidos: np.ndarray) -> Dict[Tuple, Dict[int, float]]:
+    """
+    Converte a representação densa de volta para a Tabela Q em dicionário.
+
+    Cada estado conhecido recebe uma entrada com todas as suas casas livres,
+    como acontece quando o AgenteQLearning avalia as ações de um estado.
+
+    Args:
+        valores: Array (19683, 9) com os valores Q.
+        conhecidos: Array bool (19683,) com os estados visitados.
+
+    Returns:
+        Tabela Q no formato {estado: {acao: valor_q}}, com inteiros e floats
+        nativos do Python (prontos para pickle, mesclagem e jogo).
+    """
+    codigos = np.flatnonzero(conhecidos)
+
+    # Decodifica todos os estados de uma vez: dígito i = (codigo // 3**i) % 3
+    tabuleiros = (codigos[:, None] // POTENCIAS_DE_TRES) % 3
+    valores_conhecidos = valores[codigos].tolist()
+
+    tabela_q: Dict[Tuple, Dict[int, float]] = {}
+    for tabuleiro, valores_estado in zip(tabuleiros.tolist(), valores_conhecidos):
+        tabela_q[tuple(tabuleiro)] = {
+            acao: valores_estado[acao]
+            for acao in range(NUMERO_DE_CASAS_3X3)
+            if tabuleiro[acao] == 0
+        }
+    return tabela_q
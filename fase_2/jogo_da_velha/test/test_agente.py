@@ -15,6 +15,9 @@ Para executar os testes, use um dos seguintes comandos:
     - py -m test.test_agente (a partir do diretório fase-2/jogo_da_velha)
 """
 
+import tempfile
+from pathlib import Path
+
 from ..agente import AgenteQLearning
 
 
@@ -220,6 +223,43 @@ def testar_estrategia_epsilon_greedy():
     print("--- TESTE 3 FINALIZADO ---\n")
 
 
+def testar_salvar_e_carregar_memoria():
+    """
+    Testa se a memória do agente sobrevive a um ciclo de salvar e carregar.
+
+    Além da tabela Q (pickle), o agente grava um arquivo JSON de metadados com
+    o epsilon e as estatísticas, permitindo retomar um checkpoint do ponto exato
+    em que o treinamento parou.
+
+    Raises:
+        AssertionError: Se a tabela Q ou os metadados não forem restaurados.
+    """
+    print("--- INICIANDO TESTE 4: SALVAR E CARREGAR MEMÓRIA ---")
+
+    # Cria um agente com algum conhecimento e estatísticas de treino
+    agente = AgenteQLearning(jogador=1, epsilon=0.25)
+    agente.tabela_q[(0, 0, 0, 0, 1, 0, 0, 0, 0)] = {0: 0.5, 8: -0.2}
+    agente.partidas_treinadas = 42
+    agente.vitorias = 30
+
+    with tempfile.TemporaryDirectory() as pasta_temporaria:
+        caminho = Path(pasta_temporaria) / "agente_x.pkl"
+        agente.salvar_memoria(str(caminho))
+
+        # O arquivo de metadados deve ser criado ao lado da tabela Q
+        assert caminho.with_suffix('.json').exists(), "O arquivo de metadados deveria existir."
+
+        agente_carregado = AgenteQLearning.carregar(str(caminho), jogador=1)
+
+    assert agente_carregado.tabela_q == agente.tabela_q, "A tabela Q deveria ser idêntica à salva."
+    assert agente_carregado.epsilon == 0.25, "O epsilon salvo deveria ter sido restaurado."
+    assert agente_carregado.partidas_treinadas == 42, "As partidas treinadas deveriam ter sido restauradas."
+    assert agente_carregado.vitorias == 30, "As vitórias deveriam ter sido restauradas."
+
+    print("✅ A memória do agente foi salva e restaurada corretamente.")
+    print("--- TESTE 4 FINALIZADO ---\n")
+
+
 def executar_todos_testes():
     """
     Executa toda a suíte de testes do AgenteQLearning.
@@ -232,6 +272,7 @@ def executar_todos_testes():
     1. Teste de inicialização (base para todos os outros)
     2. Teste de aprendizado (validação do algoritmo Q-Learning)
     3. Teste de escolha de ação (validação da estratégia Epsilon-Greedy)
+    4. Teste de persistência (salvar e carregar a memória)
 
     Se todos os testes passarem, uma mensagem de sucesso é exibida. Se algum
     teste falhar, uma exceção AssertionError será levantada com detalhes sobre
@@ -258,6 +299,7 @@ def executar_todos_testes():
     testar_inicializacao()
     testar_aprendizado_q_learning()
     testar_estrategia_epsilon_greedy()
+    testar_salvar_e_carregar_memoria()
 
     print("="*50)
     print("✅ TODOS OS TESTES DO AGENTE CONCLUÍDOS COM SUCESSO!")
@@ -0,0 +1,184 @@
+"""
+Módulo: 🧪 test_agente_denso.py
+Projeto: 📘 AI Game Learning
+
+Este módulo contém testes para o AgenteQLearningDenso, o agente do 3x3 que
+guarda a Tabela Q em uma matriz NumPy densa.
+
+Os testes verificam:
+- Se o aprendizado produz os mesmos valores Q do AgenteQLearning (dicionário)
+- Se salvar e carregar funciona nos dois formatos (.npz e .pkl)
+- Se o treinamento completo funciona com agentes densos, com e sem o kernel
+- Se o treinamento em múltiplos processos funciona com a memória compartilhada
+
+Para executar os testes, use um dos seguintes comandos:
+    - python -m pytest fase_2/jogo_da_velha/test/test_agente_denso.py
+    - py -m test.test_agente_denso (a partir do diretório fase-2/jogo_da_velha)
+"""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from ..agente import AgenteQLearning
+from ..agente_denso import AgenteQLearningDenso
+from ..ambiente import AmbienteJogoDaVelha
+from ..tabela_q_densa import codificar_estado
+from ..treinador import Treinador
+
+
+def testar_aprendizado_igual_ao_agente_com_dicionario():
+    """
+    Testa se o agente denso aprende exatamente como o agente com dicionário.
+
+    Os dois agentes recebem o mesmo histórico (o denso, com os estados já
+    codificados em base 3) e a mesma recompensa; os valores Q resultantes
+    precisam coincidir (a menos da precisão float32).
+
+    Raises:
+        AssertionError: Se os valores Q divergirem.
+    """
+    print("--- INICIANDO TESTE 1: APRENDIZADO EQUIVALENTE ---")
+
+    historico = [
+        ((0, 0, 0, 0, 0, 0, 0, 0, 0), 4),
+        ((2, 0, 0, 0, 1, 0, 0, 0, 0), 8),
+        ((2, 2, 0, 0, 1, 0, 0, 0, 1), 2),
+    ]
+    agente_dicionario = AgenteQLearning(jogador=1, gamma=0.9)
+    agente_denso = AgenteQLearningDenso(jogador=1, gamma=0.9)
+
+    # O agente denso recebe o mesmo histórico com os estados como códigos em base 3
+    historico_codigos = [(codificar_estado(estado), acao) for estado, acao in historico]
+
+    for _ in range(3):
+        agente_dicionario.historico_partida = list(historico)
+        agente_dicionario.processar_aprendizado_monte_carlo(1.0)
+        agente_denso.historico_partida = list(historico_codigos)
+        agente_denso.processar_aprendizado_monte_carlo(1.0)
+
+    tabela_densa = agente_denso.tabela_q
+    for estado, acao in historico:
+        assert tabela_densa[estado][acao] == pytest.approx(agente_dicionario.tabela_q[estado][acao]), (
+            "O valor Q do agente denso deveria ser igual ao do agente com dicionário."
+        )
+    assert agente_denso.contar_estados_conhecidos() == agente_dicionario.contar_estados_conhecidos()
+    assert agente_denso.epsilon == agente_dicionario.epsilon
+
+    print("✅ Os dois agentes aprenderam os mesmos valores Q.")
+    print("--- TESTE 1 FINALIZADO ---\n")
+
+
+def testar_salvar_e_carregar_nos_dois_formatos():
+    """
+    Testa salvar/carregar o agente denso em .npz (matrizes) e .pkl (dicionário).
+
+    Raises:
+        AssertionError: Se a tabela ou os metadados não forem restaurados.
+    """
+    print("--- INICIANDO TESTE 2: SALVAR E CARREGAR ---")
+
+    agente = AgenteQLearningDenso(jogador=2)
+    agente.historico_partida = [((0, 0, 0, 0, 0, 0, 0, 0, 0), 4)]
+    agente.processar_aprendizado_monte_carlo(1.0)
+
+    with tempfile.TemporaryDirectory() as pasta:
+        for nome in ("agente.npz", "agente.pkl"):
+            caminho = Path(pasta) / nome
+            agente.salvar_memoria(str(caminho))
+
+            restaurado = AgenteQLearningDenso.carregar(str(caminho), jogador=2)
+            assert restaurado.tabela_q == agente.tabela_q, f"A tabela deveria ser restaurada de {nome}."
+            assert restaurado.partidas_treinadas == 1, f"Os metadados deveriam ser restaurados de {nome}."
+
+        # O .pkl do agente denso é o mesmo formato do agente com dicionário
+        comum = AgenteQLearning.carregar(str(Path(pasta) / "agente.pkl"), jogador=2)
+        assert comum.tabela_q == agente.tabela_q, "O .pkl deveria ser legível pelo AgenteQLearning."
+
+    print("✅ Salvamento e carregamento funcionam nos dois formatos.")
+    print("--- TESTE 2 FINALIZADO ---\n")
+
+
+def testar_treinamento_com_agentes_densos():
+    """
+    Testa o treinamento com agentes densos: partida a partida, em lotes
+    vetorizados (lendo as matrizes direto) e no kernel.
+
+    Raises:
+        AssertionError: Se o treinamento não contabilizar as partidas ou não
+            gravar os checkpoints em .npz.
+    """
+    print("--- INICIANDO TESTE 3: TREINAMENTO COM AGENTES DENSOS ---")
+
+    for usar_kernel, tamanho_lote in ((False, 1), (False, 16), (True, 1)):
+        agente_x = AgenteQLearningDenso(jogador=1)
+        agente_o = AgenteQLearningDenso(jogador=2)
+        with tempfile.TemporaryDirectory() as pasta:
+            treinador = Treinador(agente_x, agente_o, AmbienteJogoDaVelha(dimensao=3), pasta_modelos=Path(pasta))
+
+            treinador.treinar(
+                numero_de_partidas=100, intervalo_log=50, intervalo_checkpoint=100,
+                tamanho_lote=tamanho_lote, usar_kernel=usar_kernel
+            )
+
+            assert agente_x.partidas_treinadas == 100, "Todas as partidas deveriam ser contabilizadas."
+            assert agente_x.contar_estados_conhecidos() > 0, "O agente X deveria conhecer estados."
+            assert (treinador.pasta_modelos / "agente_x_checkpoint_100.npz").exists(), (
+                "O checkpoint do agente denso deveria ser gravado em .npz."
+            )
+
+    print("✅ Treinamento com agentes densos concluído com sucesso!")
+    print("--- TESTE 3 FINALIZADO ---\n")
+
+
+def testar_treinamento_com_memoria_compartilhada():
+    """
+    Testa o treinamento com múltiplos processos lendo as tabelas densas da memória compartilhada.
+
+    Raises:
+        AssertionError: Se as partidas não forem contabilizadas, se o agente
+            não aprender ou se as matrizes continuarem presas à memória compartilhada.
+    """
+    print("--- INICIANDO TESTE 4: MEMÓRIA COMPARTILHADA ---")
+
+    agente_x = AgenteQLearningDenso(jogador=1)
+    agente_o = AgenteQLearningDenso(jogador=2)
+    with tempfile.TemporaryDirectory() as pasta:
+        treinador = Treinador(agente_x, agente_o, AmbienteJogoDaVelha(dimensao=3), pasta_modelos=Path(pasta))
+        treinador.treinar(
+            numero_de_partidas=60, intervalo_log=30, intervalo_checkpoint=60, numero_de_processos=2
+        )
+
+    assert agente_x.partidas_treinadas == 60, "Todas as partidas deveriam ser contabilizadas."
+    assert agente_x.vitorias == agente_o.derrotas, "Vitórias do X devem ser derrotas do O."
+    assert agente_x.contar_estados_conhecidos() > 0, "O agente X deveria conhecer estados."
+    assert agente_x.valores.flags.owndata and agente_o.valores.flags.owndata, (
+        "Ao final, os agentes deveriam ter cópias próprias das matrizes."
+    )
+
+    print("✅ Treinamento com memória compartilhada concluído com sucesso!")
+    print("--- TESTE 4 FINALIZADO ---\n")
+
+
+def executar_todos_testes():
+    """
+    Executa toda a suíte de testes do AgenteQLearningDenso.
+    """
+    print("\n" + "=" * 50)
+    print("🧪 INICIANDO BATERIA DE TESTES DO AGENTE DENSO 🧪")
+    print("=" * 50 + "\n")
+
+    testar_aprendizado_igual_ao_agente_com_dicionario()
+    testar_salvar_e_carregar_nos_dois_formatos()
+    testar_treinamento_com_agentes_densos()
+    testar_treinamento_com_memoria_compartilhada()
+
+    print("=" * 50)
+    print("✅ TODOS OS TESTES DO AGENTE DENSO CONCLUÍDOS COM SUCESSO!")
+    print("=" * 50 + "\n")
+
+
+# --- Bloco de Execução Principal ---
+if __name__ == "__main__":
+    executar_todos_testes()
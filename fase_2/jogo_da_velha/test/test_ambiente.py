@@ -22,6 +22,7 @@ Para executar os testes, use um dos seguintes comandos:
     - py -m test.test_ambiente (a partir do diretório fase-2/jogo_da_velha)
 """
 
+import random
 from typing import List
 from ..ambiente import AmbienteJogoDaVelha
 
@@ -103,6 +104,52 @@ def simular_partida_completa(ambiente: AmbienteJogoDaVelha, titulo: str, sequenc
     print("⚠️  A sequência de jogadas terminou antes do fim da partida.")
 
 
+def testar_vitoria_por_mascaras_de_bits():
+    """
+    Testa se a detecção de vitória por máscaras de bits equivale à varredura completa.
+
+    O ambiente detecta vitórias consultando máscaras de bits (tabela
+    pré-calculada no 3x3, combinações da casa jogada nos demais tamanhos).
+    Este teste joga partidas aleatórias e, a cada jogada, compara o resultado
+    com a forma "ingênua": percorrer todas as combinações de vitória no tabuleiro.
+    As ações válidas (máscara de casas livres) também são comparadas com as
+    casas vazias do tabuleiro.
+
+    Raises:
+        AssertionError: Se alguma vitória ou empate for detectado incorretamente.
+    """
+    print("--- INICIANDO TESTE: VITÓRIA POR MÁSCARAS DE BITS ---")
+    gerador = random.Random(42)
+
+    for dimensao in (3, 4, 5):
+        ambiente = AmbienteJogoDaVelha(dimensao=dimensao)
+        for _ in range(200):
+            ambiente.reiniciar_partida()
+            while not ambiente.partida_finalizada:
+                jogador = ambiente.jogador_atual
+                ambiente.executar_jogada(gerador.choice(ambiente.obter_acoes_validas()))
+
+                # Varredura completa do tabuleiro (referência)
+                venceu = any(
+                    all(ambiente.tabuleiro[posicao] == jogador for posicao in combinacao)
+                    for combinacao in ambiente.combinacoes_de_vitoria
+                )
+                assert venceu == (ambiente.vencedor == jogador), (
+                    f"Vitória detectada incorretamente no tabuleiro {dimensao}x{dimensao}"
+                )
+                assert ambiente.obter_acoes_validas() == [
+                    casa for casa, valor in enumerate(ambiente.tabuleiro) if valor == 0
+                ], f"Ações válidas incorretas no tabuleiro {dimensao}x{dimensao}"
+
+            # Empate só pode acontecer com o tabuleiro cheio
+            if ambiente.vencedor == 0:
+                assert not ambiente.obter_acoes_validas(), "Empate declarado com casas vazias"
+
+        print(f"✅ Tabuleiro {dimensao}x{dimensao}: vitórias e empates conferem.")
+
+    print("--- TESTE FINALIZADO ---\n")
+
+
 def executar_todos_testes():
     """
     Executa toda a suíte de testes do AmbienteJogoDaVelha.
@@ -175,6 +222,9 @@ def executar_todos_testes():
         [0, 1, 5, 2, 10, 3, 15]
     )
 
+    # --- VALIDAÇÃO DA DETECÇÃO DE VITÓRIA POR MÁSCARAS DE BITS ---
+    testar_vitoria_por_mascaras_de_bits()
+
     print("\n" + "=" * 50)
     print("✅ BATERIA DE TESTES CONCLUÍDA!")
     print("=" * 50 + "\n")
@@ -0,0 +1,193 @@
+"""
+Módulo: 🧪 test_autojogo.py
+Projeto: 📘 AI Game Learning
+
+Este módulo contém testes para as rotinas de self-play do módulo autojogo.py,
+que apenas jogam partidas (sem aprender) e devolvem os históricos de jogadas.
+
+Os testes verificam:
+- Se cada partida devolvida é uma partida válida do Jogo da Velha
+- Se o vencedor informado é o mesmo obtido ao "rejogar" o histórico no ambiente
+- Se as versões sequencial e vetorizada produzem resultados no mesmo formato
+- Se a versão vetorizada aceita as matrizes densas do 3x3
+
+Para executar os testes, use um dos seguintes comandos:
+    - python -m pytest fase_2/jogo_da_velha/test/test_autojogo.py
+    - py -m test.test_autojogo (a partir do diretório fase-2/jogo_da_velha)
+"""
+
+import numpy as np
+
+from ..ambiente import AmbienteJogoDaVelha
+from ..autojogo import escolher_acoes_em_lote, jogar_partidas, jogar_partidas_vetorizadas
+from ..tabela_q_densa import NUMERO_DE_CASAS_3X3, NUMERO_DE_ESTADOS_3X3, POTENCIAS_DE_TRES
+
+
+def _rejogar_partida(dimensao: int, vencedor: int, historico_x, historico_o):
+    """
+    Rejoga uma partida no ambiente a partir dos históricos e confere o resultado.
+
+    O jogador que começou é aquele cujo primeiro estado é o tabuleiro vazio.
+    As jogadas são intercaladas a partir dele e cada estado registrado precisa
+    ser exatamente o tabuleiro antes da jogada correspondente.
+
+    Args:
+        dimensao: Dimensão do tabuleiro da partida.
+        vencedor: Vencedor informado pela rotina de self-play.
+        historico_x: Lista de (estado, ação) do agente X.
+        historico_o: Lista de (estado, ação) do agente O.
+
+    Raises:
+        AssertionError: Se a partida não for válida ou o vencedor não conferir.
+    """
+    ambiente = AmbienteJogoDaVelha(dimensao=dimensao)
+    ambiente.reiniciar_partida()
+    tabuleiro_vazio = (0,) * ambiente.numero_de_casas
+
+    # Descobre quem começou e intercala as jogadas dos dois históricos
+    x_comecou = bool(historico_x) and historico_x[0][0] == tabuleiro_vazio
+    ambiente.jogador_atual = 1 if x_comecou else 2
+    historicos = {1: list(historico_x), 2: list(historico_o)}
+
+    while not ambiente.partida_finalizada:
+        estado, acao = historicos[ambiente.jogador_atual].pop(0)
+        assert estado == ambiente.obter_estado_como_tupla(), "Estado registrado não confere."
+        ambiente.executar_jogada(acao)
+
+    assert not historicos[1] and not historicos[2], "Sobraram jogadas após o fim da partida."
+    assert ambiente.vencedor == vencedor, "O vencedor informado não confere com o rejogo."
+
+
+def testar_partidas_sequenciais_sao_validas():
+    """
+    Testa se jogar_partidas() devolve partidas completas e coerentes.
+
+    Raises:
+        AssertionError: Se alguma partida for inválida.
+    """
+    print("--- INICIANDO TESTE 1: PARTIDAS SEQUENCIAIS ---")
+
+    resultados = jogar_partidas(7, 50, 3, {}, 1.0, {}, 1.0)
+
+    assert len(resultados) == 50, "Deveriam ser jogadas 50 partidas."
+    for vencedor, historico_x, historico_o in resultados:
+        _rejogar_partida(3, vencedor, historico_x, historico_o)
+
+    print("✅ Todas as partidas sequenciais são válidas.")
+    print("--- TESTE 1 FINALIZADO ---\n")
+
+
+def testar_partidas_vetorizadas_sao_validas():
+    """
+    Testa se jogar_partidas_vetorizadas() devolve partidas completas e coerentes.
+
+    Usa tabelas Q com alguns valores conhecidos e epsilon intermediário, para
+    exercitar tanto a escolha gulosa quanto a aleatória, em 3x3 e 4x4.
+
+    Raises:
+        AssertionError: Se alguma partida for inválida.
+    """
+    print("--- INICIANDO TESTE 2: PARTIDAS VETORIZADAS ---")
+    gerador = np.random.default_rng(42)
+
+    for dimensao in (3, 4):
+        tabuleiro_vazio = (0,) * (dimensao * dimensao)
+        tabela_x = {tabuleiro_vazio: {0: 1.0}}
+        tabela_o = {tabuleiro_vazio: {dimensao: 0.5}}
+
+        resultados = jogar_partidas_vetorizadas(
+            64, dimensao, tabela_x, 0.3, tabela_o, 0.3, gerador
+        )
+
+        assert len(resultados) == 64, "Deveriam ser jogadas 64 partidas."
+        for vencedor, historico_x, historico_o in resultados:
+            _rejogar_partida(dimensao, vencedor, historico_x, historico_o)
+
+        print(f"✅ Tabuleiro {dimensao}x{dimensao}: todas as partidas vetorizadas são válidas.")
+
+    print("--- TESTE 2 FINALIZADO ---\n")
+
+
+def testar_partidas_vetorizadas_com_tabelas_densas():
+    """
+    Testa jogar_partidas_vetorizadas() com as matrizes densas do 3x3.
+
+    Com epsilon 0, o agente X precisa abrir sempre na casa de maior valor Q
+    da sua matriz, e todas as partidas precisam continuar válidas. Com as
+    duas tabelas densas, os históricos trazem os códigos dos estados (ints).
+
+    Raises:
+        AssertionError: Se alguma partida for inválida ou a escolha gulosa
+            ignorar a matriz.
+    """
+    print("--- INICIANDO TESTE 3: TABELAS DENSAS ---")
+    gerador = np.random.default_rng(7)
+
+    tabela_x = np.zeros((NUMERO_DE_ESTADOS_3X3, NUMERO_DE_CASAS_3X3), dtype=np.float32)
+    tabela_o = np.zeros_like(tabela_x)
+    tabela_x[0, 8] = 1.0  # Tabuleiro vazio (código 0): X prefere a casa 8
+
+    resultados = jogar_partidas_vetorizadas(64, 3, tabela_x, 0.0, tabela_o, 0.5, gerador)
+
+    def decodificar(historico):
+        # Código em base 3 → tupla do tabuleiro (dígito i = (codigo // 3**i) % 3)
+        assert all(isinstance(estado, int) for estado, _ in historico), "Os estados deveriam ser códigos."
+        return [(tuple(((estado // POTENCIAS_DE_TRES) % 3).tolist()), acao) for estado, acao in historico]
+
+    for vencedor, historico_x, historico_o in resultados:
+        _rejogar_partida(3, vencedor, decodificar(historico_x), decodificar(historico_o))
+        if historico_x[0][0] == 0:
+            assert historico_x[0][1] == 8, "X deveria abrir na casa de maior valor Q."
+
+    print("✅ Partidas com tabelas densas são válidas e seguem a matriz.")
+    print("--- TESTE 3 FINALIZADO ---\n")
+
+
+def testar_escolha_de_acoes_em_lote():
+    """
+    Testa escolher_acoes_em_lote() nos dois extremos do epsilon.
+
+    Raises:
+        AssertionError: Se uma ação ocupada for escolhida ou a escolha gulosa falhar.
+    """
+    print("--- INICIANDO TESTE 4: ESCOLHA DE AÇÕES EM LOTE ---")
+    gerador = np.random.default_rng(0)
+
+    casas_livres = np.ones((200, 9), dtype=bool)
+    casas_livres[:, :4] = False
+    valores_q = np.zeros((200, 9))
+    valores_q[:, 0] = 5.0  # A melhor casa está ocupada e não pode ser escolhida
+    valores_q[:, 6] = 1.0
+
+    gulosas = escolher_acoes_em_lote(valores_q, casas_livres, np.zeros(200), gerador)
+    assert (gulosas == 6).all(), "Com epsilon 0, a ação deveria ser a de maior Q entre as livres."
+
+    aleatorias = escolher_acoes_em_lote(valores_q, casas_livres, np.ones(200), gerador)
+    assert casas_livres[np.arange(200), aleatorias].all(), "Só casas livres podem ser sorteadas."
+    assert len(set(aleatorias.tolist())) > 1, "Com epsilon 1, as ações deveriam variar."
+
+    print("✅ Escolha de ações em lote funciona corretamente.")
+    print("--- TESTE 4 FINALIZADO ---\n")
+
+
+def executar_todos_testes():
+    """
+    Executa toda a suíte de testes do módulo autojogo.
+    """
+    print("\n" + "=" * 50)
+    print("🧪 INICIANDO BATERIA DE TESTES DO AUTOJOGO 🧪")
+    print("=" * 50 + "\n")
+
+    testar_partidas_sequenciais_sao_validas()
+    testar_partidas_vetorizadas_sao_validas()
+    testar_partidas_vetorizadas_com_tabelas_densas()
+    testar_escolha_de_acoes_em_lote()
+
+    print("=" * 50)
+    print("✅ TODOS OS TESTES DO AUTOJOGO CONCLUÍDOS COM SUCESSO!")
+    print("=" * 50 + "\n")
+
+
+# --- Bloco de Execução Principal ---
+if __name__ == "__main__":
+    executar_todos_testes()
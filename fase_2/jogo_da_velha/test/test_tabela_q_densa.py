@@ -0,0 +1,93 @@
+"""
+Módulo: 🧪 test_tabela_q_densa.py
+Projeto: 📘 AI Game Learning
+
+Este módulo contém testes para a conversão da Tabela Q entre o formato de
+dicionário (usado pelo AgenteQLearning) e o formato denso (usado pelo kernel).
+
+Os testes verificam:
+- Se a codificação em base 3 é a mesma mantida pelo ambiente
+- Se a ida e volta dicionário → matriz → dicionário preserva os valores Q
+
+Para executar os testes, use um dos seguintes comandos:
+    - python -m pytest fase_2/jogo_da_velha/test/test_tabela_q_densa.py
+    - py -m test.test_tabela_q_densa (a partir do diretório fase-2/jogo_da_velha)
+"""
+
+from ..ambiente import AmbienteJogoDaVelha
+from ..tabela_q_densa import codificar_estado, matriz_para_tabela, tabela_para_matriz
+
+
+def testar_codificacao_igual_a_do_ambiente():
+    """
+    Testa se codificar_estado() bate com o codigo_estado mantido pelo ambiente.
+
+    Raises:
+        AssertionError: Se as duas codificações divergirem.
+    """
+    print("--- INICIANDO TESTE 1: CODIFICAÇÃO DO ESTADO ---")
+
+    ambiente = AmbienteJogoDaVelha(dimensao=3)
+    ambiente.reiniciar_partida()
+    for acao in (4, 0, 8, 2):
+        ambiente.executar_jogada(acao)
+        assert codificar_estado(ambiente.obter_estado_como_tupla()) == ambiente.codigo_estado, (
+            "A codificação do estado deveria ser igual à do ambiente."
+        )
+
+    print("✅ Codificação em base 3 confere com o ambiente.")
+    print("--- TESTE 1 FINALIZADO ---\n")
+
+
+def testar_ida_e_volta_preserva_valores():
+    """
+    Testa se converter para matriz e de volta preserva os valores Q.
+
+    Raises:
+        AssertionError: Se algum valor Q ou estado se perder na conversão.
+    """
+    print("--- INICIANDO TESTE 2: IDA E VOLTA DA TABELA Q ---")
+
+    vazio = (0,) * 9
+    x_no_centro = (0, 0, 0, 0, 1, 0, 0, 0, 0)
+    tabela_q = {
+        vazio: {4: 0.5, 0: -0.25},
+        x_no_centro: {0: 1.0},
+    }
+
+    valores, conhecidos = tabela_para_matriz(tabela_q)
+    assert valores.shape == (3 ** 9, 9), "A matriz deveria ter formato (19683, 9)."
+    assert conhecidos.sum() == 2, "Deveriam existir 2 estados conhecidos."
+
+    reconstruida = matriz_para_tabela(valores, conhecidos)
+    assert set(reconstruida) == {vazio, x_no_centro}, "Os estados deveriam ser preservados."
+    assert reconstruida[vazio][4] == 0.5 and reconstruida[vazio][0] == -0.25
+    assert reconstruida[x_no_centro][0] == 1.0
+
+    # Ações livres não registradas aparecem com 0.0; casas ocupadas nunca aparecem
+    assert reconstruida[vazio][8] == 0.0
+    assert 4 not in reconstruida[x_no_centro], "Casa ocupada não pode ser uma ação."
+
+    print("✅ Ida e volta preserva os valores Q.")
+    print("--- TESTE 2 FINALIZADO ---\n")
+
+
+def executar_todos_testes():
+    """
+    Executa toda a suíte de testes da Tabela Q densa.
+    """
+    print("\n" + "=" * 50)
+    print("🧪 INICIANDO BATERIA DE TESTES DA TABELA Q DENSA 🧪")
+    print("=" * 50 + "\n")
+
+    testar_codificacao_igual_a_do_ambiente()
+    testar_ida_e_volta_preserva_valores()
+
+    print("=" * 50)
+    print("✅ TODOS OS TESTES DA TABELA Q DENSA CONCLUÍDOS COM SUCESSO!")
+    print("=" * 50 + "\n")
+
+
+# --- Bloco de Execução Principal ---
+if __name__ == "__main__":
+    executar_todos_testes()
@@ -23,7 +23,10 @@ Para executar os testes, use um dos seguintes comandos:
 from ..treinador import Treinador
 from ..agente import AgenteQLearning
 from ..ambiente import AmbienteJogoDaVelha
+import json
 import sys
+import tempfile
+from pathlib import Path
 
 def testar_ciclo_de_treinamento_rapido():
     """
@@ -72,9 +75,6 @@ def testar_ciclo_de_treinamento_rapido():
     agente_x_teste = AgenteQLearning(jogador=1)
     agente_o_teste = AgenteQLearning(jogador=2)
 
-    # Cria o Treinador que orquestrará o treinamento
-    treinador_teste = Treinador(agente_x_teste, agente_o_teste, ambiente_teste)
-
     # Define um número pequeno de partidas para o teste ser rápido
     # Em treinamento real, este número seria muito maior (10.000+)
     numero_de_partidas_teste = 100
@@ -84,18 +84,22 @@ def testar_ciclo_de_treinamento_rapido():
     # --- FASE 2: EXECUÇÃO DO TREINAMENTO ---
     # Executa o método de treinamento e captura qualquer erro
     # Se houver erro, o teste falha imediatamente
-    try:
-        treinador_teste.treinar(
-            numero_de_partidas=numero_de_partidas_teste,
-            intervalo_log=50  # Reseta estatísticas a cada 50 partidas
-        )
-    except Exception as erro:
-        # Se qualquer erro ocorrer durante o treinamento, o teste falha
-        # Isso garante que problemas no sistema sejam detectados imediatamente
-        assert False, (
-            f"O treinamento falhou com um erro: {erro}. "
-            "Isso indica um problema no sistema de treinamento que precisa ser corrigido."
-        )
+    # Os modelos são gravados em uma pasta temporária, fora do repositório
+    with tempfile.TemporaryDirectory() as pasta:
+        # Cria o Treinador que orquestrará o treinamento
+        treinador_teste = Treinador(agente_x_teste, agente_o_teste, ambiente_teste, pasta_modelos=Path(pasta))
+        try:
+            treinador_teste.treinar(
+                numero_de_partidas=numero_de_partidas_teste,
+                intervalo_log=50  # Reseta estatísticas a cada 50 partidas
+            )
+        except Exception as erro:
+            # Se qualquer erro ocorrer durante o treinamento, o teste falha
+            # Isso garante que problemas no sistema sejam detectados imediatamente
+            assert False, (
+                f"O treinamento falhou com um erro: {erro}. "
+                "Isso indica um problema no sistema de treinamento que precisa ser corrigido."
+            )
 
     # --- FASE 3: VERIFICAÇÃO DOS RESULTADOS ---
 
@@ -134,6 +138,231 @@ def testar_ciclo_de_treinamento_rapido():
     print("--- TESTE 1 FINALIZADO ---\n")
 
 
+def testar_avaliacao_apos_treinamento():
+    """
+    Testa se a avaliação (sem exploração) roda após um treinamento curto.
+
+    A avaliação usa um loop e uma interface próprios, separados do treinamento.
+    Este teste garante que ela executa todas as partidas pedidas sem erros.
+
+    Raises:
+        AssertionError: Se a avaliação levantar alguma exceção.
+    """
+    print("--- INICIANDO TESTE 2: AVALIAÇÃO APÓS TREINAMENTO ---")
+
+    ambiente_teste = AmbienteJogoDaVelha(dimensao=3)
+    agente_x_teste = AgenteQLearning(jogador=1)
+    agente_o_teste = AgenteQLearning(jogador=2)
+    with tempfile.TemporaryDirectory() as pasta:
+        treinador_teste = Treinador(agente_x_teste, agente_o_teste, ambiente_teste, pasta_modelos=Path(pasta))
+        treinador_teste.treinar(numero_de_partidas=100, intervalo_log=50)
+
+        try:
+            treinador_teste.avaliar_agentes(numero_de_partidas=50)
+        except Exception as erro:
+            assert False, f"A avaliação falhou com um erro: {erro}."
+
+    print("✅ A avaliação foi concluída com sucesso!")
+    print("--- TESTE 2 FINALIZADO ---\n")
+
+
+def testar_treinamento_com_multiplos_processos():
+    """
+    Testa o treinamento com as partidas jogadas em processos paralelos.
+
+    No modo com múltiplos processos, as partidas são jogadas pelos
+    trabalhadores e o aprendizado é aplicado no processo principal. O
+    resultado observável deve ser o mesmo do modo sequencial: todas as
+    partidas contabilizadas e tabelas Q preenchidas.
+
+    Raises:
+        AssertionError: Se alguma partida se perder ou os agentes não aprenderem.
+    """
+    print("--- INICIANDO TESTE 3: TREINAMENTO COM MÚLTIPLOS PROCESSOS ---")
+
+    ambiente_teste = AmbienteJogoDaVelha(dimensao=3)
+    agente_x_teste = AgenteQLearning(jogador=1)
+    agente_o_teste = AgenteQLearning(jogador=2)
+    # 2 processos e blocos de 30 partidas (intervalo_log): 100 = 30 + 30 + 30 + 10
+    with tempfile.TemporaryDirectory() as pasta:
+        treinador_teste = Treinador(agente_x_teste, agente_o_teste, ambiente_teste, pasta_modelos=Path(pasta))
+        treinador_teste.treinar(numero_de_partidas=100, intervalo_log=30, numero_de_processos=2)
+
+    assert agente_x_teste.partidas_treinadas == 100, "Todas as partidas deveriam ser aprendidas pelo X."
+    assert agente_o_teste.partidas_treinadas == 100, "Todas as partidas deveriam ser aprendidas pelo O."
+    assert len(agente_x_teste.tabela_q) > 0, "A Tabela Q do Agente X não deveria estar vazia."
+    assert len(agente_o_teste.tabela_q) > 0, "A Tabela Q do Agente O não deveria estar vazia."
+
+    total = agente_x_teste.vitorias + agente_x_teste.derrotas + agente_x_teste.empates
+    assert total == 100, "Os resultados do X deveriam somar 100 partidas."
+    assert agente_x_teste.vitorias == agente_o_teste.derrotas, "Vitórias do X devem ser derrotas do O."
+
+    print("✅ Treinamento com múltiplos processos concluído com sucesso!")
+    print("--- TESTE 3 FINALIZADO ---\n")
+
+
+def testar_treinamento_em_lotes_vetorizados():
+    """
+    Testa o treinamento com partidas jogadas em lotes vetorizados (NumPy).
+
+    Raises:
+        AssertionError: Se alguma partida se perder ou os agentes não aprenderem.
+    """
+    print("--- INICIANDO TESTE 4: TREINAMENTO EM LOTES VETORIZADOS ---")
+
+    ambiente_teste = AmbienteJogoDaVelha(dimensao=3)
+    agente_x_teste = AgenteQLearning(jogador=1)
+    agente_o_teste = AgenteQLearning(jogador=2)
+    # Lotes de 32 partidas simultâneas: 100 = 32 + 32 + 32 + 4
+    with tempfile.TemporaryDirectory() as pasta:
+        treinador_teste = Treinador(agente_x_teste, agente_o_teste, ambiente_teste, pasta_modelos=Path(pasta))
+        treinador_teste.treinar(numero_de_partidas=100, intervalo_log=50, tamanho_lote=32)
+
+    assert agente_x_teste.partidas_treinadas == 100, "Todas as partidas deveriam ser aprendidas pelo X."
+    assert agente_o_teste.partidas_treinadas == 100, "Todas as partidas deveriam ser aprendidas pelo O."
+    assert len(agente_x_teste.tabela_q) > 0, "A Tabela Q do Agente X não deveria estar vazia."
+    assert agente_x_teste.vitorias == agente_o_teste.derrotas, "Vitórias do X devem ser derrotas do O."
+
+    print("✅ Treinamento em lotes vetorizados concluído com sucesso!")
+    print("--- TESTE 4 FINALIZADO ---\n")
+
+
+def testar_treinamento_com_kernel():
+    """
+    Testa o treinamento no kernel com Tabelas Q densas (3x3).
+
+    Verifica se, ao final, as tabelas voltam para os agentes no formato de
+    dicionário, se as estatísticas batem e se os checkpoints são salvos com
+    as tabelas sincronizadas. Também verifica que outros tamanhos de tabuleiro
+    são recusados.
+
+    Raises:
+        AssertionError: Se o treinamento no kernel não se comportar como esperado.
+    """
+    print("--- INICIANDO TESTE 5: TREINAMENTO COM KERNEL ---")
+
+    ambiente_teste = AmbienteJogoDaVelha(dimensao=3)
+    agente_x_teste = AgenteQLearning(jogador=1)
+    agente_o_teste = AgenteQLearning(jogador=2)
+    with tempfile.TemporaryDirectory() as pasta:
+        treinador_teste = Treinador(agente_x_teste, agente_o_teste, ambiente_teste, pasta_modelos=Path(pasta))
+        treinador_teste.treinar(
+            numero_de_partidas=200, intervalo_log=50, intervalo_checkpoint=100, usar_kernel=True
+        )
+
+    assert agente_x_teste.partidas_treinadas == 200, "Todas as partidas deveriam ser contabilizadas."
+    assert agente_x_teste.vitorias == agente_o_teste.derrotas, "Vitórias do X devem ser derrotas do O."
+    assert agente_x_teste.epsilon < 1.0, "O epsilon deveria ter decaído durante o treino."
+    assert isinstance(agente_x_teste.tabela_q, dict), "A Tabela Q deveria voltar a ser um dicionário."
+    assert len(agente_x_teste.tabela_q) > 0, "A Tabela Q do Agente X não deveria estar vazia."
+    assert all(cp['sucesso'] for cp in treinador_teste._checkpoints), "Os checkpoints deveriam ser salvos."
+    assert len(treinador_teste._checkpoints) == 2, "Deveriam existir 2 checkpoints (100 e 200)."
+
+    # O kernel só existe para o 3x3
+    with tempfile.TemporaryDirectory() as pasta:
+        treinador_4x4 = Treinador(
+            AgenteQLearning(jogador=1), AgenteQLearning(jogador=2), AmbienteJogoDaVelha(4), pasta_modelos=Path(pasta)
+        )
+        try:
+            treinador_4x4.treinar(numero_de_partidas=10, usar_kernel=True)
+            assert False, "O kernel deveria recusar tabuleiros diferentes de 3x3."
+        except ValueError:
+            pass
+
+    print("✅ Treinamento com kernel concluído com sucesso!")
+    print("--- TESTE 5 FINALIZADO ---\n")
+
+
+def testar_checkpoint_em_segundo_plano():
+    """
+    Testa a gravação dos checkpoints em segundo plano.
+
+    Verifica se o arquivo gravado é a "fotografia" da tabela no momento do
+    checkpoint (mesmo que o agente mude logo depois) e se uma falha na
+    gravação é registrada nos metadados do checkpoint.
+
+    Raises:
+        AssertionError: Se o checkpoint não for uma fotografia consistente ou
+            se a falha não for registrada.
+    """
+    print("--- INICIANDO TESTE 6: CHECKPOINT EM SEGUNDO PLANO ---")
+
+    agente_x_teste = AgenteQLearning(jogador=1)
+    agente_o_teste = AgenteQLearning(jogador=2)
+    estado = (0,) * 9
+    agente_x_teste.tabela_q = {estado: {4: 1.0}}
+    with tempfile.TemporaryDirectory() as pasta:
+        treinador_teste = Treinador(
+            agente_x_teste, agente_o_teste, AmbienteJogoDaVelha(dimensao=3), pasta_modelos=Path(pasta)
+        )
+        treinador_teste._salvar_checkpoint(1)
+        agente_x_teste.tabela_q[estado][4] = -1.0  # Alteração após a fotografia
+        treinador_teste._aguardar_checkpoint_pendente()
+
+        restaurado = AgenteQLearning.carregar(
+            str(treinador_teste.pasta_modelos / "agente_x_checkpoint_1.pkl"), jogador=1
+        )
+    assert restaurado.tabela_q == {estado: {4: 1.0}}, "O checkpoint deveria guardar a tabela do momento."
+    assert treinador_teste._checkpoints[-1]['sucesso'], "O checkpoint deveria ter sido gravado."
+
+    # Uma pasta que é, na verdade, um arquivo faz a gravação falhar
+    with tempfile.TemporaryDirectory() as pasta:
+        treinador_teste.pasta_modelos = Path(pasta) / "arquivo"
+        treinador_teste.pasta_modelos.write_text("não é uma pasta")
+        treinador_teste._salvar_checkpoint(2)
+        treinador_teste._aguardar_checkpoint_pendente()
+
+    assert not treinador_teste._checkpoints[-1]['sucesso'], "A falha na gravação deveria ser registrada."
+    assert 'erro' in treinador_teste._checkpoints[-1], "O erro da gravação deveria ser registrado."
+
+    print("✅ Checkpoints em segundo plano funcionam corretamente!")
+    print("--- TESTE 6 FINALIZADO ---\n")
+
+
+def testar_estatisticas_no_formato_do_visualizador():
+    """
+    Testa o arquivo de estatísticas gravado ao final do treinamento.
+
+    Verifica se o JSON tem os campos lidos pelo visualizador.py e se o
+    histórico tem um valor por janela de estatísticas.
+
+    Raises:
+        AssertionError: Se o arquivo não seguir o formato esperado.
+    """
+    print("--- INICIANDO TESTE 7: ESTATÍSTICAS DO TREINO ---")
+
+    agente_x_teste = AgenteQLearning(jogador=1)
+    agente_o_teste = AgenteQLearning(jogador=2)
+    with tempfile.TemporaryDirectory() as pasta:
+        treinador_teste = Treinador(
+            agente_x_teste, agente_o_teste, AmbienteJogoDaVelha(dimensao=3),
+            pasta_modelos=Path(pasta) / "modelos", pasta_estatisticas=Path(pasta)
+        )
+        treinador_teste.treinar(numero_de_partidas=100, intervalo_log=20, intervalo_checkpoint=100)
+
+        arquivos = list(Path(pasta).glob("treino_*.json"))
+        assert len(arquivos) == 1, "Deveria ser gravado um arquivo de estatísticas."
+        dados = json.loads(arquivos[0].read_text(encoding='utf-8'))
+
+    historico = dados['historico']
+    assert dados['episodios_totais'] == 100
+    assert len(historico['vitorias_x']) == 5, "Deveria existir um valor por janela (100 / 20)."
+    assert sum(historico['vitorias_x']) + sum(historico['vitorias_o']) + sum(historico['empates']) == 100
+    assert historico['epsilon_x'][-1] == agente_x_teste.epsilon
+    assert dados['configuracao']['agente_x']['alpha'] == agente_x_teste.alpha
+    assert dados['resultados']['agente_o']['estados_conhecidos'] == agente_o_teste.contar_estados_conhecidos()
+
+    # Sem pasta_estatisticas (o padrão), nenhum arquivo é gravado
+    with tempfile.TemporaryDirectory() as pasta:
+        treinador_sem_pasta = Treinador(
+            agente_x_teste, agente_o_teste, AmbienteJogoDaVelha(dimensao=3), pasta_modelos=Path(pasta)
+        )
+        assert treinador_sem_pasta._salvar_estatisticas(100, 20) is None
+
+    print("✅ Estatísticas gravadas no formato do visualizador!")
+    print("--- TESTE 7 FINALIZADO ---\n")
+
+
 def executar_todos_testes():
     """
     Executa toda a suíte de testes do Treinador.
@@ -168,6 +397,12 @@ def executar_todos_testes():
 
     # Executa os testes na ordem lógica
     testar_ciclo_de_treinamento_rapido()
+    testar_avaliacao_apos_treinamento()
+    testar_treinamento_com_multiplos_processos()
+    testar_treinamento_em_lotes_vetorizados()
+    testar_treinamento_com_kernel()
+    testar_checkpoint_em_segundo_plano()
+    testar_estatisticas_no_formato_do_visualizador()
 
     print("="*50)
     print("✅ TODOS OS TESTES DO TREINADOR CONCLUÍDOS COM SUCESSO!")
@@ -22,10 +22,17 @@ Este módulo suporta duas interfaces visuais:
 - TQDM (básica): Barra de progresso simples, usada como fallback
 """
 
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+import json
+from multiprocessing.shared_memory import SharedMemory
 import os
+import random
+import time
 from pathlib import Path
-from typing import Tuple, Dict, List, Optional
+from typing import Callable, Final, Tuple, Dict, Iterator, List, Optional
+
+import numpy as np
 
 # Tenta importar a biblioteca 'rich' para uma interface visual avançada.
 # Se não estiver instalada, define RICH_DISPONIVEL como False.
@@ -34,6 +41,7 @@ try:
     from rich.table import Table
     from rich.panel import Panel
     from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
+    from rich.text import Text
     RICH_DISPONIVEL = True
 except ImportError:
     RICH_DISPONIVEL = False
@@ -41,8 +49,50 @@ except ImportError:
 # Tqdm é usado como uma alternativa mais simples se 'rich' não estiver disponível.
 from tqdm import tqdm
 
+# Tenta importar o 'orjson' para gravar as estatísticas do treino bem mais rápido
+# (e serializando arrays NumPy diretamente). Sem ele, usa o módulo json padrão.
+try:
+    import orjson
+    ORJSON_DISPONIVEL = True
+except ImportError:
+    ORJSON_DISPONIVEL = False
+
 from .ambiente import AmbienteJogoDaVelha
-from .agente import AgenteQLearning
+from .agente import AgenteQLearning, gravar_arquivos
+from .agente_denso import AgenteQLearningDenso
+from .autojogo import (
+    jogar_partidas, jogar_partidas_memoria_compartilhada, jogar_partidas_vetorizadas, matriz_em_memoria
+)
+from .kernels import (
+    EPSILON, NUMBA_DISPONIVEL, POTENCIAS, TABELA_VITORIA,
+    parametros_do_agente, treinar_partidas_densas,
+)
+from .tabela_q_densa import matriz_para_tabela, tabela_para_matriz
+
+
+# Recompensas (agente X, agente O) indexadas pelo vencedor da partida:
+# 0 = empate (neutra), 1 = X venceu, 2 = O venceu
+_RECOMPENSAS: Final[Tuple[Tuple[float, float], ...]] = ((0.0, 0.0), (1.0, -1.0), (-1.0, 1.0))
+
+
+def _dividir_partidas(numero_de_partidas: int, numero_de_processos: int) -> List[int]:
+    """
+    Divide as partidas de um bloco o mais igualmente possível entre os processos.
+
+    Args:
+        numero_de_partidas: Partidas do bloco.
+        numero_de_processos: Quantidade de processos trabalhadores.
+
+    Returns:
+        Quantidade de partidas de cada processo (processos sem partidas ficam de fora).
+
+    Example:
+        >>> _dividir_partidas(10, 4)
+        [3, 3, 2, 2]
+    """
+    base, resto = divmod(numero_de_partidas, numero_de_processos)
+    quantidades = [base + (1 if indice < resto else 0) for indice in range(numero_de_processos)]
+    return [quantidade for quantidade in quantidades if quantidade > 0]
 
 
 class Treinador:
@@ -68,6 +118,8 @@ class Treinador:
         agente_o (AgenteQLearning): Agente que joga como 'O' (jogador 2).
         ambiente (AmbienteJogoDaVelha): Ambiente do jogo onde as partidas ocorrem.
         pasta_modelos (Path): Caminho da pasta onde os modelos são salvos.
+        pasta_estatisticas (Optional[Path]): Pasta do JSON de estatísticas de
+            cada treino, ou None para não gravá-lo.
         _checkpoints (List[Dict]): Lista de metadados dos checkpoints salvos.
 
     Example:
@@ -78,7 +130,14 @@ class Treinador:
         >>> treinador.treinar(numero_de_partidas=10000)
     """
 
-    def __init__(self, agente_x: AgenteQLearning, agente_o: AgenteQLearning, ambiente: AmbienteJogoDaVelha):
+    def __init__(
+        self,
+        agente_x: AgenteQLearning,
+        agente_o: AgenteQLearning,
+        ambiente: AmbienteJogoDaVelha,
+        pasta_modelos: Path = Path("modelos_treinados"),
+        pasta_estatisticas: Optional[Path] = None
+    ):
         """
         Inicializa uma nova instância do Treinador.
 
@@ -86,6 +145,13 @@ class Treinador:
             agente_x: Agente que jogará como 'X' (jogador 1).
             agente_o: Agente que jogará como 'O' (jogador 2).
             ambiente: Ambiente do jogo onde as partidas serão executadas.
+            pasta_modelos: Pasta onde os checkpoints e os modelos finais são
+                gravados. Padrão: "modelos_treinados" (relativa ao diretório
+                atual, onde avaliar e mesclar os modelos também os procuram).
+            pasta_estatisticas: Pasta onde o JSON de estatísticas de cada
+                treino é gravado (lida pelo visualizador.py, que usa
+                "estatisticas" por padrão). Padrão: None (nenhum arquivo
+                de estatísticas é gravado).
 
         Note:
             A pasta de modelos será criada automaticamente se não existir.
@@ -94,10 +160,29 @@ class Treinador:
         self.agente_x = agente_x
         self.agente_o = agente_o
         self.ambiente = ambiente
-        self.pasta_modelos = Path("modelos_treinados")
-        self.pasta_modelos.mkdir(exist_ok=True)
+        self.pasta_modelos = Path(pasta_modelos)
+        self.pasta_modelos.mkdir(parents=True, exist_ok=True)
+        self.pasta_estatisticas = Path(pasta_estatisticas) if pasta_estatisticas is not None else None
         self._checkpoints: List[Dict] = []  # Lista para armazenar metadados dos checkpoints
 
+        # Nomes dos arquivos de checkpoint montados uma única vez; a cada
+        # checkpoint só o número da partida é preenchido (%d)
+        self._modelo_checkpoint_x = f"agente_x_checkpoint_%d{agente_x.EXTENSAO_MEMORIA}"
+        self._modelo_checkpoint_o = f"agente_o_checkpoint_%d{agente_o.EXTENSAO_MEMORIA}"
+
+        # Histórico por janela de estatísticas (arrays pré-alocados em treinar())
+        self._historico: Dict[str, np.ndarray] = {}
+        self._janelas_registradas = 0
+
+        # Quando o treino roda no kernel com Tabelas Q densas, esta função copia
+        # as matrizes de volta para os dicionários dos agentes (antes de salvar)
+        self._sincronizar_tabelas: Optional[Callable[[], None]] = None
+
+        # Os checkpoints são gravados em disco por uma thread em segundo plano,
+        # um de cada vez, enquanto o treinamento continua jogando partidas
+        self._executor_checkpoints = ThreadPoolExecutor(max_workers=1)
+        self._checkpoint_pendente: Optional[Tuple[Future, Dict]] = None
+
     def executar_uma_partida(self) -> int:
         """
         Executa uma única partida completa entre os dois agentes.
@@ -118,50 +203,353 @@ class Treinador:
             Este método não modifica os parâmetros de treinamento dos agentes
             (como epsilon), apenas executa a partida e aplica o aprendizado.
         """
+        # Copiamos os atributos e métodos usados no loop para variáveis locais.
+        # Em Python, ler uma variável local é bem mais barato do que resolver
+        # "self.ambiente.metodo" a cada jogada, e este loop roda milhões de vezes.
+        ambiente: AmbienteJogoDaVelha = self.ambiente
+        agente_x: AgenteQLearning = self.agente_x
+        agente_o: AgenteQLearning = self.agente_o
+        obter_estado: Callable[[], Tuple] = ambiente.obter_estado_como_tupla
+        obter_acoes: Callable[[], List[int]] = ambiente.obter_acoes_validas
+        jogar = ambiente.executar_jogada
+
+        # Agentes densos aceitam o código do estado (int), que o ambiente já
+        # mantém: dispensa montar a tupla e os históricos guardam ints
+        usar_codigos: bool = (
+            isinstance(agente_x, AgenteQLearningDenso) and isinstance(agente_o, AgenteQLearningDenso)
+        )
+
         # Reinicia o ambiente para uma nova partida
-        self.ambiente.reiniciar_partida()
+        ambiente.reiniciar_partida()
         
         # Limpa os históricos dos agentes para começar uma nova partida
-        self.agente_x.limpar_historico_partida()
-        self.agente_o.limpar_historico_partida()
+        agente_x.limpar_historico_partida()
+        agente_o.limpar_historico_partida()
 
         # Loop principal da partida: continua até alguém vencer ou empatar
-        while not self.ambiente.partida_finalizada:
+        while not ambiente.partida_finalizada:
             # Determina qual agente deve jogar nesta rodada
-            agente_atual = self.agente_x if self.ambiente.jogador_atual == 1 else self.agente_o
+            agente_atual: AgenteQLearning = agente_x if ambiente.jogador_atual == 1 else agente_o
             
             # Obtém o estado atual do tabuleiro e as ações válidas
-            estado_atual = self.ambiente.obter_estado_como_tupla()
-            acoes_validas = self.ambiente.obter_acoes_validas()
+            estado_atual = ambiente.codigo_estado if usar_codigos else obter_estado()
+            acoes_validas: List[int] = obter_acoes()
             
             # O agente escolhe uma ação usando sua estratégia Epsilon-Greedy
-            acao_escolhida = agente_atual.escolher_acao(estado_atual, acoes_validas, em_treinamento=True)
+            acao_escolhida: int = agente_atual.escolher_acao(estado_atual, acoes_validas, em_treinamento=True)
             
             # Registra a jogada no histórico para aprendizado Monte Carlo posterior
             agente_atual.adicionar_jogada_ao_historico(estado_atual, acao_escolhida)
             
             # Executa a ação escolhida no ambiente
-            self.ambiente.executar_jogada(acao_escolhida)
-
-        # Calcula as recompensas baseadas no resultado final
-        if self.ambiente.vencedor == 1:
-            # Agente X venceu: recompensa positiva para X, negativa para O
-            recompensa_x, recompensa_o = 1.0, -1.0
-        elif self.ambiente.vencedor == 2:
-            # Agente O venceu: recompensa positiva para O, negativa para X
-            recompensa_x, recompensa_o = -1.0, 1.0
-        else:
-            # Empate: recompensa neutra para ambos
-            recompensa_x, recompensa_o = 0.0, 0.0
-            
+            jogar(acao_escolhida)
+
+        # Distribui as recompensas e aplica o aprendizado em ambos os agentes
+        vencedor: int = ambiente.vencedor
+        self._aplicar_aprendizado(vencedor)
+        
+        return vencedor
+
+    def _aplicar_aprendizado(self, vencedor: int):
+        """
+        Distribui as recompensas da partida e aplica o aprendizado Monte Carlo.
+
+        Usa o histórico de jogadas que já está em cada agente
+        (historico_partida) e o vencedor informado para calcular a recompensa
+        de cada um.
+
+        Args:
+            vencedor: Resultado da partida: 1 (X venceu), 2 (O venceu) ou 0 (empate).
+
+        Note:
+            Este é um método privado (prefixo _) usado tanto pelo modo
+            sequencial (executar_uma_partida) quanto pelo modo com múltiplos
+            processos, garantindo que o aprendizado seja idêntico nos dois.
+        """
+        # Recompensas baseadas no resultado final (consulta direta na tabela,
+        # sem cadeia de if/elif): quem vence recebe +1, quem perde -1, empate 0
+        recompensa_x: float
+        recompensa_o: float
+        recompensa_x, recompensa_o = _RECOMPENSAS[vencedor]
+
         # Aplica o aprendizado Monte Carlo em ambos os agentes
         # Cada agente aprende com base no histórico de sua partida
         self.agente_x.processar_aprendizado_monte_carlo(recompensa_x)
         self.agente_o.processar_aprendizado_monte_carlo(recompensa_o)
-        
-        return self.ambiente.vencedor
 
-    def treinar(self, numero_de_partidas: int = 50000, intervalo_log: int = 1000, intervalo_checkpoint: int = 10000):
+    def _gerar_resultados_partidas(
+        self,
+        numero_de_partidas: int,
+        numero_de_processos: int = 1,
+        tamanho_bloco: int = 1000,
+        tamanho_lote: int = 1,
+        usar_kernel: bool = False
+    ) -> Iterator[int]:
+        """
+        Executa as partidas de treinamento e devolve o vencedor de cada uma.
+
+        É um gerador: cada vencedor é entregue assim que a partida (e o
+        aprendizado correspondente) termina, então o loop de treinamento pode
+        atualizar estatísticas, interface e checkpoints partida a partida,
+        independentemente de como as partidas foram jogadas.
+
+        - Com 1 processo, cada partida é jogada e aprendida na hora
+          (executar_uma_partida).
+        - Com N processos, as partidas são jogadas em blocos: cada bloco é
+          dividido entre os processos, que jogam com uma cópia congelada das
+          tabelas Q. Os históricos voltam para o processo principal, que aplica
+          o aprendizado na ordem. A cópia atualizada das tabelas segue no
+          próximo bloco.
+        - Com N processos e agentes densos, as tabelas não são copiadas: ficam
+          em memória compartilhada (ver _gerar_resultados_memoria_compartilhada).
+        - Com tamanho_lote > 1, as partidas são jogadas em grupos simultâneos
+          (jogar_partidas_vetorizadas), no processo atual ou nos trabalhadores.
+        - Com usar_kernel=True, as partidas são jogadas e aprendidas pelo
+          kernel de kernels.py (ver _gerar_resultados_kernel).
+
+        Args:
+            numero_de_partidas: Total de partidas a serem executadas.
+            numero_de_processos: Quantidade de processos trabalhadores. Padrão: 1.
+            tamanho_bloco: Partidas por bloco no modo com múltiplos processos.
+                Blocos menores deixam as tabelas dos trabalhadores mais
+                atualizadas; blocos maiores reduzem a comunicação entre processos.
+            tamanho_lote: Partidas jogadas simultaneamente pela versão
+                vetorizada. Padrão: 1 (desativada).
+            usar_kernel: Se True, usa o kernel compilado (somente 3x3).
+
+        Yields:
+            Vencedor de cada partida: 1 (agente X), 2 (agente O) ou 0 (empate).
+        """
+        if usar_kernel:
+            yield from self._gerar_resultados_kernel(numero_de_partidas, tamanho_bloco)
+            return
+
+        if numero_de_processos <= 1 and tamanho_lote <= 1:
+            executar_partida = self.executar_uma_partida
+            for _ in range(numero_de_partidas):
+                yield executar_partida()
+            return
+
+        agente_x, agente_o = self.agente_x, self.agente_o
+        if (
+            numero_de_processos > 1 and tamanho_lote <= 1
+            and isinstance(agente_x, AgenteQLearningDenso) and isinstance(agente_o, AgenteQLearningDenso)
+        ):
+            yield from self._gerar_resultados_memoria_compartilhada(
+                numero_de_partidas, numero_de_processos, tamanho_bloco
+            )
+            return
+
+        aplicar_aprendizado = self._aplicar_aprendizado
+        semente = random.randrange(2 ** 32)
+
+        def tabela_para_lote(agente: AgenteQLearning):
+            # Na versão vetorizada, agentes densos entregam a própria matriz
+            # (sem montar um dicionário a cada lote)
+            if tamanho_lote > 1 and isinstance(agente, AgenteQLearningDenso):
+                return agente.valores
+            return agente.tabela_q
+
+        if numero_de_processos <= 1:
+            # Lotes vetorizados no próprio processo, sempre com as tabelas atuais
+            gerador = np.random.default_rng(semente)
+            partidas_restantes = numero_de_partidas
+            while partidas_restantes > 0:
+                lote = min(tamanho_lote, partidas_restantes)
+                partidas_restantes -= lote
+                for vencedor, historico_x, historico_o in jogar_partidas_vetorizadas(
+                    lote, self.ambiente.dimensao,
+                    tabela_para_lote(agente_x), agente_x.epsilon,
+                    tabela_para_lote(agente_o), agente_o.epsilon, gerador,
+                ):
+                    agente_x.historico_partida = historico_x
+                    agente_o.historico_partida = historico_o
+                    aplicar_aprendizado(vencedor)
+                    yield vencedor
+            return
+
+        with ProcessPoolExecutor(max_workers=numero_de_processos) as executor:
+            partidas_restantes = numero_de_partidas
+            while partidas_restantes > 0:
+                bloco = min(tamanho_bloco, partidas_restantes)
+                partidas_restantes -= bloco
+
+                # Divide o bloco o mais igualmente possível entre os processos
+                futuros = [
+                    executor.submit(
+                        jogar_partidas,
+                        semente + indice_processo,
+                        partidas_do_processo,
+                        self.ambiente.dimensao,
+                        tabela_para_lote(agente_x), agente_x.epsilon,
+                        tabela_para_lote(agente_o), agente_o.epsilon,
+                        tamanho_lote,
+                    )
+                    for indice_processo, partidas_do_processo in enumerate(
+                        _dividir_partidas(bloco, numero_de_processos)
+                    )
+                ]
+                semente += numero_de_processos
+
+                # Aprende com as partidas na ordem em que foram distribuídas
+                for futuro in futuros:
+                    for vencedor, historico_x, historico_o in futuro.result():
+                        agente_x.historico_partida = historico_x
+                        agente_o.historico_partida = historico_o
+                        aplicar_aprendizado(vencedor)
+                        yield vencedor
+
+    def _gerar_resultados_memoria_compartilhada(
+        self, numero_de_partidas: int, numero_de_processos: int, tamanho_bloco: int
+    ) -> Iterator[int]:
+        """
+        Executa as partidas em N processos com as Tabelas Q densas compartilhadas.
+
+        As matrizes (19683, 9) dos dois agentes densos são movidas para blocos
+        de memória compartilhada (multiprocessing.shared_memory), e os agentes
+        passam a usá-las diretamente. Cada trabalhador recebe só o nome dos
+        blocos (e não uma cópia serializada das tabelas), joga suas partidas
+        lendo a memória e devolve os históricos. O processo principal aplica
+        o aprendizado, escrevendo na mesma memória: o próximo lote de cada
+        trabalhador já enxerga as tabelas atualizadas, sem nenhuma cópia.
+
+        Args:
+            numero_de_partidas: Total de partidas a serem executadas.
+            numero_de_processos: Quantidade de processos trabalhadores.
+            tamanho_bloco: Partidas por bloco (divididas entre os processos).
+
+        Yields:
+            Vencedor de cada partida: 1 (agente X), 2 (agente O) ou 0 (empate).
+        """
+        agente_x, agente_o = self.agente_x, self.agente_o
+        aplicar_aprendizado = self._aplicar_aprendizado
+        semente = random.randrange(2 ** 32)
+
+        memorias = []
+        try:
+            # Move as matrizes dos agentes para a memória compartilhada
+            for agente in (agente_x, agente_o):
+                memoria = SharedMemory(create=True, size=agente.valores.nbytes)
+                memorias.append(memoria)
+                compartilhada = matriz_em_memoria(memoria)
+                compartilhada[:] = agente.valores
+                agente.valores = compartilhada
+            nome_x, nome_o = memorias[0].name, memorias[1].name
+
+            with ProcessPoolExecutor(max_workers=numero_de_processos) as executor:
+                partidas_restantes = numero_de_partidas
+                while partidas_restantes > 0:
+                    bloco = min(tamanho_bloco, partidas_restantes)
+                    partidas_restantes -= bloco
+
+                    futuros = [
+                        executor.submit(
+                            jogar_partidas_memoria_compartilhada,
+                            semente + indice_processo,
+                            partidas_do_processo,
+                            nome_x, agente_x.epsilon,
+                            nome_o, agente_o.epsilon,
+                        )
+                        for indice_processo, partidas_do_processo in enumerate(
+                            _dividir_partidas(bloco, numero_de_processos)
+                        )
+                    ]
+                    semente += numero_de_processos
+
+                    # Aprende com as partidas na ordem em que foram distribuídas
+                    for futuro in futuros:
+                        for vencedor, historico_x, historico_o in futuro.result():
+                            agente_x.historico_partida = historico_x
+                            agente_o.historico_partida = historico_o
+                            aplicar_aprendizado(vencedor)
+                            yield vencedor
+        finally:
+            # Devolve aos agentes uma cópia comum das matrizes e libera a memória
+            for agente, memoria in zip((agente_x, agente_o), memorias):
+                agente.valores = np.array(agente.valores)
+                memoria.close()
+                memoria.unlink()
+
+    def _gerar_resultados_kernel(self, numero_de_partidas: int, tamanho_bloco: int) -> Iterator[int]:
+        """
+        Executa as partidas no kernel de kernels.py, com Tabelas Q densas.
+
+        As tabelas dos agentes são convertidas para matrizes (19683, 9) uma
+        única vez. A partir daí, cada bloco de partidas é jogado e aprendido
+        inteiramente dentro do kernel (compilado pelo Numba, se disponível).
+        As estatísticas e o epsilon dos agentes são atualizados a cada bloco.
+
+        As matrizes só voltam a ser dicionários quando necessário: antes de
+        cada checkpoint (via _sincronizar_tabelas) e ao final do treinamento.
+        Agentes densos (AgenteQLearningDenso) já guardam as matrizes, então o
+        kernel treina diretamente sobre elas, sem conversão alguma.
+
+        Args:
+            numero_de_partidas: Total de partidas a serem executadas.
+            tamanho_bloco: Partidas jogadas por chamada ao kernel.
+
+        Yields:
+            Vencedor de cada partida: 1 (agente X), 2 (agente O) ou 0 (empate).
+        """
+        agente_x, agente_o = self.agente_x, self.agente_o
+
+        def obter_matrizes(agente: AgenteQLearning) -> Tuple[np.ndarray, np.ndarray]:
+            if isinstance(agente, AgenteQLearningDenso):
+                return agente.valores, agente.conhecidos
+            return tabela_para_matriz(agente.tabela_q)
+
+        valores_x, conhecidos_x = obter_matrizes(agente_x)
+        valores_o, conhecidos_o = obter_matrizes(agente_o)
+        parametros_x = parametros_do_agente(agente_x)
+        parametros_o = parametros_do_agente(agente_o)
+
+        def sincronizar():
+            # Agentes densos já estão atualizados; os demais recebem um dicionário novo
+            if not isinstance(agente_x, AgenteQLearningDenso):
+                agente_x.tabela_q = matriz_para_tabela(valores_x, conhecidos_x)
+            if not isinstance(agente_o, AgenteQLearningDenso):
+                agente_o.tabela_q = matriz_para_tabela(valores_o, conhecidos_o)
+
+        self._sincronizar_tabelas = sincronizar
+        try:
+            partidas_restantes = numero_de_partidas
+            while partidas_restantes > 0:
+                bloco = min(tamanho_bloco, partidas_restantes)
+                partidas_restantes -= bloco
+
+                vencedores = treinar_partidas_densas(
+                    valores_x, conhecidos_x, parametros_x,
+                    valores_o, conhecidos_o, parametros_o,
+                    bloco, TABELA_VITORIA, POTENCIAS,
+                )
+
+                # Atualiza estatísticas e epsilon dos agentes com o bloco inteiro
+                empates, vitorias_x, vitorias_o = np.bincount(vencedores, minlength=3).tolist()
+                agente_x.partidas_treinadas += bloco
+                agente_x.vitorias += vitorias_x
+                agente_x.derrotas += vitorias_o
+                agente_x.empates += empates
+                agente_o.partidas_treinadas += bloco
+                agente_o.vitorias += vitorias_o
+                agente_o.derrotas += vitorias_x
+                agente_o.empates += empates
+                agente_x.epsilon = float(parametros_x[EPSILON])
+                agente_o.epsilon = float(parametros_o[EPSILON])
+
+                yield from vencedores.tolist()
+        finally:
+            self._sincronizar_tabelas = None
+            sincronizar()
+
+    def treinar(
+        self,
+        numero_de_partidas: int = 50000,
+        intervalo_log: int = 1000,
+        intervalo_checkpoint: int = 10000,
+        numero_de_processos: int = 1,
+        tamanho_lote: int = 1,
+        usar_kernel: bool = False
+    ):
         """
         Executa o loop principal de treinamento com interface visual em tempo real.
 
@@ -179,6 +567,21 @@ class Treinador:
                 estatísticas. Padrão: 1.000. Usado para calcular taxas recentes.
             intervalo_checkpoint: Intervalo (em partidas) para salvar checkpoints.
                 Padrão: 10.000. Permite recuperar o treinamento se interrompido.
+            numero_de_processos: Quantidade de processos que jogam as partidas
+                em paralelo. Padrão: 1 (tudo no processo atual). Use, por
+                exemplo, os.cpu_count() para aproveitar todos os núcleos. As
+                partidas são distribuídas em blocos de intervalo_log partidas.
+            tamanho_lote: Quantidade de partidas jogadas simultaneamente pela
+                versão vetorizada com NumPy. Padrão: 1 (uma partida por vez).
+                Valores como 256 reduzem o custo do interpretador por jogada.
+                O epsilon fica congelado durante cada lote.
+            usar_kernel: Se True, joga e aprende as partidas no kernel de
+                kernels.py, com Tabelas Q densas. Muito mais rápido, sobretudo
+                com o Numba instalado. Disponível apenas para o tabuleiro 3x3;
+                ignora numero_de_processos e tamanho_lote.
+
+        Raises:
+            ValueError: Se usar_kernel=True em um tabuleiro diferente de 3x3.
 
         Note:
             - Checkpoints são salvos automaticamente nos intervalos especificados
@@ -194,32 +597,76 @@ class Treinador:
             ...     intervalo_checkpoint=20000
             ... )
         """
+        if usar_kernel and self.ambiente.dimensao != 3:
+            raise ValueError(
+                "O kernel de treinamento suporta apenas o tabuleiro 3x3. "
+                f"Dimensão atual: {self.ambiente.dimensao}"
+            )
+
         print("\n" + "="*50)
         print("⚔️ INICIANDO TREINAMENTO INTENSIVO (SELF-PLAY) ⚔️")
         print("="*50)
         print(f"Total de Partidas: {numero_de_partidas:,}")
         print(f"Interface Gráfica: {'Rich (Avançada)' if RICH_DISPONIVEL else 'TQDM (Básica)'}")
+        if usar_kernel:
+            print(f"Kernel de Treino: {'Numba (compilado)' if NUMBA_DISPONIVEL else 'Python puro'}")
         print("="*50 + "\n")
 
         # Inicializa lista de checkpoints e contadores de estatísticas
         self._checkpoints = []
-        vitorias_x_janela, vitorias_o_janela, empates_janela = 0, 0, 0
+        self._iniciar_historico(numero_de_partidas // intervalo_log)
+        # Contadores da janela indexados pelo vencedor: [empates, vitórias X, vitórias O]
+        janela = [0, 0, 0]
         ultimo_checkpoint: Optional[str] = None
 
+        # A interface é atualizada no máximo ~500 vezes no treino inteiro:
+        # redesenhar a cada partida custaria mais do que jogar a partida.
+        tick_interface = max(1, numero_de_partidas // 500)
+
+        # Cada interface (Rich ou TQDM) define apenas como se desenhar:
+        # - interface: objeto usado como contexto (Live ou barra do tqdm)
+        # - atualizar_interface(partidas, fim_da_janela, forcar): avança a barra
+        #   em `partidas` e devolve False se decidiu não atualizar agora
+        # O loop de treinamento, as estatísticas e os checkpoints são comuns.
         if RICH_DISPONIVEL:
             # --- MODO RICH (Interface Avançada) ---
             # Cria uma barra de progresso com informações detalhadas
+            # auto_refresh=False: quem redesenha a barra é o Live, não uma thread própria
             progresso = Progress(
                 TextColumn("[bold blue]{task.description}"), 
                 BarColumn(), 
                 TextColumn("{task.percentage:>3.0f}%"), 
-                TimeRemainingColumn()
+                TimeRemainingColumn(),
+                auto_refresh=False
             )
             id_tarefa = progresso.add_task("Treinando", total=numero_de_partidas)
 
-            def gerar_painel_estatisticas() -> Panel:
+            # Tabela de estatísticas construída uma única vez: cada linha de
+            # valor é um Text, cujo conteúdo é trocado a cada atualização,
+            # evitando recriar Panel/Table inteiros durante o treinamento.
+            tabela_estatisticas = Table.grid(expand=True)
+            tabela_estatisticas.add_column(justify="left")
+            tabela_estatisticas.add_column(justify="right")
+
+            def adicionar_linha(rotulo: str, estilo: str = "") -> Text:
+                valor = Text(style=estilo)
+                tabela_estatisticas.add_row(rotulo, valor)
+                return valor
+
+            texto_vitorias_x = adicionar_linha("Vitórias X (janela)", "bold green")
+            texto_vitorias_o = adicionar_linha("Vitórias O (janela)", "bold yellow")
+            texto_empates = adicionar_linha("Empates (janela)")
+            texto_taxa_empate = adicionar_linha("Taxa de Empate %")
+            tabela_estatisticas.add_row("-" * 20, "")
+            texto_epsilon_x = adicionar_linha("Epsilon X")
+            texto_epsilon_o = adicionar_linha("Epsilon O")
+            texto_estados_x = adicionar_linha("Estados Conhecidos X")
+            texto_estados_o = adicionar_linha("Estados Conhecidos O")
+            texto_checkpoint = adicionar_linha("Último Checkpoint")
+
+            def atualizar_painel_estatisticas(incluir_agentes: bool = False) -> None:
                 """
-                Gera um painel com estatísticas em tempo real do treinamento.
+                Atualiza, no lugar, os valores do painel de estatísticas.
 
                 As estatísticas incluem:
                 - Vitórias, derrotas e empates na janela atual
@@ -227,99 +674,118 @@ class Treinador:
                 - Epsilon atual de cada agente (taxa de exploração)
                 - Número de estados conhecidos (tamanho da tabela Q)
                 - Informações sobre o último checkpoint salvo
+
+                Args:
+                    incluir_agentes: Se True, também relê o epsilon e o número
+                        de estados dos agentes. Esses valores mudam devagar e
+                        só são relidos nas fronteiras da janela de estatísticas.
                 """
-                tabela = Table.grid(expand=True)
-                tabela.add_column(justify="left")
-                tabela.add_column(justify="right")
-                
+                empates_janela, vitorias_x_janela, vitorias_o_janela = janela
                 # Calcula o total para evitar divisão por zero
                 total_janela = vitorias_x_janela + vitorias_o_janela + empates_janela or 1
-                
-                # Estatísticas da janela atual (últimas N partidas)
-                tabela.add_row("Vitórias X (janela)", f"[bold green]{vitorias_x_janela}[/]")
-                tabela.add_row("Vitórias O (janela)", f"[bold yellow]{vitorias_o_janela}[/]")
-                tabela.add_row("Empates (janela)", f"{empates_janela}")
-                tabela.add_row("Taxa de Empate %", f"{(empates_janela / total_janela) * 100:.1f}%")
-                tabela.add_row("-" * 20, "-" * 20)
-                
-                # Parâmetros de treinamento
-                tabela.add_row("Epsilon X", f"{self.agente_x.epsilon:.6f}")
-                tabela.add_row("Epsilon O", f"{self.agente_o.epsilon:.6f}")
-                
-                # Conhecimento adquirido
-                tabela.add_row("Estados Conhecidos X", f"{len(self.agente_x.tabela_q):,}")
-                tabela.add_row("Estados Conhecidos O", f"{len(self.agente_o.tabela_q):,}")
-                
-                # Informações de checkpoint
-                tabela.add_row("Último Checkpoint", f"{ultimo_checkpoint or 'Nenhum'}")
-                
-                return Panel(tabela, title="[bold]Estatísticas da Janela[/]", border_style="blue")
-
-            def gerar_layout():
-                """
-                Gera o layout completo da interface Rich.
-
-                O layout combina a barra de progresso com o painel de estatísticas,
-                criando uma interface visual rica e informativa.
-                """
-                layout = Table.grid(expand=True)
-                layout.add_row(
-                    Panel(progresso, title="[bold]Progresso Geral[/]", border_style="green"), 
-                    gerar_painel_estatisticas()
-                )
-                return layout
 
-            # Loop principal de treinamento com interface Rich
-            with Live(gerar_layout(), refresh_per_second=10) as live:
-                for indice_partida in range(numero_de_partidas):
-                    # Executa uma partida completa
-                    vencedor = self.executar_uma_partida()
-                    
-                    # Atualiza contadores da janela de estatísticas
-                    if vencedor == 1: 
-                        vitorias_x_janela += 1
-                    elif vencedor == 2: 
-                        vitorias_o_janela += 1
-                    else: 
-                        empates_janela += 1
-
-                    # Atualiza a barra de progresso
-                    progresso.update(id_tarefa, advance=1)
-
-                    # Reseta a janela de estatísticas no intervalo especificado
-                    if (indice_partida + 1) % intervalo_log == 0:
-                        vitorias_x_janela, vitorias_o_janela, empates_janela = 0, 0, 0
-                    
-                    # Salva checkpoint no intervalo especificado
-                    if (indice_partida + 1) % intervalo_checkpoint == 0:
-                        self._salvar_checkpoint(indice_partida + 1)
-                        ultimo_checkpoint = f"{indice_partida+1:,}"
+                texto_vitorias_x.plain = f"{vitorias_x_janela}"
+                texto_vitorias_o.plain = f"{vitorias_o_janela}"
+                texto_empates.plain = f"{empates_janela}"
+                texto_taxa_empate.plain = f"{(empates_janela / total_janela) * 100:.1f}%"
+                if incluir_agentes:
+                    texto_epsilon_x.plain = f"{self.agente_x.epsilon:.6f}"
+                    texto_epsilon_o.plain = f"{self.agente_o.epsilon:.6f}"
+                    texto_estados_x.plain = f"{self.agente_x.contar_estados_conhecidos():,}"
+                    texto_estados_o.plain = f"{self.agente_o.contar_estados_conhecidos():,}"
+                    texto_checkpoint.plain = f"{ultimo_checkpoint or 'Nenhum'}"
+
+            # Layout fixo: barra de progresso ao lado do painel de estatísticas
+            atualizar_painel_estatisticas(incluir_agentes=True)
+            layout = Table.grid(expand=True)
+            layout.add_row(
+                Panel(progresso, title="[bold]Progresso Geral[/]", border_style="green"),
+                Panel(tabela_estatisticas, title="[bold]Estatísticas da Janela[/]", border_style="blue")
+            )
 
-                    # Atualiza o layout completo periodicamente para melhor performance
-                    if indice_partida % 250 == 0:
-                        live.update(gerar_layout())
-                
-                # Atualização final para garantir que tudo está visível
-                live.update(gerar_layout())
+            # Além do tick, o painel respeita o relógio: não adianta atualizá-lo
+            # mais vezes por segundo do que o Live consegue redesenhar
+            atualizacoes_por_segundo = 10
+            periodo_interface = 1 / atualizacoes_por_segundo
+            relogio = time.monotonic
+            proxima_atualizacao = relogio()
+            atualizar_progresso = progresso.update
+
+            def atualizar_interface(partidas: int, fim_da_janela: bool, forcar: bool) -> bool:
+                # Epsilon e estados conhecidos só são relidos quando forçado
+                # (fim da janela, checkpoint ou fim do treino)
+                nonlocal proxima_atualizacao
+                agora = relogio()
+                if agora < proxima_atualizacao and not forcar:
+                    return False
+                atualizar_progresso(id_tarefa, advance=partidas)
+                atualizar_painel_estatisticas(incluir_agentes=forcar)
+                proxima_atualizacao = agora + periodo_interface
+                return True
+
+            # O Live redesenha sozinho, no ritmo de refresh_per_second
+            interface = Live(layout, refresh_per_second=atualizacoes_por_segundo)
         else:
             # --- MODO TQDM (Interface Básica) ---
             # Fallback para quando Rich não está disponível
-            for indice_partida in tqdm(range(numero_de_partidas), desc="Treinando"):
-                vencedor = self.executar_uma_partida()
-                
-                # Atualiza contadores (não exibidos em TQDM, mas mantidos para consistência)
-                if vencedor == 1: 
-                    vitorias_x_janela += 1
-                elif vencedor == 2: 
-                    vitorias_o_janela += 1
-                else: 
-                    empates_janela += 1
+            barra = tqdm(total=numero_de_partidas, desc="Treinando")
+
+            def atualizar_interface(partidas: int, fim_da_janela: bool, forcar: bool) -> bool:
+                # Toda a formatação das estatísticas fica no fim da janela:
+                # o postfix só é montado (e a barra redesenhada) uma vez por janela
+                if fim_da_janela:
+                    empates_janela, vitorias_x_janela, vitorias_o_janela = janela
+                    total_janela = vitorias_x_janela + vitorias_o_janela + empates_janela or 1
+                    barra.set_postfix({
+                        "X": vitorias_x_janela,
+                        "O": vitorias_o_janela,
+                        "Empate %": f"{(empates_janela / total_janela) * 100:.1f}",
+                        "ε X": f"{self.agente_x.epsilon:.4f}",
+                        "ε O": f"{self.agente_o.epsilon:.4f}",
+                    }, refresh=False)
+                barra.update(partidas)
+                return True
+
+            interface = barra
+
+        resultados = self._gerar_resultados_partidas(
+            numero_de_partidas, numero_de_processos, intervalo_log, tamanho_lote, usar_kernel
+        )
+        partidas_pendentes = 0
+
+        # Loop principal de treinamento (comum às duas interfaces)
+        with interface:
+            # Cada item é o vencedor de uma partida completa (já aprendida)
+            for indice_partida, vencedor in enumerate(resultados):
+                # Atualiza contadores da janela de estatísticas
+                janela[vencedor] += 1
+                partidas_pendentes += 1
+
+                numero_partida = indice_partida + 1
+                fim_da_janela = numero_partida % intervalo_log == 0
 
                 # Salva checkpoint no intervalo especificado
-                if (indice_partida + 1) % intervalo_checkpoint == 0:
-                    self._salvar_checkpoint(indice_partida + 1)
+                salvou_checkpoint = numero_partida % intervalo_checkpoint == 0
+                if salvou_checkpoint:
+                    self._salvar_checkpoint(numero_partida)
+                    ultimo_checkpoint = f"{numero_partida:,}"
+
+                # Interface atualizada apenas a cada "tick": a barra avança em
+                # lote e as estatísticas são refeitas poucas vezes
+                if partidas_pendentes >= tick_interface or fim_da_janela or salvou_checkpoint:
+                    if atualizar_interface(partidas_pendentes, fim_da_janela, fim_da_janela or salvou_checkpoint):
+                        partidas_pendentes = 0
+
+                # Registra e reseta a janela de estatísticas no intervalo especificado
+                if fim_da_janela:
+                    self._registrar_janela(janela[1], janela[2], janela[0])
+                    janela[:] = [0, 0, 0]
+
+            # Atualização final para garantir que tudo está visível
+            atualizar_interface(partidas_pendentes, False, True)
         
-        # Exibe resumo de checkpoints salvos
+        # Exibe resumo de checkpoints salvos (após a última gravação terminar)
+        self._aguardar_checkpoint_pendente()
         self._exibir_resumo_checkpoints()
         
         print("\n" + "="*50)
@@ -330,8 +796,108 @@ class Treinador:
         self.agente_x.imprimir_estatisticas()
         self.agente_o.imprimir_estatisticas()
         
-        # Salva os modelos finais
+        # Salva os modelos finais e, se houver pasta_estatisticas, as estatísticas do treino
         self._salvar_modelos_finais()
+        self._salvar_estatisticas(numero_de_partidas, intervalo_log)
+
+    def _iniciar_historico(self, numero_de_janelas: int):
+        """
+        Pré-aloca os arrays do histórico de estatísticas, um valor por janela.
+
+        Args:
+            numero_de_janelas: Quantidade de janelas de estatísticas do treino.
+        """
+        self._historico = {
+            'vitorias_x': np.zeros(numero_de_janelas, dtype=np.int32),
+            'vitorias_o': np.zeros(numero_de_janelas, dtype=np.int32),
+            'empates': np.zeros(numero_de_janelas, dtype=np.int32),
+            'epsilon_x': np.zeros(numero_de_janelas, dtype=np.float64),
+            'epsilon_o': np.zeros(numero_de_janelas, dtype=np.float64),
+        }
+        self._janelas_registradas = 0
+
+    def _registrar_janela(self, vitorias_x: int, vitorias_o: int, empates: int):
+        """
+        Registra no histórico os resultados de uma janela de estatísticas.
+
+        Args:
+            vitorias_x: Vitórias do agente X na janela.
+            vitorias_o: Vitórias do agente O na janela.
+            empates: Empates na janela.
+        """
+        indice = self._janelas_registradas
+        historico = self._historico
+        historico['vitorias_x'][indice] = vitorias_x
+        historico['vitorias_o'][indice] = vitorias_o
+        historico['empates'][indice] = empates
+        historico['epsilon_x'][indice] = self.agente_x.epsilon
+        historico['epsilon_o'][indice] = self.agente_o.epsilon
+        self._janelas_registradas = indice + 1
+
+    def _salvar_estatisticas(self, numero_de_partidas: int, intervalo_log: int) -> Optional[Path]:
+        """
+        Grava as estatísticas do treinamento em JSON, no formato do visualizador.py.
+
+        O arquivo contém a configuração dos agentes, o histórico por janela
+        (vitórias, empates e epsilon) e os resultados finais. Com o 'orjson'
+        instalado, os arrays NumPy do histórico são serializados diretamente,
+        sem passar por listas do Python.
+
+        Args:
+            numero_de_partidas: Total de partidas do treinamento.
+            intervalo_log: Tamanho de cada janela de estatísticas.
+
+        Returns:
+            Caminho do arquivo gravado (<pasta_estatisticas>/treino_<dimensão>_<data>.json),
+            ou None se o Treinador foi criado sem pasta_estatisticas.
+        """
+        if self.pasta_estatisticas is None:
+            return None
+
+        def configuracao(agente: AgenteQLearning) -> Dict:
+            return {
+                'alpha': agente.alpha,
+                'gamma': agente.gamma,
+                'epsilon_minimo': agente.epsilon_minimo,
+                'taxa_decaimento_epsilon': agente.taxa_decaimento_epsilon,
+            }
+
+        def resultados(agente: AgenteQLearning) -> Dict:
+            partidas = agente.partidas_treinadas or 1
+            return {
+                'estados_conhecidos': agente.contar_estados_conhecidos(),
+                'taxa_vitoria': agente.vitorias / partidas,
+                'taxa_empate': agente.empates / partidas,
+            }
+
+        janelas = self._janelas_registradas
+        dados = {
+            'episodios_totais': numero_de_partidas,
+            'data': datetime.now().isoformat(timespec='seconds'),
+            'configuracao': {
+                'dimensao': self.ambiente.dimensao,
+                'intervalo_log': intervalo_log,
+                'agente_x': configuracao(self.agente_x),
+                'agente_o': configuracao(self.agente_o),
+            },
+            'historico': {chave: valores[:janelas] for chave, valores in self._historico.items()},
+            'resultados': {
+                'agente_x': resultados(self.agente_x),
+                'agente_o': resultados(self.agente_o),
+            },
+        }
+
+        self.pasta_estatisticas.mkdir(parents=True, exist_ok=True)
+        dimensao = self.ambiente.dimensao
+        caminho = self.pasta_estatisticas / f"treino_{dimensao}x{dimensao}_{datetime.now():%Y%m%d_%H%M%S}.json"
+
+        if ORJSON_DISPONIVEL:
+            caminho.write_bytes(orjson.dumps(dados, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            dados['historico'] = {chave: valores.tolist() for chave, valores in dados['historico'].items()}
+            with open(caminho, 'w', encoding='utf-8') as arquivo:
+                json.dump(dados, arquivo, ensure_ascii=False, indent=2)
+        return caminho
 
     def _salvar_checkpoint(self, numero_partida: int):
         """
@@ -348,22 +914,37 @@ class Treinador:
             Este método registra metadados sobre o checkpoint (sucesso/falha,
             timestamp, etc.) para rastreamento posterior. Se houver erro ao salvar,
             o erro é registrado mas não interrompe o treinamento.
+
+            As tabelas são serializadas aqui, na hora (uma "fotografia"
+            consistente), mas a escrita no disco acontece em segundo plano.
+            Antes de enviar um novo checkpoint, espera o anterior terminar.
         """
-        caminho_x = self.pasta_modelos / f"agente_x_checkpoint_{numero_partida}.pkl"
-        caminho_o = self.pasta_modelos / f"agente_o_checkpoint_{numero_partida}.pkl"
+        caminho_x = self.pasta_modelos / (self._modelo_checkpoint_x % numero_partida)
+        caminho_o = self.pasta_modelos / (self._modelo_checkpoint_o % numero_partida)
         
+        # Se o treino está no kernel, traz as Tabelas Q densas para os agentes
+        if self._sincronizar_tabelas is not None:
+            self._sincronizar_tabelas()
+
         try:
-            # Salva as tabelas Q de ambos os agentes
-            self.agente_x.salvar_memoria(str(caminho_x))
-            self.agente_o.salvar_memoria(str(caminho_o))
-            
-            # Registra metadados do checkpoint bem-sucedido
-            self._checkpoints.append({
+            # Serializa as tabelas Q de ambos os agentes (fotografia do momento)
+            arquivos = self.agente_x.serializar_memoria(str(caminho_x))
+            arquivos.update(self.agente_o.serializar_memoria(str(caminho_o)))
+
+            # Registra metadados do checkpoint; se a gravação falhar, o
+            # registro é corrigido em _aguardar_checkpoint_pendente()
+            registro = {
                 'numero_partida': numero_partida,
                 'timestamp': datetime.now(),
                 'pasta': str(self.pasta_modelos),
                 'sucesso': True
-            })
+            }
+            self._checkpoints.append(registro)
+
+            # Grava em segundo plano (um checkpoint por vez)
+            self._aguardar_checkpoint_pendente()
+            futuro = self._executor_checkpoints.submit(gravar_arquivos, arquivos)
+            self._checkpoint_pendente = (futuro, registro)
         except Exception as e:
             # Registra falha sem interromper o treinamento
             self._checkpoints.append({
@@ -373,6 +954,25 @@ class Treinador:
                 'sucesso': False
             })
 
+    def _aguardar_checkpoint_pendente(self):
+        """
+        Espera a gravação em segundo plano do último checkpoint terminar.
+
+        Se a gravação falhou, o registro do checkpoint passa a indicar a falha
+        (com a mensagem de erro), como acontece com erros na serialização.
+        """
+        if self._checkpoint_pendente is None:
+            return
+
+        futuro, registro = self._checkpoint_pendente
+        self._checkpoint_pendente = None
+        try:
+            futuro.result()
+        except Exception as e:
+            registro.pop('pasta', None)
+            registro['erro'] = str(e)
+            registro['sucesso'] = False
+
     def _salvar_modelos_finais(self):
         """
         Salva os modelos finais após o término do treinamento.
@@ -386,6 +986,7 @@ class Treinador:
         """
         caminho_x = self.pasta_modelos / f"agente_x_final_{self.ambiente.dimensao}x{self.ambiente.dimensao}.pkl"
         caminho_o = self.pasta_modelos / f"agente_o_final_{self.ambiente.dimensao}x{self.ambiente.dimensao}.pkl"
+        self._aguardar_checkpoint_pendente()
         self.agente_x.salvar_memoria(str(caminho_x))
         self.agente_o.salvar_memoria(str(caminho_o))
 
@@ -462,12 +1063,12 @@ class Treinador:
 
         # --- LÓGICA DE CARREGAMENTO AUTOMÁTICO ---
         # Se os agentes não estiverem treinados, tenta carregar modelos salvos
-        if not self.agente_x.tabela_q:
+        if not self.agente_x.contar_estados_conhecidos():
             print("Agente X não treinado. Tentando carregar modelo do disco...")
             caminho_x = self.pasta_modelos / f"superagente_final_{self.ambiente.dimensao}x{self.ambiente.dimensao}.pkl"
             self.agente_x = AgenteQLearning.carregar(str(caminho_x), jogador=1)
 
-        if not self.agente_o.tabela_q:
+        if not self.agente_o.contar_estados_conhecidos():
             print("Agente O não treinado. Tentando carregar modelo do disco...")
             caminho_o = self.pasta_modelos / f"agente_o_final_{self.ambiente.dimensao}x{self.ambiente.dimensao}.pkl"
             self.agente_o = AgenteQLearning.carregar(str(caminho_o), jogador=2)
@@ -504,8 +1105,8 @@ class Treinador:
                 tabela.add_row("Empates", f"{empates}")
                 tabela.add_row("-" * 20, "-" * 20)
                 tabela.add_row("Taxa de Empate %", f"{(empates / total_partidas) * 100:.2f}%")
-                tabela.add_row("Estados Conhecidos X", f"{len(self.agente_x.tabela_q):,}")
-                tabela.add_row("Estados Conhecidos O", f"{len(self.agente_o.tabela_q):,}")
+                tabela.add_row("Estados Conhecidos X", f"{self.agente_x.contar_estados_conhecidos():,}")
+                tabela.add_row("Estados Conhecidos O", f"{self.agente_o.contar_estados_conhecidos():,}")
                 
                 return Panel(tabela, title="[bold]Estatísticas em Tempo Real[/]", border_style="blue")
 
@@ -614,7 +1215,9 @@ if __name__ == "__main__":
     agente_x_padrao = AgenteQLearning(jogador=1)
     agente_o_padrao = AgenteQLearning(jogador=2)
     
-    treinador_padrao = Treinador(agente_x_padrao, agente_o_padrao, ambiente_padrao)
+    treinador_padrao = Treinador(
+        agente_x_padrao, agente_o_padrao, ambiente_padrao, pasta_estatisticas=Path("estatisticas")
+    )
     treinador_padrao.treinar(numero_de_partidas=200000, intervalo_log=500, intervalo_checkpoint=40000)
     
     treinador_padrao.avaliar_agentes()
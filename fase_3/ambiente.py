@@ -7,12 +7,40 @@ Este módulo contém a classe `Labirinto`, que é responsável por:
 - Fornecer as ações possíveis que o agente pode tomar.
 - Executar uma ação e retornar o resultado (novo estado, recompensa, se terminou).
 - Reiniciar o ambiente para um novo episódio de treinamento.
+- Avançar vários agentes de uma só vez (execução em lote com NumPy).
 
 A classe é projetada para ser independente do algoritmo de IA, seguindo os
 padrões de ambientes de Aprendizado por Reforço.
+
+Por que executar em lote? No treinamento, cada passo de um único agente paga
+o custo do interpretador Python (comparações de strings, tuplas novas etc.).
+Com as posições de N agentes em um array (N, 2) e as ações como inteiros,
+um único passo em lote avança todos os agentes com poucas operações NumPy,
+como nos ambientes vetorizados usados em Aprendizado por Reforço.
+
+A grade do labirinto é guardada como um array NumPy uint8 contíguo (CAMINHO
+ou PAREDE): cada célula ocupa 1 byte, em vez de uma string Python dentro de
+uma lista de listas, e verificar uma parede é um único acesso por índice.
+
+As transições de todas as células são calculadas uma única vez, na criação
+do ambiente (construir_tabela_de_transicoes do módulo kernels.py): o passo
+individual (calcular_transicao, compilada pelo Numba quando ele está
+instalado) e o passo em lote apenas leem a próxima posição dessa tabela.
 """
 
-from typing import TypeAlias, Literal
+import sys
+from enum import IntEnum
+from typing import Iterable, TypeAlias, Literal
+
+import numpy as np
+
+from .kernels import (
+    PENALIDADE_PASSO,
+    calcular_transicao,
+    construir_tabela_de_transicoes,
+    executar_episodio,
+    preparar_para_kernel,
+)
 
 # Apelidos de tipo para melhorar a legibilidade do código.
 Posicao: TypeAlias = tuple[int, int]
@@ -41,9 +69,87 @@ MAPEAMENTO_TECLAS: dict[str, DirecaoPadrao] = {
     "direita": "direita",
 }
 
-# Conjunto de todas as ações válidas (para validação rápida).
-ACOES_VALIDAS: set[str] = set(MAPEAMENTO_TECLAS.keys())
 
+class Acao(IntEnum):
+    """
+    Ações do labirinto como inteiros: a forma usada pelo kernel, pela
+    execução em lote e pela interface Pygame.
+
+    O valor de cada ação é o índice da linha correspondente em DESLOCAMENTOS (kernels.py).
+    """
+
+    CIMA = 0
+    BAIXO = 1
+    ESQUERDA = 2
+    DIREITA = 3
+
+
+# Valor de Acao de cada tecla ou nome aceito por executar_acao(), para o kernel.
+# Só strings: os membros de Acao são reconhecidos à parte (isinstance), pois
+# um IntEnum tem o mesmo hash de um int e 1 ou True passariam como ações.
+INDICES_ACOES: dict[str, int] = {
+    tecla: int(Acao[direcao.upper()]) for tecla, direcao in MAPEAMENTO_TECLAS.items()
+}
+
+# Conjunto de todas as teclas e nomes válidos (para validação rápida).
+ACOES_VALIDAS: set[str] = set(INDICES_ACOES.keys())
+
+# Valores das células na grade uint8 do labirinto.
+CAMINHO = 0
+PAREDE = 1
+
+# Codificação do texto guardado para o __str__: cada caractere é um uint32
+# (o próprio código Unicode), então o '•' do rastro ocupa o mesmo espaço.
+_CODIFICACAO_TEXTO = "utf-32-le"
+
+
+def converter_acoes(acoes: Iterable[AcaoUsuario | Acao]) -> np.ndarray:
+    """
+    Converte uma sequência de ações (teclas, nomes ou Acao) em valores inteiros.
+
+    A conversão acontece uma única vez, antes de executar a sequência: cada
+    passo depois recebe um inteiro, sem validar nem traduzir strings de novo.
+    Uma string é tratada como sequência de teclas ("ddss" = direita, direita,
+    baixo, baixo).
+
+    Args:
+        acoes (Iterable[AcaoUsuario | Acao]): As ações, na ordem de execução.
+
+    Returns:
+        np.ndarray: Array int8 com o valor de Acao de cada ação.
+
+    Raises:
+        ValueError: Se alguma ação for inválida.
+    """
+    try:
+        return np.array(
+            [int(acao) if isinstance(acao, Acao) else INDICES_ACOES[acao] for acao in acoes], dtype=np.int8
+        )
+    except KeyError as erro:
+        raise ValueError(
+            f'Ação inválida: "{erro.args[0]}". Use: W/A/S/D (ou cima/baixo/esquerda/direita)'
+        ) from None
+
+
+# --- Caracteres de Desenho da grade do imprimir_labirinto() ---
+BARRA_H = "───"
+BARRA_V = "│"
+# Cantos: superior esquerdo/direito e inferior esquerdo/direito
+CANTO_SE, CANTO_SD, CANTO_IE, CANTO_ID = "┌", "┐", "└", "┘"
+# Junções: cima, baixo, esquerda, direita e meio
+JUNCAO_CIMA, JUNCAO_BAIXO, JUNCAO_ESQ, JUNCAO_DIR, JUNCAO_MEIO = "┬", "┴", "├", "┤", "┼"
+
+
+def _montar_bordas_da_grade(colunas: int) -> tuple[str, str, str]:
+    """
+    Monta as linhas fixas da grade do imprimir_labirinto(): superior, separadora e inferior.
+    """
+    barras = [BARRA_H] * colunas
+    return (
+        CANTO_SE + JUNCAO_CIMA.join(barras) + CANTO_SD,
+        JUNCAO_ESQ + JUNCAO_MEIO.join(barras) + JUNCAO_DIR,
+        CANTO_IE + JUNCAO_BAIXO.join(barras) + CANTO_ID,
+    )
 
 class Labirinto:
     """
@@ -59,17 +165,36 @@ class Labirinto:
     - 'S' é usado apenas para visualização (saída do labirinto)
 
     Atributos:
-        _matriz (list[list[str]]): A grade 2D que representa o labirinto.
+        _grade (np.ndarray): Grade uint8 (linhas, colunas) com CAMINHO ou PAREDE,
+            usada na exibição.
+        _transicoes (np.ndarray): Tabela int32 (linhas * colunas, 4) com a
+            próxima célula de cada par (célula, ação). As células são
+            identificadas pelo índice linear linha * colunas + coluna.
+        _transicoes_do_kernel (np.ndarray | list): A mesma tabela no formato
+            lido pelos kernels: o array com o Numba, listas sem ele.
+        _coordenadas (np.ndarray): Array int32 (linhas * colunas, 2) com a
+            posição (linha, coluna) de cada índice linear.
+        _rastro (np.ndarray): Array bool (linhas, colunas) com as células por
+            onde o agente já passou.
+        matriz (list[list[str]]): Propriedade com a grade no formato de
+            strings (' ', '#' e '•' para o rastro), montada só quando pedida.
         estado_inicial (Posicao): A posição de início do agente.
         ponto_final (Posicao): A posição da saída do labirinto.
-        posicao_agente (Posicao): A posição atual do agente, que muda a cada passo.
+        posicao_agente (Posicao): Propriedade com a posição atual do agente,
+            guardada internamente como o índice linear `_celula_agente`.
         _numero_linhas (int): Quantidade de linhas do labirinto.
         _numero_colunas (int): Quantidade de colunas do labirinto.
+        posicoes (np.ndarray): Propriedade com as posições (N, 2) dos agentes
+            da execução em lote (reiniciar_lote / executar_acoes_em_lote),
+            guardados como índices lineares em `_celulas`. Quem precisa de
+            vários lotes no mesmo Labirinto (como o LabirintoVetorizado)
+            guarda as próprias células e usa os métodos sem estado
+            celulas_iniciais, avancar_celulas e posicoes_das_celulas.
     """
 
     def __init__(
         self,
-        matriz_labirinto: list[list[str]],
+        matriz_labirinto: list[list[str]] | np.ndarray,
         ponto_inicial: Posicao,
         ponto_final: Posicao,
     ) -> None:
@@ -80,25 +205,92 @@ class Labirinto:
         O agente começa em uma posição inicial e deve encontrar a saída.
 
         Args:
-            matriz_labirinto (list[list[str]]): Uma grade representando o labirinto,
-                onde ' ' é caminho, '#' é parede.
+            matriz_labirinto (list[list[str]] | np.ndarray): Uma grade representando
+                o labirinto: strings, onde '#' é parede e qualquer outro caractere
+                é caminho, ou uma grade numérica como a de gerar_grade_labirinto(),
+                onde CAMINHO (0) é caminho e qualquer outro valor é parede.
             ponto_inicial (Posicao): Uma tupla (linha, coluna) para a posição inicial.
             ponto_final (Posicao): Uma tupla (linha, coluna) para a posição final.
 
         Raises:
             ValueError: Se a matriz do labirinto estiver vazia ou malformada.
         """
-        if not matriz_labirinto or len(matriz_labirinto) == 0:
+        try:
+            matriz = np.asarray(matriz_labirinto)
+        except ValueError as erro:  # Linhas de tamanhos diferentes
+            raise ValueError("A matriz do labirinto está malformada.") from erro
+        if len(matriz) == 0:
             raise ValueError("A matriz do labirinto não pode estar vazia.")
-        if not matriz_labirinto[0] or len(matriz_labirinto[0]) == 0:
+        if matriz.ndim != 2 or matriz.shape[1] == 0:
             raise ValueError("A matriz do labirinto está malformada.")
 
-        self._matriz = matriz_labirinto
+        # Converte a grade uma única vez: 1 byte por célula, contíguo na memória
+        paredes = matriz == "#" if matriz.dtype.kind in "US" else matriz != CAMINHO
+        self._grade = paredes.astype(np.uint8)
+        # Próxima célula de cada (célula, ação), calculada uma vez: cada passo
+        # vira uma leitura na tabela, sem verificar limites nem paredes
+        self._transicoes = construir_tabela_de_transicoes(paredes)
+        self._transicoes_do_kernel = preparar_para_kernel(self._transicoes)
+        self._coordenadas = np.indices(paredes.shape, dtype=np.int32).reshape(2, -1).T.copy()
+        self._rastro = np.zeros(self._grade.shape, dtype=bool)
+        self._matriz_em_texto: list[list[str]] | None = None
+
+        # Texto do __str__, montado uma vez: cada chamada só reescreve as
+        # células do agente e da saída, sem recriar a matriz inteira
+        # Um único array (linhas, 2 * colunas) de códigos Unicode: cada célula
+        # seguida de um espaço, e a última coluna é a quebra de linha
+        texto = np.full((paredes.shape[0], 2 * paredes.shape[1]), ord(" "), dtype=np.uint32)
+        texto[:, ::2] = np.where(paredes, ord("#"), ord(" "))
+        texto[:, -1] = ord("\n")
+        self._texto = texto
+        self._agente_no_texto: Posicao | None = None
+
+        self._numero_linhas, self._numero_colunas = self._grade.shape
+        self._bordas_da_grade = _montar_bordas_da_grade(self._numero_colunas)
         self.estado_inicial = ponto_inicial
         self.ponto_final = ponto_final
-        self.posicao_agente = self.estado_inicial
-        self._numero_linhas = len(self._matriz)
-        self._numero_colunas = len(self._matriz[0])
+        # As posições são guardadas como um único inteiro (índice linear):
+        # chegar na saída é uma comparação de inteiros, sem tuplas
+        self._celula_inicial = self._indice_linear(ponto_inicial)
+        self._celula_final = self._indice_linear(ponto_final)
+        self._celula_agente = self._celula_inicial
+        self._recompensa_final = 10.0 * (self._numero_linhas * self._numero_colunas)
+
+        self._celulas = np.empty(0, dtype=np.int32)
+
+        # Uma chamada de aquecimento: a compilação (ou leitura do cache) do
+        # kernel acontece aqui, e não no primeiro passo do primeiro episódio
+        calcular_transicao(self._transicoes_do_kernel, 0, 0, self._celula_final, self._recompensa_final)
+
+    @property
+    def posicao_agente(self) -> Posicao:
+        """A posição (linha, coluna) atual do agente."""
+        return divmod(self._celula_agente, self._numero_colunas)
+
+    @posicao_agente.setter
+    def posicao_agente(self, posicao: Posicao) -> None:
+        self._celula_agente = self._indice_linear(posicao)
+
+    @property
+    def posicoes(self) -> np.ndarray:
+        """Posições dos agentes da execução em lote, array int32 (N, 2)."""
+        return self.posicoes_das_celulas(self._celulas)
+
+    @property
+    def matriz(self) -> list[list[str]]:
+        """
+        A grade no formato de strings, para exibição (terminal e Pygame).
+
+        É montada a partir da grade uint8 apenas quando alguém a pede, e
+        guardada até o rastro do agente mudar. Não altere a lista devolvida.
+
+        Returns:
+            list[list[str]]: Matriz com ' ' (caminho), '#' (parede) e '•' (rastro).
+        """
+        if self._matriz_em_texto is None:
+            caracteres = np.where(self._grade == PAREDE, "#", np.where(self._rastro, "•", " "))
+            self._matriz_em_texto = caracteres.tolist()
+        return self._matriz_em_texto
 
     def reiniciar(self) -> Posicao:
         """
@@ -111,150 +303,197 @@ class Labirinto:
         Returns:
             Posicao: O estado inicial do agente após reiniciar.
         """
-        self.posicao_agente = self.estado_inicial
-        return self.posicao_agente
+        self._celula_agente = self._celula_inicial
+        return self.estado_inicial
 
-    def executar_acao(self, acao: AcaoUsuario) -> tuple[Posicao, float, bool]:
+    def celulas_iniciais(self, numero_de_agentes: int) -> np.ndarray:
         """
-        Executa uma ação e atualiza o estado do ambiente.
-
-        É como um jogador fazer um movimento na dungeon: o ambiente processa
-        a ação, atualiza o estado, verifica se chegou na saída e retorna as
-        informações necessárias para o aprendizado.
+        Devolve as células (índices lineares) de `numero_de_agentes` agentes no início.
 
-        Aceita tanto teclas WASD quanto nomes completos (cima, baixo, esquerda, direita).
+        Não altera o Labirinto: as células ficam com quem as pediu.
 
         Args:
-            acao (AcaoUsuario): A ação a ser executada ('W'/'w'/'cima', 'S'/'s'/'baixo',
-                'A'/'a'/'esquerda', 'D'/'d'/'direita').
+            numero_de_agentes (int): Quantidade de agentes avançados juntos.
 
         Returns:
-            tuple[Posicao, float, bool]: Uma tupla contendo:
-                - O novo estado (a nova posição do agente).
-                - A recompensa recebida por realizar a ação.
-                - Um booleano indicando se o episódio terminou (agente na saída).
-
-        Raises:
-            ValueError: Se a ação fornecida for inválida.
+            np.ndarray: Array int32 (N,) com a célula inicial de cada agente.
         """
-        # Valida se a ação está no mapeamento
-        if acao not in ACOES_VALIDAS:
-            raise ValueError(
-                f'Ação inválida: "{acao}". Use: W/A/S/D (ou cima/baixo/esquerda/direita)'
-            )
+        return np.full(numero_de_agentes, self._celula_inicial, dtype=np.int32)
 
-        # Normaliza a ação para o formato padrão interno
-        direcao_padrao = self._normalizar_acao(acao)
-
-        proxima_posicao = self._calcular_proxima_posicao(direcao_padrao)
-
-        if self._eh_posicao_valida(proxima_posicao):
-            self._matriz[self.posicao_agente[0]][self.posicao_agente[1]] = "•"
-            self.posicao_agente = proxima_posicao
-
-        recompensa = self._calcular_recompensa()
-        terminou = self._verificar_se_chegou_no_final()
-
-        return self.posicao_agente, recompensa, terminou
-
-    def _normalizar_acao(self, acao: AcaoUsuario) -> DirecaoPadrao:
+    def posicoes_das_celulas(self, celulas: np.ndarray) -> np.ndarray:
         """
-        Normaliza a entrada do usuário para o formato padrão interno.
-
-        Converte teclas WASD (maiúsculas ou minúsculas) para as direções
-        padronizadas que o código usa internamente. Isso mantém o código
-        legível enquanto permite entradas amigáveis ao usuário.
+        Converte células (índices lineares) em posições (linha, coluna).
 
         Args:
-            acao (AcaoUsuario): A ação fornecida pelo usuário.
+            celulas (np.ndarray): Array (N,) de índices lineares.
 
         Returns:
-            DirecaoPadrao: A direção normalizada.
+            np.ndarray: Posições das células, array int32 (N, 2).
         """
-        return MAPEAMENTO_TECLAS[acao]
+        return self._coordenadas[celulas]
 
-    def _calcular_proxima_posicao(self, direcao: DirecaoPadrao) -> Posicao:
+    def avancar_celulas(
+        self, celulas: np.ndarray, acoes: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
-        Calcula a posição resultante de uma ação, sem mover o agente.
+        Calcula o passo de um lote de agentes, sem alterar o Labirinto.
 
-        É como simular o movimento antes de executá-lo de fato. Útil para
-        verificar se a posição é válida antes de atualizar o estado.
+        Segue as mesmas regras de executar_acao(): movimentos para fora do
+        labirinto ou contra paredes deixam o agente no lugar, e a recompensa
+        é a da saída ou a penalidade de passo. O rastro ('•') só é desenhado
+        pelo agente individual.
 
         Args:
-            direcao (DirecaoPadrao): A direção normalizada.
+            celulas (np.ndarray): Array (N,) com a célula atual de cada agente.
+            acoes (np.ndarray): Array (N,) com um valor de Acao por agente.
 
         Returns:
-            Posicao: A posição resultante da ação.
+            tuple[np.ndarray, np.ndarray, np.ndarray]: Uma tupla contendo:
+                - As novas células dos agentes, array int32 (N,).
+                - As recompensas de cada agente, array float64 (N,).
+                - Um array bool (N,) indicando quais agentes estão na saída.
         """
-        linha_atual, coluna_atual = self.posicao_agente
+        # Uma única leitura na tabela de transições para todos os agentes
+        novas_celulas = self._transicoes[celulas, acoes]
 
-        if direcao == "cima":
-            return (linha_atual - 1, coluna_atual)
-        if direcao == "baixo":
-            return (linha_atual + 1, coluna_atual)
-        if direcao == "esquerda":
-            return (linha_atual, coluna_atual - 1)
-        if direcao == "direita":
-            return (linha_atual, coluna_atual + 1)
+        # Chegar na saída é uma comparação de inteiros, e a recompensa sai dela
+        terminados = novas_celulas == self._celula_final
+        recompensas = np.where(terminados, self._recompensa_final, PENALIDADE_PASSO)
 
-        return self.posicao_agente
+        return novas_celulas, recompensas, terminados
 
-    def _eh_posicao_valida(self, posicao: Posicao) -> bool:
+    def reiniciar_lote(self, numero_de_agentes: int) -> np.ndarray:
         """
-        Verifica se uma posição está dentro dos limites e não é uma parede.
-
-        É como verificar se o jogador pode andar naquela célula da dungeon
-        ou se há um obstáculo bloqueando o caminho.
+        Coloca `numero_de_agentes` agentes na posição inicial, para a execução em lote.
 
         Args:
-            posicao (Posicao): A posição a ser verificada (linha, coluna).
+            numero_de_agentes (int): Quantidade de agentes avançados juntos.
 
         Returns:
-            bool: True se a posição é válida, False caso contrário.
+            np.ndarray: Posições iniciais dos agentes, array int32 (N, 2).
         """
-        linha, coluna = posicao
+        self._celulas = self.celulas_iniciais(numero_de_agentes)
+        return self.posicoes
 
-        # Verifica se está dentro dos limites verticais
-        if not (0 <= linha < self._numero_linhas):
-            return False
+    def executar_acoes_em_lote(self, acoes: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Executa uma ação para cada agente do lote, todos de uma só vez.
 
-        # Verifica se está dentro dos limites horizontais
-        if not (0 <= coluna < self._numero_colunas):
-            return False
+        É o avancar_celulas() sobre o lote guardado no próprio Labirinto
+        (criado por reiniciar_lote()).
 
-        # Verifica se não é uma parede
-        if self._matriz[linha][coluna] == "#":
-            return False
+        Args:
+            acoes (np.ndarray): Array (N,) com um valor de Acao por agente.
 
-        return True
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: Uma tupla contendo:
+                - As novas posições dos agentes, array int32 (N, 2).
+                - As recompensas de cada agente, array float64 (N,).
+                - Um array bool (N,) indicando quais agentes estão na saída.
+        """
+        self._celulas, recompensas, terminados = self.avancar_celulas(self._celulas, acoes)
+        return self.posicoes, recompensas, terminados
 
-    def _calcular_recompensa(self) -> float:
+    def executar_acao(self, acao: AcaoUsuario | Acao) -> tuple[Posicao, float, bool]:
         """
-        Calcula a recompensa com base na posição atual do agente.
+        Executa uma ação e atualiza o estado do ambiente.
 
-        Sistema de recompensas:
+        É como um jogador fazer um movimento na dungeon: o ambiente processa
+        a ação, atualiza o estado, verifica se chegou na saída e retorna as
+        informações necessárias para o aprendizado.
+
+        Aceita tanto teclas WASD quanto nomes completos (cima, baixo, esquerda, direita)
+        e os membros de Acao.
+
+        Sistema de recompensas (é como ganhar XP no Ragnarok: você ganha muito
+        ao completar o objetivo, mas perde um pouco a cada passo):
         - +10.0 * (tamanho da matriz): Chegou na saída (objetivo alcançado!)
         - -0.1: Qualquer outro movimento (incentiva caminhos mais curtos)
 
-        É como ganhar XP no Ragnarok: você ganha muito ao completar o objetivo,
-        mas perde um pouco a cada passo para incentivar eficiência.
+        Args:
+            acao (AcaoUsuario | Acao): A ação a ser executada ('W'/'w'/'cima'/Acao.CIMA,
+                'S'/'s'/'baixo'/Acao.BAIXO, 'A'/'a'/'esquerda'/Acao.ESQUERDA,
+                'D'/'d'/'direita'/Acao.DIREITA).
 
         Returns:
-            float: A recompensa calculada.
+            tuple[Posicao, float, bool]: Uma tupla contendo:
+                - O novo estado (a nova posição do agente).
+                - A recompensa recebida por realizar a ação.
+                - Um booleano indicando se o episódio terminou (agente na saída).
+
+        Raises:
+            ValueError: Se a ação fornecida for inválida.
         """
-        if self._verificar_se_chegou_no_final():
-            return 10.0 * (self._numero_linhas * self._numero_colunas)
+        # Traduz e valida a ação: um membro de Acao já é o inteiro do kernel;
+        # qualquer outra coisa (incluindo ints e bools) precisa ser uma tecla
+        # ou nome do mapeamento, com uma única consulta ao dicionário
+        if isinstance(acao, Acao):
+            indice_acao = int(acao)
         else:
-            return -0.1
-
-    def _verificar_se_chegou_no_final(self) -> bool:
+            try:
+                indice_acao = INDICES_ACOES[acao]
+            except KeyError:
+                raise ValueError(
+                    f'Ação inválida: "{acao}". Use: W/A/S/D (ou cima/baixo/esquerda/direita)'
+                ) from None
+
+        # A transição é lida da tabela pelo kernel, com a ação já como inteiro
+        celula = self._celula_agente
+        nova_celula, recompensa, terminou = calcular_transicao(
+            self._transicoes_do_kernel, celula, indice_acao, self._celula_final, self._recompensa_final
+        )
+
+        if nova_celula != celula:
+            self._marcar_rastro(*divmod(celula, self._numero_colunas))
+            self._celula_agente = nova_celula
+
+        # divmod já devolve a tupla (linha, coluna): é a única alocação da
+        # posição, sem passar pela property posicao_agente
+        return divmod(nova_celula, self._numero_colunas), recompensa, terminou
+
+    def executar_sequencia(self, acoes: Iterable[AcaoUsuario | Acao] | np.ndarray) -> tuple[Posicao, float, int, bool]:
         """
-        Verifica se o agente chegou ao ponto final.
+        Executa uma sequência de ações de uma só vez, parando se chegar na saída.
+
+        O resultado é o mesmo de chamar executar_acao() para cada ação
+        (inclusive o rastro), mas a sequência inteira roda em uma única
+        chamada ao kernel executar_episodio.
+
+        Args:
+            acoes (Iterable[AcaoUsuario | Acao] | np.ndarray): As ações, na
+                ordem. Um array NumPy é tratado como valores de Acao já
+                convertidos (como os de converter_acoes()).
 
         Returns:
-            bool: True se chegou na saída, False caso contrário.
+            tuple[Posicao, float, int, bool]: Uma tupla contendo:
+                - A posição final do agente.
+                - A soma das recompensas da sequência.
+                - Quantas ações foram executadas (menos que len(acoes) se
+                  o agente chegou na saída antes do fim).
+                - Um booleano indicando se o agente chegou na saída.
+
+        Raises:
+            ValueError: Se alguma ação for inválida.
         """
-        return self.posicao_agente == self.ponto_final
+        if isinstance(acoes, np.ndarray):
+            # O kernel espera inteiros: um array vazio (float64 por padrão)
+            # ou de outro tipo é convertido para int8, sem cópia se já for int8
+            acoes = np.asarray(acoes, dtype=np.int8)
+        else:
+            acoes = converter_acoes(acoes)
+
+        celulas_deixadas = np.empty(len(acoes), dtype=np.int64)
+        celula, recompensa_total, passos, numero_deixadas, terminou = executar_episodio(
+            self._transicoes_do_kernel, self._celula_agente, preparar_para_kernel(acoes),
+            self._celula_final, self._recompensa_final, celulas_deixadas
+        )
+
+        # Marca o rastro de todas as células deixadas de uma vez
+        if numero_deixadas:
+            self._marcar_rastro(*np.divmod(celulas_deixadas[:numero_deixadas], self._numero_colunas))
+        self._celula_agente = int(celula)
+
+        return self.posicao_agente, float(recompensa_total), int(passos), bool(terminou)
 
     def __str__(self) -> str:
         """
@@ -272,23 +511,53 @@ class Labirinto:
         Returns:
             str: Representação visual do labirinto.
         """
-        # Cria uma cópia profunda da matriz para não modificar o original
-        matriz_para_exibicao = [list(linha) for linha in self._matriz]
+        # Devolve a célula marcada com 'A' na última chamada ao seu caractere
+        # original (o agente pode ter sido reposicionado sem andar)
+        if self._agente_no_texto is not None:
+            self._escrever_no_texto(self._agente_no_texto, self._caractere_da_celula(*self._agente_no_texto))
+
+        # Marca o agente e depois a saída, só as duas células mudam
+        self._escrever_no_texto(self.posicao_agente, "A")
+        self._escrever_no_texto(self.ponto_final, "S")
+        self._agente_no_texto = self.posicao_agente
+
+        # Uma única cópia contígua e uma decodificação (sem a última quebra de linha)
+        return self._texto.reshape(-1)[:-1].tobytes().decode(_CODIFICACAO_TEXTO)
+
+    def _indice_linear(self, posicao: Posicao) -> int:
+        """
+        Converte uma posição (linha, coluna) no índice linear da célula.
+        """
+        linha, coluna = posicao
+        return linha * self._numero_colunas + coluna
+
+    def _caractere_da_celula(self, linha: int, coluna: int) -> str:
+        """
+        Retorna o caractere de uma célula na exibição: '#', '•' (rastro) ou ' '.
+        """
+        if self._grade[linha, coluna] == PAREDE:
+            return "#"
+        return "•" if self._rastro[linha, coluna] else " "
 
-        # Marca a posição do agente
-        linha_agente, coluna_agente = self.posicao_agente
-        matriz_para_exibicao[linha_agente][coluna_agente] = "A"
+    def _escrever_no_texto(self, posicao: Posicao, caractere: str) -> None:
+        """
+        Escreve um caractere na célula `posicao` do texto guardado para o __str__.
 
-        # Marca a saída
-        linha_saida, coluna_saida = self.ponto_final
-        matriz_para_exibicao[linha_saida][coluna_saida] = "S"
+        A célula da coluna c fica na coluna 2 * c do texto (há um espaço
+        entre as células).
+        """
+        linha, coluna = posicao
+        self._texto[linha, 2 * coluna] = ord(caractere)
 
-        # Formata cada linha com espaçamento entre células
-        linhas_formatadas = [
-            " ".join(celula for celula in linha) for linha in matriz_para_exibicao
-        ]
+    def _marcar_rastro(self, linha: int | np.ndarray, coluna: int | np.ndarray) -> None:
+        """
+        Marca a célula como visitada no rastro e nas visões em texto guardadas.
 
-        return "\n".join(linhas_formatadas)
+        Também aceita arrays de linhas e colunas, para marcar várias células de uma vez.
+        """
+        self._rastro[linha, coluna] = True
+        self._matriz_em_texto = None
+        self._escrever_no_texto((linha, coluna), "•")
 
     def imprimir_labirinto(lab):
         """
@@ -305,7 +574,7 @@ class Labirinto:
 
         try:
             # Cria uma cópia da matriz para "desenhar" nela
-            visualizacao = [list(linha) for linha in lab._matriz]
+            visualizacao = [list(linha) for linha in lab.matriz]
             linhas = len(visualizacao)
             if linhas == 0:
                 print("Labirinto vazio.")
@@ -333,46 +602,24 @@ class Labirinto:
         if 0 <= pos_agente[0] < linhas and 0 <= pos_agente[1] < colunas:
             visualizacao[pos_agente[0]][pos_agente[1]] = "A"
 
-        # --- Caracteres de Desenho (Baseado na sua sugestão) ---
-        BARRA_H = "───"  # A barra horizontal que você pediu
-        BARRA_V = "│"
-
-        # Cantos
-        CANTO_SE = "┌"
-        CANTO_SD = "┐"
-        CANTO_IE = "└"
-        CANTO_ID = "┘"
-
-        # Junções
-        JUNCAO_CIMA = "┬"
-        JUNCAO_BAIXO = "┴"
-        JUNCAO_ESQ = "├"
-        JUNCAO_DIR = "┤"
-        JUNCAO_MEIO = "┼"  # A junção que você pediu
-
         # --- Lógica de Impressão da Grade ---
+        # O quadro inteiro é montado em uma lista de linhas e escrito com um
+        # único sys.stdout.write: uma escrita no terminal por quadro, em vez
+        # de um print (uma escrita) por linha. As bordas não mudam e foram
+        # montadas uma vez só, na criação do labirinto.
+        linha_superior, linha_meio, linha_inferior = lab._bordas_da_grade
 
         # 1. Linha Superior (Ex: ┌───┬───┬───┐)
-        linha_superior = CANTO_SE + JUNCAO_CIMA.join([BARRA_H] * colunas) + CANTO_SD
-        print(linha_superior)
+        quadro = [linha_superior]
 
-        # 2. Loop pelas linhas de conteúdo e separadores
+        # 2. Linhas de conteúdo (Ex: │ A │ # │ F │) intercaladas com as
+        # separadoras (Ex: ├───┼───┼───┤). Usamos " {c} " para centralizar
+        # (3 caracteres, igual à BARRA_H).
         for i, linha in enumerate(visualizacao):
-
-            # Linha de Conteúdo (Ex: │ A │ # │ F │)
-            # Usamos " {c} " para centralizar (3 caracteres, igual ao BARRA_H)
-            celulas_conteudo = [f" {c} " for c in linha]
-            linha_conteudo = BARRA_V + BARRA_V.join(celulas_conteudo) + BARRA_V
-            print(linha_conteudo)
-
-            # Linha Separadora (se não for a última)
-            # Ex: ├───┼───┼───┤
-            if i < linhas - 1:
-                linha_meio = (
-                    JUNCAO_ESQ + JUNCAO_MEIO.join([BARRA_H] * colunas) + JUNCAO_DIR
-                )
-                print(linha_meio)
+            if i > 0:
+                quadro.append(linha_meio)
+            quadro.append(BARRA_V + BARRA_V.join(f" {c} " for c in linha) + BARRA_V)
 
         # 3. Linha Inferior (Ex: └───┴───┴───┘)
-        linha_inferior = CANTO_IE + JUNCAO_BAIXO.join([BARRA_H] * colunas) + CANTO_ID
-        print(linha_inferior)
+        quadro.append(linha_inferior)
+        sys.stdout.write("\n".join(quadro) + "\n")
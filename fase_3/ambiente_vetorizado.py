@@ -0,0 +1,136 @@
+"""
+Módulo: 🧩 ambiente_vetorizado.py
+Projeto: 📘 AI Game Learning (Fase 3 - Labirinto)
+
+Este módulo implementa o LabirintoVetorizado: N cópias do mesmo labirinto
+avançadas juntas, com reinício automático dos episódios ("autoreset").
+
+Por que isso importa? Com um único Labirinto, o treinamento precisa de um
+laço Python por episódio: executar_acao() a cada passo e reiniciar() ao
+chegar na saída. Aqui, cada chamada a executar_acoes() avança os N agentes
+de uma vez (o passo em lote sem estado do Labirinto, avancar_celulas), e os
+agentes que terminaram o episódio voltam à posição inicial no mesmo passo,
+com uma máscara booleana, sem recriar nada e sem chamar reiniciar() um a um.
+
+Como as posições devolvidas já são as do novo episódio, a posição em que
+cada episódio terminou é guardada separadamente em info["observacao_final"],
+como nos ambientes vetorizados de Aprendizado por Reforço.
+
+O jogo interativo (Pygame) continua usando o Labirinto e executar_acao();
+este módulo é só para o treinamento.
+"""
+
+import numpy as np
+
+from .ambiente import Labirinto
+
+
+class LabirintoVetorizado:
+    """
+    Avança N agentes no mesmo labirinto, reiniciando os episódios terminados.
+
+    A grade, a tabela de transições e a saída são as do Labirinto
+    recebido (compartilhadas, não copiadas). As células dos agentes e os
+    contadores de passos ficam aqui, e não no Labirinto: o passo usa o
+    avancar_celulas() do Labirinto, que não guarda estado. Por isso, vários
+    LabirintoVetorizado (ou o próprio lote do Labirinto) podem usar o mesmo
+    Labirinto sem um sobrescrever as posições do outro.
+
+    Attributes:
+        labirinto (Labirinto): Labirinto compartilhado pelos N agentes.
+        numero_de_ambientes (int): Quantidade de agentes avançados juntos.
+        maximo_de_passos (int | None): Horizonte dos episódios. Um episódio
+            que chega a esse número de passos sem encontrar a saída é
+            truncado e reiniciado. None = sem limite.
+        passos (np.ndarray): Array int64 (N,) com os passos do episódio
+            atual de cada agente.
+
+    Example:
+        >>> ambientes = LabirintoVetorizado(labirinto, numero_de_ambientes=64)
+        >>> posicoes = ambientes.reiniciar()
+        >>> acoes = np.random.default_rng().integers(4, size=64)
+        >>> posicoes, recompensas, terminados, truncados, info = ambientes.executar_acoes(acoes)
+    """
+
+    def __init__(self, labirinto: Labirinto, numero_de_ambientes: int, maximo_de_passos: int | None = None):
+        """
+        Cria os N ambientes a partir de um Labirinto já montado.
+
+        Args:
+            labirinto (Labirinto): O labirinto em que todos os agentes andam.
+            numero_de_ambientes (int): Quantidade de agentes avançados juntos.
+            maximo_de_passos (int | None): Horizonte dos episódios (None = sem limite).
+
+        Raises:
+            ValueError: Se o número de ambientes ou o máximo de passos não for positivo.
+        """
+        if numero_de_ambientes < 1:
+            raise ValueError("O número de ambientes deve ser positivo.")
+        if maximo_de_passos is not None and maximo_de_passos < 1:
+            raise ValueError("O máximo de passos deve ser positivo.")
+
+        self.labirinto = labirinto
+        self.numero_de_ambientes = numero_de_ambientes
+        self.maximo_de_passos = maximo_de_passos
+        self._posicao_inicial = np.array(labirinto.estado_inicial, dtype=np.int32)
+        self._celulas_iniciais = labirinto.celulas_iniciais(numero_de_ambientes)
+        self._celulas = self._celulas_iniciais.copy()
+        self.passos = np.zeros(numero_de_ambientes, dtype=np.int64)
+        self.reiniciar()
+
+    @property
+    def posicoes(self) -> np.ndarray:
+        """Posições atuais dos agentes, array int32 (N, 2)."""
+        return self.labirinto.posicoes_das_celulas(self._celulas)
+
+    def reiniciar(self) -> np.ndarray:
+        """
+        Reinicia todos os episódios, com os N agentes na posição inicial.
+
+        Returns:
+            np.ndarray: Posições iniciais dos agentes, array int32 (N, 2).
+        """
+        self.passos[:] = 0
+        self._celulas[:] = self._celulas_iniciais
+        return self.posicoes
+
+    def executar_acoes(self, acoes: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, dict]:
+        """
+        Executa uma ação por agente e reinicia os episódios que terminaram.
+
+        Args:
+            acoes (np.ndarray): Array (N,) com um valor de Acao por agente.
+
+        Returns:
+            tuple: Uma tupla (posicoes, recompensas, terminados, truncados, info):
+                - posicoes: array int32 (N, 2) com as posições após o passo;
+                  quem terminou o episódio já está de volta ao início.
+                - recompensas: array float64 (N,) com a recompensa do passo.
+                - terminados: array bool (N,), True para quem chegou na saída.
+                - truncados: array bool (N,), True para quem atingiu o
+                  máximo de passos sem chegar na saída.
+                - info: dicionário com "observacao_final", um array int32
+                  (N, 2) com a posição em que cada agente estava ao fim do
+                  passo (antes do reinício). Só é relevante onde terminados
+                  ou truncados for True.
+        """
+        self._celulas, recompensas, terminados = self.labirinto.avancar_celulas(self._celulas, acoes)
+        posicoes = self.posicoes
+        self.passos += 1
+
+        if self.maximo_de_passos is None:
+            truncados = np.zeros_like(terminados)
+        else:
+            truncados = (self.passos >= self.maximo_de_passos) & ~terminados
+
+        # Autoreset: só os agentes cujo episódio acabou voltam ao início
+        encerrados = terminados | truncados
+        if encerrados.any():
+            observacao_final = posicoes.copy()
+            posicoes[encerrados] = self._posicao_inicial
+            self._celulas[encerrados] = self._celulas_iniciais[encerrados]
+            self.passos[encerrados] = 0
+        else:
+            observacao_final = posicoes
+
+        return posicoes, recompensas, terminados, truncados, {"observacao_final": observacao_final}
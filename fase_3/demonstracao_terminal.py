@@ -11,14 +11,21 @@ Funcionalidades:
 2. Permite que um jogador humano jogue o labirinto via terminal.
 3. Rastreia estatísticas (movimentos, tempo, recompensa acumulada).
 4. Demonstra o reinício do ambiente e o tratamento de ações inválidas.
+5. Resolve o labirinto sozinho, com o caminho mais curto calculado por uma busca em largura.
 """
 
 import time
 from typing import List, Dict, Any
 
 # Importa as ferramentas necessárias: o gerador e o ambiente.
-from .gerador_labirinto import gerar_labirinto
-from .ambiente import Labirinto, Posicao
+from .gerador_labirinto import gerar_grade_labirinto
+from .ambiente import ACOES_VALIDAS, Labirinto, Posicao, converter_acoes
+from .planejador import busca_em_largura
+
+# Mensagens de depuração a cada ação (desligadas por padrão). O labirinto e
+# o placar já são exibidos a cada turno; escrever no terminal é lento, então
+# o rastro detalhado de cada passo só aparece quando pedido.
+VERBOSE = False
 
 
 class EstatisticasJogo:
@@ -48,6 +55,18 @@ class EstatisticasJogo:
         self.recompensa_acumulada += recompensa
         self.historico_movimentos.append({'acao': acao, 'recompensa': recompensa})
     
+    def registrar_sequencia(self, acoes: str, recompensa_total: float) -> None:
+        """
+        Registra uma sequência de movimentos executada de uma só vez.
+
+        Args:
+            acoes (str): As teclas executadas (ex: "ddss")
+            recompensa_total (float): A soma das recompensas da sequência
+        """
+        self.numero_movimentos += len(acoes)
+        self.recompensa_acumulada += recompensa_total
+        self.historico_movimentos.append({'acao': acoes, 'recompensa': recompensa_total})
+
     def obter_tempo_decorrido(self) -> float:
         """
         Calcula o tempo decorrido desde o início.
@@ -97,6 +116,7 @@ def jogar_no_terminal(ambiente: Labirinto) -> None:
     
     print("\n--- 🕹️ Modo de Jogo Interativo ---")
     print("Use as teclas W (cima), A (esquerda), S (baixo), D (direita) para mover.")
+    print("Você pode digitar várias teclas de uma vez (ex: 'ddss').")
     print("Digite 'sair' para terminar o jogo.")
     print("Digite 'stats' para ver estatísticas.")
     print("Digite 'limpar' para limpar a tela.\n")
@@ -124,12 +144,20 @@ def jogar_no_terminal(ambiente: Labirinto) -> None:
             limpar_tela()
             continue
 
-        # Processa movimento normal
+        # Processa o movimento: uma ação ou uma sequência de teclas ("ddss").
+        # A sequência é traduzida para inteiros uma única vez e executada
+        # inteira em uma só chamada ao kernel.
         try:
-            _, recompensa, terminou = ambiente.executar_acao(acao)
-            stats.registrar_movimento(acao, recompensa)
-            
-            print(f"\n✅ Ação '{acao}' executada. Recompensa: {recompensa}")
+            if acao in ACOES_VALIDAS or not acao:
+                _, recompensa, terminou = ambiente.executar_acao(acao)
+                stats.registrar_movimento(acao, recompensa)
+            else:
+                acoes = converter_acoes(acao)
+                _, recompensa, passos, terminou = ambiente.executar_sequencia(acoes)
+                stats.registrar_sequencia(acao[:passos], recompensa)
+
+            if VERBOSE:
+                print(f"\n✅ Ação '{acao}' executada. Recompensa: {recompensa}")
 
             if terminou:
                 limpar_tela()
@@ -168,7 +196,7 @@ def main() -> None:
     print(f"\n1. Gerando um labirinto de {ALTURA_CELULAS}x{LARGURA_CELULAS} células...")
     
     try:
-        matriz_gerada = gerar_labirinto(ALTURA_CELULAS, LARGURA_CELULAS)
+        matriz_gerada = gerar_grade_labirinto(ALTURA_CELULAS, LARGURA_CELULAS)
 
         # 2. Definição dos Pontos de Início e Fim
         ponto_inicial: Posicao = (1, 1)
@@ -208,6 +236,20 @@ def main() -> None:
         except ValueError as e:
             print(f"   -> Erro capturado com sucesso: {e}")
 
+        # Demonstra a vitória automática: o caminho é calculado a partir da
+        # grade gerada, então funciona para qualquer tamanho de labirinto
+        print("\n3. Resolvendo o labirinto automaticamente (busca em largura)...")
+        ambiente_jogo.reiniciar()
+        acoes_vitoria_completa = busca_em_largura(matriz_gerada, ponto_inicial, ponto_final)
+        if acoes_vitoria_completa is None:
+            print("   -> ⚠️ Nenhum caminho até a saída: o labirinto não tem solução.")
+        else:
+            # A lista de Acao é convertida para int8 dentro de executar_sequencia
+            _, recompensa, passos, terminou = ambiente_jogo.executar_sequencia(acoes_vitoria_completa)
+            ambiente_jogo.imprimir_labirinto()
+            if terminou:
+                print(f"   -> 🎉 Saída encontrada em {passos} passos (recompensa total: {recompensa:.2f}).")
+
         print("\n--- 🏁 Demonstração Concluída ---")
 
     except Exception as e:
@@ -3,84 +3,270 @@
 """
 Módulo responsável por gerar labirintos aleatórios.
 
-Utiliza o algoritmo "Recursive Backtracking" (Busca em Profundidade Recursiva)
+Utiliza o algoritmo "Recursive Backtracking" (Busca em Profundidade)
 para criar labirintos perfeitos, o que significa que sempre haverá um e
 apenas um caminho entre quaisquer dois pontos do labirinto.
 
-A função principal, `gerar_labirinto`, é a única que precisa ser chamada
-de fora deste módulo.
+A busca é feita com uma pilha explícita em vez de recursão: cada chamada
+recursiva do Python custa a criação de um quadro de execução e o limite
+padrão de ~1000 chamadas aninhadas quebrava labirintos grandes com
+RecursionError. Com a pilha, o tamanho do labirinto é limitado apenas pela
+memória.
+
+A geração é reprodutível: a mesma semente sempre gera o mesmo labirinto.
+Os sorteios usam o gerador do NumPy (np.random.default_rng), e não mais o
+random.Random do Python; por isso, cada semente gera hoje um labirinto
+diferente do que gerava nas versões com random.Random.
+
+O labirinto é cavado diretamente em uma grade NumPy uint8 (1 byte por
+célula, com os mesmos valores CAMINHO e PAREDE do ambiente), em vez de uma
+lista de listas de strings (~50 bytes por célula). A função principal,
+`gerar_grade_labirinto`, devolve essa grade, que o `Labirinto` aceita
+diretamente. `gerar_labirinto` continua devolvendo a matriz de strings
+(' ' e '#'), para exibição e compatibilidade.
+
+Como alternativa ao backtracking, o parâmetro `algoritmo="arvore_crescente"`
+usa o algoritmo "Growing Tree" com escolha aleatória na fronteira (o mesmo
+resultado do algoritmo de Prim aleatório): a fronteira fica em um array
+NumPy de índices lineares, a célula sorteada sai dela por troca com a
+última (O(1)) e cada célula é visitada uma única vez, sem os longos
+"voos" de volta da pilha. Também gera labirintos perfeitos, mas com mais
+bifurcações e corredores mais curtos que o backtracking.
 """
 
-import random
-from typing import TypeAlias
+from itertools import permutations
+from typing import Literal, TypeAlias
+
+import numpy as np
+
+from .ambiente import CAMINHO, PAREDE
 
 # Reutilizamos o mesmo apelido de tipo para manter a consistência com o ambiente.
 Posicao: TypeAlias = tuple[int, int]
+AlgoritmoGeracao: TypeAlias = Literal["backtracking", "arvore_crescente"]
+
+# As quatro direções possíveis (Norte, Sul, Leste, Oeste), pulando de célula em célula.
+DIRECOES: tuple[Posicao, ...] = ((0, 2), (0, -2), (2, 0), (-2, 0))
 
+# Todas as 24 ordens possíveis de visitar as quatro direções. Embaralhar os
+# vizinhos de uma célula é só sortear um índice desta tabela: sem criar uma
+# lista nova e sem o laço de trocas do random.shuffle.
+ORDENS_DOS_VIZINHOS: tuple[tuple[Posicao, ...], ...] = tuple(permutations(DIRECOES))
 
-def gerar_labirinto(altura: int, largura: int, semente: int | None = None) -> list[list[str]]:
+# As mesmas ordens com o deslocamento até a parede entre as células já
+# calculado: (delta_linha, delta_coluna, meio_linha, meio_coluna).
+_ORDENS_COM_PAREDES = tuple(
+    tuple((dl, dc, dl // 2, dc // 2) for dl, dc in ordem) for ordem in ORDENS_DOS_VIZINHOS
+)
+
+# As quatro direções em coordenadas de célula (um passo de célula = 2 posições da grade)
+DIRECOES_CELULA: tuple[Posicao, ...] = ((0, 1), (0, -1), (1, 0), (-1, 0))
+
+
+def gerar_labirinto(
+    altura: int, largura: int, semente: int | None = None, algoritmo: AlgoritmoGeracao = "backtracking"
+) -> list[list[str]]:
     """
     Gera uma matriz de labirinto aleatório usando o algoritmo Recursive Backtracking.
 
+    É a versão em strings de `gerar_grade_labirinto`: o mesmo labirinto,
+    convertido apenas na saída.
+
     Args:
         altura (int): O número de células de caminho na vertical.
         largura (int): O número de células de caminho na horizontal.
         semente (int | None): Semente para o gerador de números aleatórios. 
                               Se fornecido, o labirinto será sempre o mesmo para a mesma semente.
+        algoritmo (AlgoritmoGeracao): "backtracking" (padrão) ou "arvore_crescente".
 
     Returns:
         list[list[str]]: Uma matriz representando o labirinto, onde ' ' é
                          caminho e '#' é parede.
     """
+    grade = gerar_grade_labirinto(altura, largura, semente, algoritmo)
+    return np.where(grade == PAREDE, '#', ' ').tolist()
+
+
+def gerar_grade_labirinto(
+    altura: int, largura: int, semente: int | None = None, algoritmo: AlgoritmoGeracao = "backtracking"
+) -> np.ndarray:
+    """
+    Gera a grade uint8 de um labirinto aleatório.
+
+    Por padrão usa o Recursive Backtracking; com algoritmo="arvore_crescente",
+    usa o Growing Tree com fronteira em array NumPy.
+
+    Args:
+        altura (int): O número de células de caminho na vertical.
+        largura (int): O número de células de caminho na horizontal.
+        semente (int | None): Semente para o gerador de números aleatórios.
+                              Se fornecido, o labirinto será sempre o mesmo para a mesma semente.
+        algoritmo (AlgoritmoGeracao): "backtracking" (padrão) ou "arvore_crescente".
+
+    Returns:
+        np.ndarray: Grade uint8 (altura * 2 + 1, largura * 2 + 1), onde
+                    CAMINHO (0) é caminho e PAREDE (1) é parede.
+
+    Raises:
+        ValueError: Se o algoritmo não for conhecido.
+    """
+    if algoritmo not in ALGORITMOS:
+        raise ValueError(f'Algoritmo inválido: "{algoritmo}". Use: {", ".join(ALGORITMOS)}')
+
     # Instância local do gerador de números aleatórios para não afetar o global
-    rng = random.Random(semente)
+    rng = np.random.default_rng(semente)
 
     # A fórmula é: tamanho_real = tamanho_celula * 2 + 1.
     altura_matriz = altura * 2 + 1
     largura_matriz = largura * 2 + 1
 
     # Começamos com um bloco sólido de paredes.
-    matriz = [['#' for _ in range(largura_matriz)] for _ in range(altura_matriz)]
+    grade = np.full((altura_matriz, largura_matriz), PAREDE, dtype=np.uint8)
 
     # O algoritmo precisa começar a "cavar" de algum lugar.
-    linha_inicial = rng.randrange(1, altura_matriz, 2)
-    coluna_inicial = rng.randrange(1, largura_matriz, 2)
+    # (as células de caminho ficam nas linhas e colunas ímpares)
+    linha_inicial = 2 * int(rng.integers(altura)) + 1
+    coluna_inicial = 2 * int(rng.integers(largura)) + 1
 
     # A primeira célula é marcada como um caminho.
-    matriz[linha_inicial][coluna_inicial] = ' '
+    grade[linha_inicial, coluna_inicial] = CAMINHO
 
-    # Chamamos a função auxiliar recursiva
-    _percorrer_recursivamente(linha_inicial, coluna_inicial, matriz, rng)
+    # Chamamos a função auxiliar que "cava" o restante do labirinto
+    ALGORITMOS[algoritmo](linha_inicial, coluna_inicial, grade, rng)
 
-    return matriz
+    return grade
 
 
-def _percorrer_recursivamente(linha: int, coluna: int, matriz: list[list[str]], rng: random.Random) -> None:
+def _percorrer_com_pilha(linha: int, coluna: int, grade: np.ndarray, rng: np.random.Generator) -> None:
     """
-    Função auxiliar que "esculpe" o labirinto recursivamente.
+    Função auxiliar que "esculpe" o labirinto em profundidade, com uma pilha explícita.
+
+    Cada item da pilha guarda uma célula e o iterador dos seus vizinhos
+    (em uma ordem sorteada quando a célula é visitada) ainda não tentados. É
+    exatamente o que a versão recursiva guardava em cada chamada: ao voltar
+    de um beco sem saída, a busca continua do próximo vizinho da célula
+    anterior.
+
+    Cada célula entra na pilha uma única vez, então todas as ordens dos
+    vizinhos são sorteadas de uma vez só, em um único array NumPy.
+    """
+    # Tudo o que não muda durante a busca vira variável local: o CPython lê
+    # locais (LOAD_FAST) bem mais rápido que globais e atributos, e o laço
+    # abaixo roda cerca de 4 vezes por célula do labirinto.
+    numero_linhas, numero_colunas = grade.shape
+    # Inclui as constantes e o builtin iter, que seriam buscados como globais
+    ordens = _ORDENS_COM_PAREDES
+    parede, caminho, iterar = PAREDE, CAMINHO, iter
+    # memoryview da grade: ler e escrever [linha, coluna] devolve e recebe
+    # ints do Python, sem criar escalares NumPy a cada acesso.
+    celulas = memoryview(grade)
+
+    numero_de_celulas = (numero_linhas // 2) * (numero_colunas // 2)
+    proximo_sorteio = iter(rng.integers(len(ordens), size=numero_de_celulas).tolist()).__next__
+
+    pilha = [(linha, coluna, iterar(ordens[proximo_sorteio()]))]
+    empilhar = pilha.append
+    desempilhar = pilha.pop
+
+    while pilha:
+        linha, coluna, vizinhos = pilha[-1]
+
+        for delta_linha, delta_coluna, meio_linha, meio_coluna in vizinhos:
+            nova_linha = linha + delta_linha
+            nova_coluna = coluna + delta_coluna
+
+            # Verifica se o vizinho está dentro dos limites da matriz.
+            if 0 < nova_linha < numero_linhas and 0 < nova_coluna < numero_colunas:
+                # Verifica se o vizinho ainda não foi visitado (é parede)
+                if celulas[nova_linha, nova_coluna] == parede:
+                    # Derruba a parede entre a célula atual e o vizinho
+                    celulas[linha + meio_linha, coluna + meio_coluna] = caminho
+
+                    # Marca o vizinho como caminho
+                    celulas[nova_linha, nova_coluna] = caminho
+
+                    # Avança para o vizinho (no lugar da chamada recursiva)
+                    empilhar((nova_linha, nova_coluna, iterar(ordens[proximo_sorteio()])))
+                    break
+        else:
+            # Todos os vizinhos foram tentados: volta para a célula anterior
+            desempilhar()
+
+
+def _crescer_arvore(linha: int, coluna: int, grade: np.ndarray, rng: np.random.Generator) -> None:
     """
-    # Define as quatro direções possíveis (Norte, Sul, Leste, Oeste).
-    vizinhos = [(0, 2), (0, -2), (2, 0), (-2, 0)]
-    rng.shuffle(vizinhos)
-
-    for delta_linha, delta_coluna in vizinhos:
-        nova_linha = linha + delta_linha
-        nova_coluna = coluna + delta_coluna
-
-        # Verifica se o vizinho está dentro dos limites da matriz.
-        if 0 < nova_linha < len(matriz) and 0 < nova_coluna < len(matriz[0]):
-            # Verifica se o vizinho ainda não foi visitado (é parede)
-            if matriz[nova_linha][nova_coluna] == '#':
-                # Derruba a parede entre a célula atual e o vizinho
-                parede_linha = linha + delta_linha // 2
-                parede_coluna = coluna + delta_coluna // 2
-                matriz[parede_linha][parede_coluna] = ' '
-
-                # Marca o vizinho como caminho
-                matriz[nova_linha][nova_coluna] = ' '
-
-                # Recursão
-                _percorrer_recursivamente(nova_linha, nova_coluna, matriz, rng)
+    Função auxiliar que "esculpe" o labirinto com o algoritmo Growing Tree.
+
+    A fronteira guarda os índices lineares (linha * largura + coluna, em
+    coordenadas de célula) das células vizinhas ao labirinto já cavado. A
+    cada passo, uma célula da fronteira é sorteada, ligada a um vizinho
+    sorteado que já está no labirinto e seus vizinhos ainda de fora entram
+    na fronteira. Cada célula entra na fronteira uma única vez.
+    """
+    altura, largura = grade.shape[0] // 2, grade.shape[1] // 2
+    numero_de_celulas = altura * largura
+
+    # Situação de cada célula: FORA (0), NA_FRONTEIRA (1) ou NO_LABIRINTO (2)
+    FORA, NA_FRONTEIRA, NO_LABIRINTO = 0, 1, 2
+    situacao_das_celulas = np.zeros(numero_de_celulas, dtype=np.uint8)
+    fronteira = np.empty(numero_de_celulas, dtype=np.int64)
+
+    # memoryviews: leituras e escritas com ints do Python, sem escalares NumPy
+    celulas = memoryview(grade)
+    situacao = memoryview(situacao_das_celulas)
+    indices = memoryview(fronteira)
+    direcoes, caminho = DIRECOES_CELULA, CAMINHO
+
+    # Cada célula (menos a inicial) usa dois sorteios: a posição na fronteira e o vizinho
+    proximo_sorteio = iter(rng.random(2 * numero_de_celulas).tolist()).__next__
+
+    # A célula inicial (já cavada) é a primeira do labirinto
+    celula = (linha // 2) * largura + coluna // 2
+    situacao[celula] = NO_LABIRINTO
+    tamanho_fronteira = 0
+
+    while True:
+        # Uma única passada pelos vizinhos da célula: os que já estão no
+        # labirinto são candidatos à ligação; os de fora entram na fronteira.
+        linha_celula, coluna_celula = divmod(celula, largura)
+        ligacoes = []
+        for delta_linha, delta_coluna in direcoes:
+            vizinha_linha = linha_celula + delta_linha
+            vizinha_coluna = coluna_celula + delta_coluna
+            if 0 <= vizinha_linha < altura and 0 <= vizinha_coluna < largura:
+                vizinha = vizinha_linha * largura + vizinha_coluna
+                situacao_vizinha = situacao[vizinha]
+                if situacao_vizinha == NO_LABIRINTO:
+                    ligacoes.append((delta_linha, delta_coluna))
+                elif situacao_vizinha == FORA:
+                    situacao[vizinha] = NA_FRONTEIRA
+                    indices[tamanho_fronteira] = vizinha
+                    tamanho_fronteira += 1
+
+        if ligacoes:
+            # Cava a célula e a liga a um vizinho sorteado que já está no labirinto
+            delta_linha, delta_coluna = ligacoes[int(proximo_sorteio() * len(ligacoes))]
+            linha_grade = 2 * linha_celula + 1
+            coluna_grade = 2 * coluna_celula + 1
+            celulas[linha_grade, coluna_grade] = caminho
+            celulas[linha_grade + delta_linha, coluna_grade + delta_coluna] = caminho
+            situacao[celula] = NO_LABIRINTO
+
+        if not tamanho_fronteira:
+            break
+
+        # Sorteia a próxima célula da fronteira e a remove trocando-a pela última
+        posicao = int(proximo_sorteio() * tamanho_fronteira)
+        celula = indices[posicao]
+        tamanho_fronteira -= 1
+        indices[posicao] = indices[tamanho_fronteira]
+
+
+# Funções que cavam o labirinto, por nome do algoritmo
+ALGORITMOS = {
+    "backtracking": _percorrer_com_pilha,
+    "arvore_crescente": _crescer_arvore,
+}
 
 
 if __name__ == '__main__':
@@ -14,12 +14,15 @@ Para personalizar, edite os valores na chamada de main() no final do arquivo.
 
 import random
 from .ambiente import Labirinto
-from .gerador_labirinto import gerar_labirinto
+from .gerador_labirinto import gerar_grade_labirinto
 from .jogo_grafico import JogoGrafico
 
 # --- PENSAMENTO 1: Limites de Seeds ---
 # Definimos o intervalo de seeds que será usado no treinamento da IA.
 # 100 mapas é suficiente para dar variedade sem inviabilizar a Q-Table.
+# Atenção: desde que o gerador passou a sortear com o NumPy, cada seed gera
+# um mapa diferente do que gerava com o random.Random. Q-Tables treinadas
+# com a versão antiga não correspondem aos mapas atuais: treine de novo.
 MIN_SEED = 1
 MAX_SEED = 100
 
@@ -56,7 +59,7 @@ def jogar(
         )
 
     # --- PENSAMENTO 4: Geração do Labirinto ---
-    matriz = gerar_labirinto(altura, largura, semente=seed)
+    matriz = gerar_grade_labirinto(altura, largura, semente=seed)
 
     # --- PENSAMENTO 5: Definição dos Pontos Inicial e Final ---
     # O gerador usa coordenadas ímpares para caminhos, então (1,1) é sempre válido.
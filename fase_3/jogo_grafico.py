@@ -5,8 +5,9 @@ Este módulo contém apenas a lógica de visualização e interação com o usu
 Ele não sabe nada sobre geração de labirintos ou treinamento de IA.
 """
 
+import numpy as np
 import pygame
-from .ambiente import Labirinto
+from .ambiente import CAMINHO, PAREDE, Acao, Labirinto
 
 # --- PENSAMENTO 1: Constantes de Configuração Visual ---
 # Centralizamos todas as cores e configurações visuais aqui para facilitar
@@ -21,25 +22,28 @@ COR_AGENTE = (255, 100, 100)        # Vermelho para o agente
 COR_SAIDA = (100, 255, 100)
 COR_RASTRO = (210, 210, 210, 100)   # Branco translúcido para o rastro
 
+# Paleta indexada pelo valor da célula na grade uint8 (CAMINHO=0, PAREDE=1):
+# PALETA[grade] converte a grade inteira em cores de uma só vez.
+PALETA = np.zeros((2, 3), dtype=np.uint8)
+PALETA[CAMINHO] = COR_CAMINHO
+PALETA[PAREDE] = COR_PAREDE
+
 # Configurações de Jogo
 # Milissegundos entre movimentos (controla velocidade)
 INTERVALO_MOVIMENTO_MS = 100
 
 # --- PENSAMENTO 2: Mapeamento de Teclas ---
 # O Pygame usa constantes específicas para teclas (pygame.K_w, pygame.K_UP, etc).
-# Mapeamos essas teclas para as ações que nosso ambiente entende ("W", "A", "S", "D").
-# Isso permite que o jogador use tanto WASD quanto as setas direcionais.
-MAPEAMENTO_TECLAS = {
-    pygame.K_w: "W",
-    pygame.K_UP: "W",
-    pygame.K_s: "S",
-    pygame.K_DOWN: "S",
-    pygame.K_a: "A",
-    pygame.K_LEFT: "A",
-    pygame.K_d: "D",
-    pygame.K_RIGHT: "D",
-}
-
+# Cada ação do ambiente (Acao, os inteiros que o kernel usa sem converter
+# strings) tem duas teclas: WASD e a seta correspondente. Uma tupla fixa de
+# (tecla, tecla_alternativa, acao) é percorrida a cada frame com só 4 passos
+# e sem dict.items(), parando na primeira ação com tecla pressionada.
+TECLAS_DAS_ACOES = (
+    (pygame.K_w, pygame.K_UP, Acao.CIMA),
+    (pygame.K_s, pygame.K_DOWN, Acao.BAIXO),
+    (pygame.K_a, pygame.K_LEFT, Acao.ESQUERDA),
+    (pygame.K_d, pygame.K_RIGHT, Acao.DIREITA),
+)
 
 class JogoGrafico:
     """
@@ -75,9 +79,9 @@ class JogoGrafico:
 
         # --- PENSAMENTO 4: Cálculo Dinâmico do Tamanho da Janela ---
         # O tamanho da janela depende do tamanho do labirinto. Não queremos valores
-        # fixos, mas sim calcular com base na matriz recebida.
-        num_linhas = len(labirinto._matriz)
-        num_colunas = len(labirinto._matriz[0])
+        # fixos, mas sim calcular com base na grade recebida.
+        num_linhas = len(labirinto._grade)
+        num_colunas = len(labirinto._grade[0])
 
         largura_janela = num_colunas * self.tamanho_celula
         altura_janela = num_linhas * self.tamanho_celula
@@ -92,6 +96,17 @@ class JogoGrafico:
         self.relogio = pygame.time.Clock()  # Controla o FPS
         self.ultimo_movimento = 0  # Timestamp do último movimento (em ms)
 
+        # --- PENSAMENTO 5.1: Fundo Pré-Desenhado ---
+        # Paredes e caminhos não mudam durante o jogo. Desenhamos tudo uma única
+        # vez em uma Surface separada; a cada frame basta copiá-la para a tela
+        # (um único blit) em vez de desenhar cada célula de novo.
+        self._fundo = pygame.Surface((largura_janela, altura_janela))
+        self._desenhar_fundo()
+
+        # Posição e retângulo do agente no frame anterior
+        self._posicao_anterior = None
+        self._rect_agente_anterior = None
+
     def executar(self) -> None:
         """
         Inicia o loop principal do jogo.
@@ -114,10 +129,10 @@ class JogoGrafico:
             self.processar_movimento_continuo()
 
             # --- PENSAMENTO 8: Renderização ---
-            # Primeiro limpamos a tela, depois desenhamos tudo, depois exibimos.
-            self.tela.fill(COR_FUNDO)
-            self._desenhar_labirinto()
-            pygame.display.flip()  # Atualiza a tela com o que foi desenhado
+            # Desenhamos o frame e enviamos para a janela apenas as áreas que
+            # mudaram (a posição antiga e a nova do agente).
+            areas_alteradas = self._desenhar_labirinto()
+            pygame.display.update(areas_alteradas)
 
             # --- PENSAMENTO 9: Controle de FPS ---
             # Limita o jogo a 60 frames por segundo para não consumir CPU desnecessariamente
@@ -133,85 +148,115 @@ class JogoGrafico:
         Usamos um sistema de "cooldown" para evitar que o agente se mova
         rápido demais quando o usuário segura uma tecla.
         """
-        # Pega o estado atual de TODAS as teclas (pressionadas ou não)
-        teclas = pygame.key.get_pressed()
         tempo_atual = pygame.time.get_ticks()
 
         # --- PENSAMENTO 11: Sistema de Cooldown ---
         # Só permitimos um movimento se já passou tempo suficiente desde o último.
         # Isso cria um movimento "suave" e controlado.
         if tempo_atual - self.ultimo_movimento < INTERVALO_MOVIMENTO_MS:
-            return  # Ainda em cooldown, não faz nada
+            return  # Ainda em cooldown, não faz nada (nem lê o teclado)
 
         # --- PENSAMENTO 12: Detecção de Tecla e Execução ---
-        # Percorremos o mapeamento de teclas e verificamos se alguma está pressionada.
-        for tecla_pygame, acao_ambiente in MAPEAMENTO_TECLAS.items():
-            if teclas[tecla_pygame]:
-                # Executa a ação no ambiente
-                _, _, terminou = self.labirinto.executar_acao(acao_ambiente)
-
-                # Atualiza o timestamp
-                self.ultimo_movimento = tempo_atual
-
-                # --- PENSAMENTO 13: Verificar Vitória ---
-                if terminou:
-                    print("🎉 Parabéns! Você encontrou a saída! 🎉")
-                    pygame.time.wait(1500)  # Pausa 1.5s para o jogador ver
-                    pygame.event.post(pygame.event.Event(
-                        pygame.QUIT))  # Fecha o jogo
+        # Pega o estado atual de TODAS as teclas e procura a primeira ação com
+        # uma das suas teclas pressionada. Só processa uma ação por vez.
+        # O teclado nunca é percorrido inteiro (são 512 posições): cada tecla
+        # de movimento é lida direto pelo índice, no máximo 8 leituras.
+        teclas = pygame.key.get_pressed()
+        for tecla, tecla_alternativa, acao_ambiente in TECLAS_DAS_ACOES:
+            if teclas[tecla] or teclas[tecla_alternativa]:
+                break
+        else:
+            return  # Nenhuma tecla de movimento pressionada
+
+        # Executa a ação no ambiente
+        _, _, terminou = self.labirinto.executar_acao(acao_ambiente)
+
+        # Atualiza o timestamp
+        self.ultimo_movimento = tempo_atual
+
+        # --- PENSAMENTO 13: Verificar Vitória ---
+        if terminou:
+            print("🎉 Parabéns! Você encontrou a saída! 🎉")
+            pygame.time.wait(1500)  # Pausa 1.5s para o jogador ver
+            pygame.event.post(pygame.event.Event(
+                pygame.QUIT))  # Fecha o jogo
+
+    def _retangulo_da_celula(self, posicao: tuple[int, int]) -> pygame.Rect:
+        """
+        Retorna o retângulo, em pixels, da célula (linha, coluna).
+        """
+        linha, coluna = posicao
+        return pygame.Rect(
+            coluna * self.tamanho_celula,
+            linha * self.tamanho_celula,
+            self.tamanho_celula,
+            self.tamanho_celula
+        )
 
-                break  # Só processa uma ação por vez
+    def _desenhar_fundo(self) -> None:
+        """
+        Desenha paredes, caminhos e o rastro já existente na Surface de fundo.
 
-    def _desenhar_labirinto(self) -> None:
+        É chamado uma única vez, na inicialização.
+        """
+        # --- PENSAMENTO 14: Renderizar a Grade Base ---
+        # Em vez de um fill() por célula (milhares de chamadas ao SDL), a grade
+        # uint8 vira uma imagem RGB com uma expressão NumPy: a paleta colore as
+        # células, np.repeat amplia cada uma para tamanho_celula pixels, e
+        # blit_array copia tudo para o fundo de uma vez.
+        imagem = PALETA[self.labirinto._grade]
+        imagem = np.repeat(np.repeat(imagem, self.tamanho_celula, axis=0), self.tamanho_celula, axis=1)
+        # O surfarray indexa os pixels como (x, y): trocamos linhas e colunas
+        pygame.surfarray.blit_array(self._fundo, imagem.swapaxes(0, 1))
+
+        rastro = self.labirinto._rastro.tolist()
+        for linha_idx, rastro_linha in enumerate(rastro):
+            for coluna_idx, passou in enumerate(rastro_linha):
+                if passou:
+                    self._desenhar_rastro((linha_idx, coluna_idx))
+
+    def _desenhar_rastro(self, posicao: tuple[int, int]) -> None:
+        """
+        Desenha no fundo o marcador de "caminho visitado" de uma célula.
+        """
+        # --- PENSAMENTO 15: Desenhar o Rastro ---
+        # Um círculo pequeno indica que o agente passou ali. Como fica no
+        # fundo, ele é desenhado só uma vez, quando o agente deixa a célula.
+        centro = self._retangulo_da_celula(posicao).center
+        raio = self.tamanho_celula // 5
+        pygame.draw.circle(self._fundo, COR_RASTRO, centro, raio)
+
+    def _desenhar_labirinto(self) -> list[pygame.Rect]:
         """
         Renderiza o estado atual do labirinto na tela.
 
-        Desenha: paredes, caminhos, rastro, saída e agente.
+        Copia o fundo pré-desenhado e desenha por cima apenas a saída e o agente.
+
+        Returns:
+            list[pygame.Rect]: As áreas da tela que mudaram desde o frame
+                anterior (a tela inteira no primeiro frame).
         """
-        # --- PENSAMENTO 14: Renderizar a Grade Base ---
-        # Percorremos toda a matriz e desenhamos cada célula.
-        for linha_idx, linha in enumerate(self.labirinto._matriz):
-            for coluna_idx, tipo_celula in enumerate(linha):
-                # Calcula a posição em pixels
-                x = coluna_idx * self.tamanho_celula
-                y = linha_idx * self.tamanho_celula
-                retangulo = pygame.Rect(
-                    x, y, self.tamanho_celula, self.tamanho_celula)
-
-                # Escolhe a cor baseada no tipo de célula
-                if tipo_celula == "#":  # Parede
-                    cor = COR_PAREDE
-                else:  # Caminho
-                    cor = COR_CAMINHO
-
-                pygame.draw.rect(self.tela, cor, retangulo)
-
-                # --- PENSAMENTO 15: Desenhar o Rastro ---
-                # Se a célula tem o marcador de "caminho visitado" (•),
-                # desenhamos um círculo pequeno para indicar que o agente passou ali.
-                if tipo_celula == "•":
-                    centro_x = x + self.tamanho_celula // 2
-                    centro_y = y + self.tamanho_celula // 2
-                    raio = self.tamanho_celula // 5
-                    pygame.draw.circle(self.tela, COR_RASTRO,
-                                       (centro_x, centro_y), raio)
-
-        # --- PENSAMENTO 16: Desenhar a Saída (por cima da grade) ---
-        saida_y, saida_x = self.labirinto.ponto_final
-        rect_saida = pygame.Rect(
-            saida_x * self.tamanho_celula,
-            saida_y * self.tamanho_celula,
-            self.tamanho_celula,
-            self.tamanho_celula
-        )
-        pygame.draw.rect(self.tela, COR_SAIDA, rect_saida)
+        posicao = self.labirinto.posicao_agente
+        rect_agente = self._retangulo_da_celula(posicao)
+
+        # Se o agente saiu de uma célula, o rastro dela passa a fazer parte do fundo
+        if self._posicao_anterior is not None and posicao != self._posicao_anterior:
+            if self.labirinto._rastro[self._posicao_anterior]:
+                self._desenhar_rastro(self._posicao_anterior)
+
+        self.tela.blit(self._fundo, (0, 0))
+
+        # --- PENSAMENTO 16: Desenhar a Saída (por cima do fundo) ---
+        pygame.draw.rect(self.tela, COR_SAIDA, self._retangulo_da_celula(self.labirinto.ponto_final))
 
         # --- PENSAMENTO 17: Desenhar o Agente (por cima de tudo) ---
-        agente_y, agente_x = self.labirinto.posicao_agente
-        rect_agente = pygame.Rect(
-            agente_x * self.tamanho_celula,
-            agente_y * self.tamanho_celula,
-            self.tamanho_celula,
-            self.tamanho_celula
-        )
         pygame.draw.rect(self.tela, COR_AGENTE, rect_agente)
+
+        if self._rect_agente_anterior is None:
+            areas_alteradas = [self.tela.get_rect()]
+        else:
+            areas_alteradas = [self._rect_agente_anterior, rect_agente]
+
+        self._posicao_anterior = posicao
+        self._rect_agente_anterior = rect_agente
+        return areas_alteradas
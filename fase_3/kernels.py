@@ -0,0 +1,190 @@
+"""
+Módulo: 🚀 kernels.py
+Projeto: 📘 AI Game Learning (Fase 3 - Labirinto)
+
+Este módulo contém o "kernel" da transição do Labirinto: a função que calcula,
+a partir de uma posição e de uma ação, a nova posição do agente, a recompensa
+e se o episódio terminou.
+
+Por que isso importa? No treinamento, essa transição é executada milhões de
+vezes. Aqui ela usa apenas inteiros, floats e arrays NumPy do ambiente, sem
+strings, tuplas ou chamadas de métodos no caminho.
+
+Como o labirinto não muda, a transição de cada par (célula, ação) é sempre
+a mesma: construir_tabela_de_transicoes calcula todas de uma vez, na criação
+do ambiente, e depois cada passo é só uma leitura na tabela, sem verificar
+limites nem paredes.
+
+Com essa forma "enxuta", a função pode ser compilada para código nativo pelo
+Numba (biblioteca opcional). Se o Numba não estiver instalado, a mesma função
+roda como Python comum — mais lenta, mas com resultado idêntico.
+
+Sem o Numba, o gargalo do Python comum é ler elementos avulsos de arrays
+NumPy (cada leitura cria um escalar NumPy). Por isso os kernels leem a
+tabela como tabela[celula][acao], que funciona tanto com o array (Numba)
+quanto com listas do Python, e preparar_para_kernel() entrega listas
+quando o Numba não está disponível: a leitura por índice fica ~2x mais
+rápida e não há compilação nem aquecimento.
+
+Instalação opcional do Numba:
+    pip install numba
+"""
+
+import numpy as np
+
+# Tenta importar o Numba para compilar o kernel.
+# Se não estiver instalado, define NUMBA_DISPONIVEL como False e usa um
+# decorador que devolve a função sem alterações (Python puro).
+try:
+    from numba import njit
+    NUMBA_DISPONIVEL = True
+except ImportError:
+    NUMBA_DISPONIVEL = False
+
+    def njit(*args, **kwargs):
+        """Substituto do numba.njit quando o Numba não está instalado."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda funcao: funcao
+
+
+# Penalidade de cada passo que não chega à saída
+PENALIDADE_PASSO = -0.1
+
+# Deslocamento (linha, coluna) de cada ação, indexado pelo valor da ação
+# (0 cima, 1 baixo, 2 esquerda, 3 direita). Dentro do kernel compilado, a
+# tabela vira uma constante: o movimento é um acesso por índice, sem ifs.
+DESLOCAMENTOS = np.array([[-1, 0], [1, 0], [0, -1], [0, 1]], dtype=np.int32)
+
+
+def preparar_para_kernel(array: np.ndarray) -> np.ndarray | list:
+    """
+    Entrega um array no formato mais rápido para os kernels deste módulo.
+
+    Com o Numba, o próprio array (o código compilado lê a memória direto).
+    Sem ele, o array convertido em listas do Python, cujo acesso por índice
+    no interpretador é bem mais barato que o de um array NumPy.
+
+    Args:
+        array: A tabela de transições ou um array de ações.
+
+    Returns:
+        O array, ou a sua versão em listas (aninhadas, se for 2D).
+    """
+    return array if NUMBA_DISPONIVEL else array.tolist()
+
+
+def construir_tabela_de_transicoes(paredes: np.ndarray) -> np.ndarray:
+    """
+    Calcula a próxima célula de cada par (célula, ação) do labirinto.
+
+    As células são identificadas pelo índice linear linha * colunas +
+    coluna: a posição do agente vira um único inteiro, e chegar na saída é
+    uma única comparação de inteiros.
+
+    Movimentos para fora da grade ou contra paredes deixam o agente no lugar.
+    Para não testar os limites, a grade de paredes ganha uma moldura de
+    paredes ("sentinelas"): todo movimento para fora cai em uma parede da
+    moldura, e a validade de um movimento é uma única leitura. A moldura só
+    existe aqui dentro; as posições do ambiente não mudam.
+
+    É executada uma vez por labirinto, com operações NumPy sobre todas as
+    células de uma vez (por isso não precisa do Numba).
+
+    Args:
+        paredes: Array bool (linhas, colunas), True nas paredes.
+
+    Returns:
+        Array int32 (linhas * colunas, 4): tabela[celula, acao] é o índice
+        linear da célula do agente depois da ação.
+    """
+    numero_linhas, numero_colunas = paredes.shape
+    paredes_com_moldura = np.pad(paredes, 1, constant_values=True)
+
+    linhas, colunas = np.indices((numero_linhas, numero_colunas), dtype=np.int32)
+    linhas, colunas = linhas.reshape(-1, 1), colunas.reshape(-1, 1)
+
+    # Soma o deslocamento das 4 ações em todas as células: (linhas * colunas, 4)
+    proximas_linhas = linhas + DESLOCAMENTOS[:, 0]
+    proximas_colunas = colunas + DESLOCAMENTOS[:, 1]
+
+    # Na grade com moldura, a célula (l, c) fica em (l + 1, c + 1)
+    validas = ~paredes_com_moldura[proximas_linhas + 1, proximas_colunas + 1]
+
+    celulas = linhas * numero_colunas + colunas
+    proximas = proximas_linhas * numero_colunas + proximas_colunas
+    return np.where(validas, proximas, celulas).astype(np.int32)
+
+
+@njit(cache=True)
+def calcular_transicao(tabela_de_transicoes, celula, acao, celula_final, recompensa_final):
+    """
+    Calcula o resultado de uma ação do agente no labirinto.
+
+    A próxima célula vem da tabela de construir_tabela_de_transicoes(), que
+    já considera os limites e as paredes.
+
+    Args:
+        tabela_de_transicoes: Array int32 (linhas * colunas, 4) com a
+            próxima célula de cada par (célula, ação), ou as listas
+            equivalentes (veja preparar_para_kernel).
+        celula: Índice linear da posição atual do agente.
+        acao: Valor de Acao (0 cima, 1 baixo, 2 esquerda, 3 direita).
+        celula_final: Índice linear da saída.
+        recompensa_final: Recompensa por chegar na saída.
+
+    Returns:
+        Tupla (nova_celula, recompensa, terminou).
+    """
+    # int() mantém a célula como inteiro do Python quando o Numba não está instalado
+    nova_celula = int(tabela_de_transicoes[celula][acao])
+
+    terminou = nova_celula == celula_final
+    recompensa = recompensa_final if terminou else PENALIDADE_PASSO
+    return nova_celula, recompensa, terminou
+
+
+@njit(cache=True)
+def executar_episodio(tabela_de_transicoes, celula, acoes, celula_final, recompensa_final, celulas_deixadas):
+    """
+    Executa uma sequência inteira de ações de uma só vez, parando na saída.
+
+    É o mesmo que chamar calcular_transicao() para cada ação, mas o laço
+    roda dentro do kernel: com o Numba, a sequência toda custa uma única
+    chamada a partir do Python.
+
+    Args:
+        tabela_de_transicoes: Array int32 (linhas * colunas, 4) com a
+            próxima célula de cada par (célula, ação), ou as listas
+            equivalentes (veja preparar_para_kernel).
+        celula: Índice linear da posição inicial do agente.
+        acoes: Array (ou lista) de inteiros com os valores de Acao, na ordem.
+        celula_final: Índice linear da saída.
+        recompensa_final: Recompensa por chegar na saída.
+        celulas_deixadas: Array de saída, com pelo menos len(acoes) posições;
+            recebe, em ordem, as células de onde o agente saiu (o rastro).
+
+    Returns:
+        Tupla (celula, recompensa_total, passos, numero_de_celulas_deixadas, terminou).
+    """
+    recompensa_total = 0.0
+    passos = 0
+    numero_de_celulas_deixadas = 0
+    terminou = False
+
+    for indice in range(len(acoes)):
+        nova_celula = int(tabela_de_transicoes[celula][acoes[indice]])
+        passos += 1
+
+        if nova_celula != celula:
+            celulas_deixadas[numero_de_celulas_deixadas] = celula
+            numero_de_celulas_deixadas += 1
+            celula = nova_celula
+
+        if celula == celula_final:
+            recompensa_total += recompensa_final
+            terminou = True
+            break
+        recompensa_total += PENALIDADE_PASSO
+
+    return celula, recompensa_total, passos, numero_de_celulas_deixadas, terminou
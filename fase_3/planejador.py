@@ -0,0 +1,309 @@
+"""
+Módulo: 🧭 planejador.py
+Projeto: 📘 AI Game Learning (Fase 3 - Labirinto)
+
+Este módulo calcula, a partir da grade do labirinto, a sequência de ações
+que leva o agente de um ponto a outro pelo caminho mais curto.
+
+Para que serve? Com a solução calculada na hora, a demonstração consegue
+"jogar sozinha" qualquer labirinto gerado, de qualquer tamanho, sem uma
+lista de movimentos digitada à mão que quebraria a cada mudança no mapa.
+Também serve de referência para o agente: o número de passos da solução é
+o melhor resultado possível em um episódio.
+
+Há três algoritmos:
+
+- busca_em_largura (BFS): expande as células em ondas, por distância ao
+  início, com uma fila simples (deque). Como todo passo custa o mesmo, a
+  primeira vez que a busca alcança o objetivo é pelo caminho mais curto.
+  É a escolha padrão: cada passo da busca é só um append/popleft, O(1).
+- a_estrela (A*): sempre expande primeiro a célula com o menor custo
+  estimado f = g + h, onde g é o número de passos já dados e h é a
+  distância de Manhattan até o objetivo. Precisa de um heap (O(log n) por
+  operação) e do cálculo de h; só compensa quando os passos têm custos
+  diferentes ou a heurística corta boa parte do mapa. Em labirintos
+  perfeitos, com um único caminho, a busca em largura é mais rápida.
+- busca_bidirecional: duas buscas em largura, uma a partir de cada ponta,
+  que se encontram no meio. Cada uma só precisa chegar à metade da
+  distância d, e a área explorada cresce com o quadrado do raio: são
+  cerca de 2 * (d/2)² = d²/2 células em vez de d². Compensa quando a
+  saída está perto em comparação ao tamanho do mapa (grades abertas ou
+  labirintos de "arvore_crescente"); nos de "backtracking", em que o único
+  caminho serpenteia por quase todo o mapa, as duas buscas acabam
+  visitando quase tudo e a busca em largura simples é mais barata.
+"""
+
+import heapq
+from collections import deque
+
+import numpy as np
+
+from .ambiente import CAMINHO, Acao, Posicao
+from .kernels import DESLOCAMENTOS
+
+# (ação, delta_linha, delta_coluna) de cada movimento, na ordem de Acao
+MOVIMENTOS: tuple[tuple[Acao, int, int], ...] = tuple(
+    (Acao(indice), delta_linha, delta_coluna)
+    for indice, (delta_linha, delta_coluna) in enumerate(DESLOCAMENTOS.tolist())
+)
+
+
+def _paredes_com_moldura(grade: np.ndarray | list[list[str]]) -> tuple[list[bool], int]:
+    """
+    Converte a grade em uma lista plana de booleanos (True = parede), com moldura.
+
+    Aceita os mesmos formatos do Labirinto: strings ('#' é parede) ou a
+    grade numérica de gerar_grade_labirinto() (CAMINHO é caminho).
+
+    Como em construir_tabela_de_transicoes(), a grade ganha uma moldura de
+    paredes ("sentinelas"): todo passo para fora do mapa cai em uma parede,
+    então a busca não precisa testar os limites, e a vizinha de uma célula
+    é só celula + deslocamento, sem divmod. Testar uma vizinha vira uma
+    única leitura na lista, que é bem mais rápida do que ler um array NumPy.
+
+    Returns:
+        A lista plana, indexada por (linha + 1) * colunas_com_moldura +
+        (coluna + 1), e o número de colunas com moldura.
+    """
+    matriz = np.asarray(grade)
+    paredes = matriz == "#" if matriz.dtype.kind in "US" else matriz != CAMINHO
+    paredes_com_moldura = np.pad(paredes, 1, constant_values=True)
+    return paredes_com_moldura.ravel().tolist(), paredes_com_moldura.shape[1]
+
+
+def _celula_com_moldura(posicao: Posicao, colunas_com_moldura: int) -> int:
+    """Índice de uma posição (linha, coluna) na lista plana com moldura."""
+    return (posicao[0] + 1) * colunas_com_moldura + posicao[1] + 1
+
+
+def _passos(colunas_com_moldura: int) -> list[tuple[Acao, int]]:
+    """(ação, deslocamento do índice plano) de cada movimento, na grade com moldura."""
+    return [
+        (acao, delta_linha * colunas_com_moldura + delta_coluna)
+        for acao, delta_linha, delta_coluna in MOVIMENTOS
+    ]
+
+
+def busca_em_largura(
+    grade: np.ndarray | list[list[str]], inicio: Posicao, objetivo: Posicao
+) -> list[Acao] | None:
+    """
+    Encontra o caminho mais curto entre dois pontos com uma busca em largura.
+
+    Args:
+        grade (np.ndarray | list[list[str]]): A grade do labirinto, no mesmo
+            formato aceito pelo Labirinto.
+        inicio (Posicao): Posição (linha, coluna) de partida.
+        objetivo (Posicao): Posição (linha, coluna) de chegada.
+
+    Returns:
+        list[Acao] | None: As ações, em ordem, do caminho mais curto (lista
+        vazia se inicio == objetivo), ou None se não houver caminho.
+
+    Example:
+        >>> acoes = busca_em_largura(grade, (1, 1), (11, 19))
+        >>> labirinto.executar_sequencia(np.array(acoes))
+    """
+    paredes, colunas = _paredes_com_moldura(grade)
+    passos = _passos(colunas)
+    celula_inicial = _celula_com_moldura(inicio, colunas)
+    celula_objetivo = _celula_com_moldura(objetivo, colunas)
+
+    fila = deque([celula_inicial])
+    # Para cada célula alcançada: (célula anterior, ação que levou até ela).
+    # Também serve de conjunto de visitadas: cada célula entra uma única vez.
+    anterior: dict[int, tuple[int, Acao] | None] = {celula_inicial: None}
+
+    while fila:
+        celula = fila.popleft()
+        if celula == celula_objetivo:
+            return _reconstruir_caminho(anterior, celula_inicial, celula_objetivo)
+
+        for acao, deslocamento in passos:
+            vizinha = celula + deslocamento
+            if paredes[vizinha] or vizinha in anterior:
+                continue
+
+            anterior[vizinha] = (celula, acao)
+            fila.append(vizinha)
+
+    return None
+
+
+def a_estrela(
+    grade: np.ndarray | list[list[str]], inicio: Posicao, objetivo: Posicao
+) -> list[Acao] | None:
+    """
+    Encontra o caminho mais curto entre dois pontos com o algoritmo A*.
+
+    Args:
+        grade (np.ndarray | list[list[str]]): A grade do labirinto, no mesmo
+            formato aceito pelo Labirinto.
+        inicio (Posicao): Posição (linha, coluna) de partida.
+        objetivo (Posicao): Posição (linha, coluna) de chegada.
+
+    Returns:
+        list[Acao] | None: As ações, em ordem, do caminho mais curto (lista
+        vazia se inicio == objetivo), ou None se não houver caminho.
+
+    Example:
+        >>> acoes = a_estrela(grade, (1, 1), (11, 19))
+        >>> labirinto.executar_sequencia(np.array(acoes))
+    """
+    paredes, colunas = _paredes_com_moldura(grade)
+    passos = _passos(colunas)
+    celula_inicial = _celula_com_moldura(inicio, colunas)
+    celula_objetivo = _celula_com_moldura(objetivo, colunas)
+    # A heurística usa as coordenadas da grade com moldura: a moldura soma 1
+    # à linha e à coluna das duas pontas, então a distância não muda
+    linha_objetivo, coluna_objetivo = divmod(celula_objetivo, colunas)
+
+    # Cada entrada da fila é (f, g, célula): a tupla é comparada na ordem,
+    # então o heap entrega sempre a célula de menor f (e, no empate, de menor g)
+    h_inicial = abs(inicio[0] + 1 - linha_objetivo) + abs(inicio[1] + 1 - coluna_objetivo)
+    fila = [(h_inicial, 0, celula_inicial)]
+    menor_custo = {celula_inicial: 0}
+    # Para cada célula alcançada: (célula anterior, ação que levou até ela)
+    anterior: dict[int, tuple[int, Acao]] = {}
+
+    while fila:
+        _, custo, celula = heapq.heappop(fila)
+        if celula == celula_objetivo:
+            return _reconstruir_caminho(anterior, celula_inicial, celula_objetivo)
+        if custo > menor_custo[celula]:
+            continue  # Entrada antiga: a célula já foi alcançada por um caminho mais curto
+
+        for acao, deslocamento in passos:
+            vizinha = celula + deslocamento
+            if paredes[vizinha] or menor_custo.get(vizinha, custo + 2) <= custo + 1:
+                continue
+
+            menor_custo[vizinha] = custo + 1
+            anterior[vizinha] = (celula, acao)
+            nova_linha, nova_coluna = divmod(vizinha, colunas)
+            h = abs(nova_linha - linha_objetivo) + abs(nova_coluna - coluna_objetivo)
+            heapq.heappush(fila, (custo + 1 + h, custo + 1, vizinha))
+
+    return None
+
+
+def busca_bidirecional(
+    grade: np.ndarray | list[list[str]], inicio: Posicao, objetivo: Posicao
+) -> list[Acao] | None:
+    """
+    Encontra o caminho mais curto com duas buscas em largura que se encontram no meio.
+
+    Uma busca parte do início ("ida") e a outra do objetivo ("volta"). A
+    cada rodada, a que tem a fronteira menor avança uma camada inteira
+    (todas as células à mesma distância da sua ponta). Quando uma célula
+    descoberta já foi visitada pelo outro lado, as duas metades se tocam;
+    o melhor encontro da camada dá o caminho mais curto.
+
+    Args:
+        grade (np.ndarray | list[list[str]]): A grade do labirinto, no mesmo
+            formato aceito pelo Labirinto.
+        inicio (Posicao): Posição (linha, coluna) de partida.
+        objetivo (Posicao): Posição (linha, coluna) de chegada.
+
+    Returns:
+        list[Acao] | None: As ações, em ordem, do caminho mais curto (lista
+        vazia se inicio == objetivo), ou None se não houver caminho.
+    """
+    paredes, colunas = _paredes_com_moldura(grade)
+    passos = _passos(colunas)
+    celula_inicial = _celula_com_moldura(inicio, colunas)
+    celula_objetivo = _celula_com_moldura(objetivo, colunas)
+    if celula_inicial == celula_objetivo:
+        return []
+    if paredes[celula_objetivo]:
+        return None
+
+    # Em cada lado: {célula: (célula vizinha rumo à ponta do lado, ação, distância até a ponta)}
+    visitadas_ida: dict[int, tuple[int | None, Acao | None, int]] = {celula_inicial: (None, None, 0)}
+    visitadas_volta: dict[int, tuple[int | None, Acao | None, int]] = {celula_objetivo: (None, None, 0)}
+    camada_ida, camada_volta = [celula_inicial], [celula_objetivo]
+
+    while camada_ida and camada_volta:
+        # Avança o lado com menos células na fronteira: é a camada mais barata
+        if len(camada_ida) <= len(camada_volta):
+            camada_ida, encontro = _expandir_camada(camada_ida, visitadas_ida, visitadas_volta, 1, paredes, passos)
+        else:
+            camada_volta, encontro = _expandir_camada(camada_volta, visitadas_volta, visitadas_ida, -1, paredes, passos)
+        if encontro is not None:
+            return _juntar_metades(visitadas_ida, visitadas_volta, encontro)
+
+    return None
+
+
+def _expandir_camada(
+    camada: list[int],
+    visitadas: dict[int, tuple[int | None, Acao | None, int]],
+    visitadas_do_outro_lado: dict[int, tuple[int | None, Acao | None, int]],
+    sentido: int,
+    paredes: list[bool],
+    passos: list[tuple[Acao, int]],
+) -> tuple[list[int], int | None]:
+    """
+    Avança uma camada inteira de um dos lados da busca bidirecional.
+
+    Na volta (sentido -1), os deslocamentos são invertidos: a vizinha é a
+    célula de onde a ação leva até a célula atual, então a ação guardada já
+    é a do caminho no sentido início → objetivo.
+
+    Returns:
+        A próxima camada e a célula de encontro com o outro lado de menor
+        distância total (ou None, se os lados ainda não se tocaram).
+    """
+    proxima_camada = []
+    encontro = None
+    menor_distancia_total = 0
+
+    for celula in camada:
+        distancia = visitadas[celula][2] + 1
+        for acao, deslocamento in passos:
+            vizinha = celula + sentido * deslocamento
+            if paredes[vizinha] or vizinha in visitadas:
+                continue
+
+            visitadas[vizinha] = (celula, acao, distancia)
+            proxima_camada.append(vizinha)
+
+            if vizinha in visitadas_do_outro_lado:
+                distancia_total = distancia + visitadas_do_outro_lado[vizinha][2]
+                if encontro is None or distancia_total < menor_distancia_total:
+                    encontro, menor_distancia_total = vizinha, distancia_total
+
+    return proxima_camada, encontro
+
+
+def _juntar_metades(
+    visitadas_ida: dict[int, tuple[int | None, Acao | None, int]],
+    visitadas_volta: dict[int, tuple[int | None, Acao | None, int]],
+    encontro: int,
+) -> list[Acao]:
+    """Monta o caminho completo: início → encontro (invertido) e encontro → objetivo."""
+    acoes = []
+    celula, acao, _ = visitadas_ida[encontro]
+    while celula is not None:
+        acoes.append(acao)
+        celula, acao, _ = visitadas_ida[celula]
+    acoes.reverse()
+
+    celula, acao, _ = visitadas_volta[encontro]
+    while celula is not None:
+        acoes.append(acao)
+        celula, acao, _ = visitadas_volta[celula]
+    return acoes
+
+
+def _reconstruir_caminho(
+    anterior: dict[int, tuple[int, Acao] | None], celula_inicial: int, celula_final: int
+) -> list[Acao]:
+    """Percorre o mapa de anteriores de trás para frente, do fim até o início."""
+    acoes = []
+    celula = celula_final
+    while celula != celula_inicial:
+        celula, acao = anterior[celula]
+        acoes.append(acao)
+    acoes.reverse()
+    return acoes
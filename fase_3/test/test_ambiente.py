@@ -6,9 +6,10 @@ incluindo a inicialização, movimentação do agente, detecção de colisões,
 cálculo de recompensas, reinício do ambiente e suporte a teclas WASD.
 """
 
+import numpy as np
 import pytest
 
-from ..ambiente import Labirinto
+from ..ambiente import Acao, Labirinto, converter_acoes
 
 
 # --- DADOS DE TESTE ---
@@ -209,6 +210,20 @@ def test_executar_acao_tecla_minuscula_w() -> None:
     assert novo_estado == PONTO_INICIAL_EXEMPLO  # Bloqueado por limite
 
 
+def test_executar_acao_com_acao_inteira() -> None:
+    """Testa movimento usando um membro de Acao (forma usada pelo Pygame)."""
+    # Arrange
+    ambiente = Labirinto(LABIRINTO_EXEMPLO, PONTO_INICIAL_EXEMPLO, PONTO_FINAL_EXEMPLO)
+
+    # Act
+    novo_estado, recompensa, terminou = ambiente.executar_acao(Acao.BAIXO)
+
+    # Assert
+    assert novo_estado == (1, 0)
+    assert recompensa == -0.1
+    assert not terminou
+
+
 # ========================================
 # TESTES DE VALIDAÇÃO DE AÇÕES
 # ========================================
@@ -270,6 +285,50 @@ def test_chegar_ao_ponto_final_usando_wasd() -> None:
     assert terminou
 
 
+# ========================================
+# TESTES DE EXECUÇÃO EM LOTE
+# ========================================
+
+def test_executar_acoes_em_lote() -> None:
+    """Testa um passo em lote com uma ação diferente para cada agente."""
+    # Arrange
+    ambiente = Labirinto(LABIRINTO_EXEMPLO, PONTO_INICIAL_EXEMPLO, PONTO_FINAL_EXEMPLO)
+    ambiente.reiniciar_lote(4)
+    acoes = np.array([Acao.CIMA, Acao.BAIXO, Acao.ESQUERDA, Acao.DIREITA])
+
+    # Act
+    posicoes, recompensas, terminados = ambiente.executar_acoes_em_lote(acoes)
+
+    # Assert: Só "baixo" é válido a partir de (0, 0); os demais batem no limite ou na parede.
+    assert posicoes.tolist() == [[0, 0], [1, 0], [0, 0], [0, 0]]
+    assert recompensas.tolist() == [-0.1] * 4
+    assert not terminados.any()
+
+
+def test_lote_equivale_ao_agente_individual() -> None:
+    """Verifica se o passo em lote segue as mesmas regras de executar_acao()."""
+    # Arrange: Sequências aleatórias de ações para 8 agentes.
+    gerador = np.random.default_rng(3)
+    acoes = gerador.integers(4, size=(30, 8))
+    nomes = [acao.name.lower() for acao in Acao]
+    individuais = [
+        Labirinto(LABIRINTO_EXEMPLO, PONTO_INICIAL_EXEMPLO, PONTO_FINAL_EXEMPLO) for _ in range(8)
+    ]
+    ambiente_lote = Labirinto(LABIRINTO_EXEMPLO, PONTO_INICIAL_EXEMPLO, PONTO_FINAL_EXEMPLO)
+    ambiente_lote.reiniciar_lote(8)
+
+    for acoes_do_passo in acoes:
+        # Act
+        posicoes, recompensas, terminados = ambiente_lote.executar_acoes_em_lote(acoes_do_passo)
+
+        # Assert: Cada agente do lote termina onde o agente individual terminou.
+        for agente, ambiente in enumerate(individuais):
+            posicao, recompensa, terminou = ambiente.executar_acao(nomes[acoes_do_passo[agente]])
+            assert tuple(posicoes[agente].tolist()) == posicao
+            assert recompensas[agente] == recompensa
+            assert terminados[agente] == terminou
+
+
 # ========================================
 # TESTES DE REPRESENTAÇÃO VISUAL
 # ========================================
@@ -286,3 +345,157 @@ def test_representacao_string() -> None:
     assert 'A' in representacao, "Deve conter o marcador do agente."
     assert 'S' in representacao, "Deve conter o marcador da saída."
     assert '#' in representacao, "Deve conter paredes."
+
+
+def test_representacao_string_acompanha_o_agente() -> None:
+    """Verifica se o texto guardado do __str__ é atualizado a cada movimento."""
+    # Arrange
+    ambiente = Labirinto(LABIRINTO_EXEMPLO, PONTO_INICIAL_EXEMPLO, PONTO_FINAL_EXEMPLO)
+
+    # Act & Assert: A célula deixada pelo agente vira rastro.
+    assert str(ambiente) == "A #  \n     \n# # S"
+    ambiente.executar_acao("baixo")
+    ambiente.executar_acao("direita")
+    assert str(ambiente) == "• #  \n• A  \n# # S"
+
+    # Reposicionar o agente (sem andar) devolve a célula antiga ao original.
+    ambiente.posicao_agente = (0, 2)
+    assert str(ambiente) == "• # A\n•    \n# # S"
+
+
+def test_grade_uint8_e_matriz_com_rastro() -> None:
+    """Verifica a grade uint8 e a matriz em texto montada a partir dela."""
+    # Arrange
+    matriz_original = [list(linha) for linha in LABIRINTO_EXEMPLO]
+    ambiente = Labirinto(matriz_original, PONTO_INICIAL_EXEMPLO, PONTO_FINAL_EXEMPLO)
+
+    # Act
+    ambiente.executar_acao("baixo")
+
+    # Assert: 1 byte por célula, rastro na matriz em texto e entrada intacta.
+    assert ambiente._grade.dtype == np.uint8 and ambiente._grade.flags.c_contiguous
+    assert ambiente._grade.tolist() == [[0, 1, 0], [0, 0, 0], [1, 1, 0]]
+    assert ambiente.matriz[0] == ['•', '#', ' '], "A célula deixada pelo agente deve ter o rastro."
+    assert matriz_original == LABIRINTO_EXEMPLO, "A matriz recebida não deve ser alterada."
+
+
+def test_tabela_de_transicoes() -> None:
+    """Verifica se a tabela de transições respeita limites e paredes em todas as células."""
+    # Arrange
+    ambiente = Labirinto(LABIRINTO_EXEMPLO, PONTO_INICIAL_EXEMPLO, PONTO_FINAL_EXEMPLO)
+    deslocamentos = {Acao.CIMA: (-1, 0), Acao.BAIXO: (1, 0), Acao.ESQUERDA: (0, -1), Acao.DIREITA: (0, 1)}
+
+    # Act & Assert
+    assert ambiente._transicoes.shape == (9, 4), "Uma linha por célula (índice linear), uma coluna por ação."
+    for linha in range(3):
+        for coluna in range(3):
+            for acao, (delta_linha, delta_coluna) in deslocamentos.items():
+                nova_linha, nova_coluna = linha + delta_linha, coluna + delta_coluna
+                valida = (
+                    0 <= nova_linha < 3 and 0 <= nova_coluna < 3
+                    and LABIRINTO_EXEMPLO[nova_linha][nova_coluna] != '#'
+                )
+                esperada = nova_linha * 3 + nova_coluna if valida else linha * 3 + coluna
+                assert ambiente._transicoes[linha * 3 + coluna, acao] == esperada
+
+
+def test_converter_acoes() -> None:
+    """Verifica a tradução de teclas, nomes e Acao para inteiros, e a rejeição de ações inválidas."""
+    # Act
+    acoes = converter_acoes(["w", "baixo", Acao.ESQUERDA, "D"])
+    teclas = converter_acoes("ddss")
+
+    # Assert
+    assert acoes.dtype == np.int8
+    assert acoes.tolist() == [Acao.CIMA, Acao.BAIXO, Acao.ESQUERDA, Acao.DIREITA]
+    assert teclas.tolist() == [Acao.DIREITA, Acao.DIREITA, Acao.BAIXO, Acao.BAIXO]
+    with pytest.raises(ValueError, match="Ação inválida"):
+        converter_acoes("dxs")
+
+
+@pytest.mark.parametrize("acao", [0, 1, 3, True, False, 1.0])
+def test_inteiros_e_booleanos_sao_rejeitados(acao) -> None:
+    """Verifica se ints e bools não passam como Acao (IntEnum tem o mesmo hash de um int)."""
+    # Arrange
+    ambiente = Labirinto(LABIRINTO_EXEMPLO, PONTO_INICIAL_EXEMPLO, PONTO_FINAL_EXEMPLO)
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="Ação inválida"):
+        ambiente.executar_acao(acao)
+    with pytest.raises(ValueError, match="Ação inválida"):
+        converter_acoes([Acao.BAIXO, acao])
+    assert ambiente.posicao_agente == PONTO_INICIAL_EXEMPLO, "O agente não deveria ter se movido."
+
+
+def test_executar_sequencia_convertida() -> None:
+    """Verifica se executar os inteiros convertidos equivale a executar as teclas."""
+    # Arrange
+    ambiente = Labirinto(LABIRINTO_EXEMPLO, PONTO_INICIAL_EXEMPLO, PONTO_FINAL_EXEMPLO)
+
+    # Act
+    for valor in converter_acoes("sdds").tolist():
+        _, recompensa, terminou = ambiente.executar_acao(Acao(valor))
+
+    # Assert
+    assert ambiente.posicao_agente == PONTO_FINAL_EXEMPLO
+    assert terminou and recompensa > 0
+
+
+def test_executar_sequencia_equivale_a_executar_acao() -> None:
+    """Verifica se executar_sequencia() dá o mesmo resultado (posição, recompensa e rastro) que executar_acao()."""
+    # Arrange: Uma sequência que bate em paredes e volta por onde passou.
+    acoes = "wsdadwdss"
+    individual = Labirinto(LABIRINTO_EXEMPLO, PONTO_INICIAL_EXEMPLO, PONTO_FINAL_EXEMPLO)
+    em_sequencia = Labirinto(LABIRINTO_EXEMPLO, PONTO_INICIAL_EXEMPLO, PONTO_FINAL_EXEMPLO)
+
+    recompensa_esperada = 0.0
+    for passos_esperados, acao in enumerate(acoes, start=1):
+        _, recompensa, terminou = individual.executar_acao(acao)
+        recompensa_esperada += recompensa
+        if terminou:
+            break
+
+    # Act
+    posicao, recompensa_total, passos, chegou = em_sequencia.executar_sequencia(acoes)
+
+    # Assert: A saída é alcançada antes do fim da sequência.
+    assert chegou and passos == passos_esperados < len(acoes)
+    assert posicao == individual.posicao_agente == PONTO_FINAL_EXEMPLO
+    assert recompensa_total == pytest.approx(recompensa_esperada)
+    assert (em_sequencia._rastro == individual._rastro).all()
+    assert str(em_sequencia) == str(individual)
+
+
+def test_executar_sequencia_aceita_arrays_vazios_e_de_outros_tipos() -> None:
+    """Verifica se arrays vazios (float64) ou de outro dtype são convertidos antes do kernel."""
+    # Arrange
+    ambiente = Labirinto(LABIRINTO_EXEMPLO, PONTO_INICIAL_EXEMPLO, PONTO_FINAL_EXEMPLO)
+
+    # Act: np.array([]) é float64; o planejador devolve [] quando já se está na saída
+    resultado_vazio = ambiente.executar_sequencia(np.array([]))
+    resultado_float = ambiente.executar_sequencia(np.array([1.0, 3.0, 3.0, 1.0]))
+
+    # Assert
+    assert resultado_vazio == (PONTO_INICIAL_EXEMPLO, 0.0, 0, False)
+    assert resultado_float[0] == PONTO_FINAL_EXEMPLO and resultado_float[3]
+
+
+def test_imprimir_labirinto_em_grade(capsys) -> None:
+    """Verifica o quadro do imprimir_labirinto(): bordas, agente ('A') e saída ('F')."""
+    # Arrange
+    ambiente = Labirinto(LABIRINTO_EXEMPLO, PONTO_INICIAL_EXEMPLO, PONTO_FINAL_EXEMPLO)
+
+    # Act
+    ambiente.imprimir_labirinto()
+    linhas = capsys.readouterr().out.splitlines()
+
+    # Assert: 3 linhas de conteúdo, 2 separadoras e as bordas superior e inferior.
+    assert linhas == [
+        "┌───┬───┬───┐",
+        "│ A │ # │   │",
+        "├───┼───┼───┤",
+        "│   │   │   │",
+        "├───┼───┼───┤",
+        "│ # │ # │ F │",
+        "└───┴───┴───┘",
+    ]
@@ -0,0 +1,122 @@
+"""
+Testes unitários para o LabirintoVetorizado do módulo ambiente_vetorizado.
+
+Este arquivo verifica o passo dos N agentes, o reinício automático dos
+episódios que chegam na saída, a observação final guardada no info e o
+truncamento pelo máximo de passos.
+"""
+
+import numpy as np
+import pytest
+
+from ..ambiente import Acao, Labirinto
+from ..ambiente_vetorizado import LabirintoVetorizado
+
+
+# --- DADOS DE TESTE ---
+LABIRINTO_EXEMPLO = [
+    [' ', '#', ' '],
+    [' ', ' ', ' '],
+    ['#', '#', ' ']
+]
+PONTO_INICIAL_EXEMPLO = (0, 0)
+PONTO_FINAL_EXEMPLO = (2, 2)
+
+# Caminho mais curto do início até a saída
+CAMINHO_ATE_A_SAIDA = [Acao.BAIXO, Acao.DIREITA, Acao.DIREITA, Acao.BAIXO]
+
+
+@pytest.fixture
+def labirinto() -> Labirinto:
+    return Labirinto(LABIRINTO_EXEMPLO, PONTO_INICIAL_EXEMPLO, PONTO_FINAL_EXEMPLO)
+
+
+# ========================================
+# TESTES DE INICIALIZAÇÃO
+# ========================================
+
+
+def test_inicializacao(labirinto: Labirinto) -> None:
+    """Verifica se todos os agentes começam na posição inicial."""
+    # Act
+    ambientes = LabirintoVetorizado(labirinto, numero_de_ambientes=3)
+
+    # Assert
+    assert ambientes.posicoes.tolist() == [[0, 0]] * 3
+    assert ambientes.passos.tolist() == [0, 0, 0]
+
+
+def test_parametros_invalidos(labirinto: Labirinto) -> None:
+    """Verifica se números de ambientes ou de passos não positivos são rejeitados."""
+    with pytest.raises(ValueError):
+        LabirintoVetorizado(labirinto, numero_de_ambientes=0)
+    with pytest.raises(ValueError):
+        LabirintoVetorizado(labirinto, numero_de_ambientes=2, maximo_de_passos=0)
+
+
+# ========================================
+# TESTES DE REINÍCIO AUTOMÁTICO
+# ========================================
+
+
+def test_reinicio_automatico_ao_chegar_na_saida(labirinto: Labirinto) -> None:
+    """Verifica se só o agente que chega na saída volta ao início, com a observação final no info."""
+    # Arrange: O agente 0 segue o caminho até a saída; o agente 1 fica batendo no limite.
+    ambientes = LabirintoVetorizado(labirinto, numero_de_ambientes=2)
+
+    # Act
+    for acao in CAMINHO_ATE_A_SAIDA:
+        posicoes, recompensas, terminados, truncados, info = ambientes.executar_acoes(
+            np.array([acao, Acao.CIMA])
+        )
+
+    # Assert
+    assert terminados.tolist() == [True, False]
+    assert not truncados.any()
+    assert recompensas[0] > 0 and recompensas[1] == -0.1
+    assert info["observacao_final"][0].tolist() == list(PONTO_FINAL_EXEMPLO)
+    assert posicoes.tolist() == [[0, 0], [0, 0]]
+    assert ambientes.passos.tolist() == [0, 4]
+
+
+def test_truncamento_pelo_maximo_de_passos(labirinto: Labirinto) -> None:
+    """Verifica se episódios que atingem o horizonte são truncados e reiniciados."""
+    # Arrange
+    ambientes = LabirintoVetorizado(labirinto, numero_de_ambientes=2, maximo_de_passos=2)
+
+    # Act
+    ambientes.executar_acoes(np.array([Acao.BAIXO, Acao.CIMA]))
+    posicoes, _, terminados, truncados, info = ambientes.executar_acoes(
+        np.array([Acao.DIREITA, Acao.CIMA])
+    )
+
+    # Assert
+    assert not terminados.any()
+    assert truncados.tolist() == [True, True]
+    assert info["observacao_final"].tolist() == [[1, 1], [0, 0]]
+    assert posicoes.tolist() == [[0, 0], [0, 0]]
+    assert ambientes.passos.tolist() == [0, 0]
+
+
+# ========================================
+# TESTES DE ESTADO INDEPENDENTE
+# ========================================
+
+
+def test_ambientes_no_mesmo_labirinto_sao_independentes(labirinto: Labirinto) -> None:
+    """Verifica se dois LabirintoVetorizado (e o lote do Labirinto) não sobrescrevem as posições um do outro."""
+    # Arrange
+    primeiro = LabirintoVetorizado(labirinto, numero_de_ambientes=2)
+    segundo = LabirintoVetorizado(labirinto, numero_de_ambientes=3)
+    labirinto.reiniciar_lote(1)
+
+    # Act
+    primeiro.executar_acoes(np.array([Acao.BAIXO, Acao.BAIXO]))
+    segundo.reiniciar()
+    labirinto.executar_acoes_em_lote(np.array([Acao.BAIXO]))
+    labirinto.executar_acoes_em_lote(np.array([Acao.DIREITA]))
+
+    # Assert
+    assert primeiro.posicoes.tolist() == [[1, 0], [1, 0]]
+    assert segundo.posicoes.tolist() == [[0, 0]] * 3
+    assert labirinto.posicoes.tolist() == [[1, 1]]
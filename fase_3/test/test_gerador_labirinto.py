@@ -12,7 +12,10 @@ import pytest
 import sys
 from pathlib import Path
 
-from ..gerador_labirinto import gerar_labirinto
+import numpy as np
+
+from ..ambiente import CAMINHO, PAREDE, Labirinto
+from ..gerador_labirinto import gerar_grade_labirinto, gerar_labirinto
 
 # ========================================
 # TESTES DE DIMENSÕES E ESTRUTURA
@@ -157,6 +160,72 @@ def test_labirinto_eh_totalmente_conectado() -> None:
         "Nem todas as células de caminho são alcançáveis. O labirinto está quebrado."
 
 
+def test_mesma_semente_gera_mesmo_labirinto() -> None:
+    """
+    Verifica se a semente torna a geração reproduzível (os mapas de treino dependem disso).
+    """
+    # Act
+    primeiro = gerar_labirinto(12, 9, semente=42)
+    segundo = gerar_labirinto(12, 9, semente=42)
+
+    # Assert
+    assert primeiro == segundo, "A mesma semente deveria gerar o mesmo labirinto."
+
+
+def test_grade_uint8_equivale_a_matriz_de_strings() -> None:
+    """
+    Verifica se a grade uint8 e a matriz de strings descrevem o mesmo labirinto,
+    e se o Labirinto aceita a grade diretamente.
+    """
+    # Act
+    grade = gerar_grade_labirinto(6, 7, semente=5)
+    matriz = gerar_labirinto(6, 7, semente=5)
+
+    # Assert
+    assert grade.dtype == np.uint8, "A grade deveria usar 1 byte por célula."
+    assert np.array_equal(grade == PAREDE, np.array(matriz) == '#'), "As duas versões deveriam coincidir."
+    assert set(np.unique(grade).tolist()) == {CAMINHO, PAREDE}
+    assert np.array_equal(Labirinto(grade, (1, 1), (11, 13))._grade, grade)
+
+
+@pytest.mark.parametrize("semente", [0, 1, 2])
+def test_arvore_crescente_gera_labirinto_perfeito(semente: int) -> None:
+    """
+    Verifica se o algoritmo "arvore_crescente" também gera labirintos perfeitos:
+    todas as células alcançáveis e exatamente (células - 1) passagens abertas.
+    """
+    # Arrange
+    altura_celulas, largura_celulas = 9, 13
+    numero_de_celulas = altura_celulas * largura_celulas
+
+    # Act
+    grade = gerar_grade_labirinto(altura_celulas, largura_celulas, semente, algoritmo="arvore_crescente")
+
+    # Assert: Estrutura
+    assert (grade[::2, ::2] == PAREDE).all()
+    assert (grade[[0, -1], :] == PAREDE).all() and (grade[:, [0, -1]] == PAREDE).all()
+    assert (grade[1::2, 1::2] == CAMINHO).all()
+    assert np.count_nonzero(grade == CAMINHO) == numero_de_celulas + (numero_de_celulas - 1)
+
+    # Assert: Conectividade (Flood Fill a partir de (1, 1))
+    visitados = {(1, 1)}
+    pilha = [(1, 1)]
+    while pilha:
+        linha, coluna = pilha.pop()
+        for dl, dc in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
+            vizinho = (linha + dl, coluna + dc)
+            if grade[vizinho] == CAMINHO and vizinho not in visitados:
+                visitados.add(vizinho)
+                pilha.append(vizinho)
+    assert len(visitados) == np.count_nonzero(grade == CAMINHO)
+
+
+def test_algoritmo_invalido() -> None:
+    """Verifica se um nome de algoritmo desconhecido é rejeitado."""
+    with pytest.raises(ValueError, match="Algoritmo inválido"):
+        gerar_grade_labirinto(3, 3, algoritmo="kruskal")
+
+
 # ========================================
 # TESTES DE CASOS EXTREMOS (EDGE CASES)
 # ========================================
@@ -176,3 +245,23 @@ def test_gerar_labirinto_tamanho_minimo() -> None:
     matriz = gerar_labirinto(1, 1)
     # Assert
     assert matriz == labirinto_esperado, "O labirinto de tamanho mínimo (1x1) não foi gerado corretamente."
+
+
+def test_labirinto_grande_sem_limite_de_recursao() -> None:
+    """
+    Testa um labirinto com mais células do que o limite de recursão do Python.
+
+    A busca em profundidade usa uma pilha explícita, então o caminho pode ter
+    milhares de células sem lançar RecursionError.
+    """
+    # Arrange
+    altura_celulas, largura_celulas = 60, 60
+    assert altura_celulas * largura_celulas > sys.getrecursionlimit()
+
+    # Act
+    matriz = gerar_labirinto(altura_celulas, largura_celulas, semente=1)
+
+    # Assert: Um labirinto perfeito tem exatamente (células - 1) passagens abertas.
+    celulas_abertas = sum(linha.count(' ') for linha in matriz)
+    numero_de_celulas = altura_celulas * largura_celulas
+    assert celulas_abertas == numero_de_celulas + (numero_de_celulas - 1)
@@ -1,23 +1,42 @@
 # fase_3/test/test_jogar.py
 
 import pytest
+from collections import defaultdict
 from unittest.mock import MagicMock
+import numpy as np
 import pygame
 
 # Note os pontos (..) para subir um nível e importar da fase_3
 from ..jogar import JogoGrafico
-from ..ambiente import Labirinto
+from ..jogo_grafico import COR_AGENTE, COR_RASTRO
+from ..ambiente import CAMINHO, PAREDE, Acao, Labirinto
 
 # ========================================
 # FIXTURE DO LABIRINTO (MOCKADO)
 # ========================================
 
+# Grade já numérica (uint8), convertida uma vez na importação do módulo:
+# o Labirinto não precisa comparar strings para montar as paredes
+_MATRIZ = np.array(
+    [[PAREDE, PAREDE, PAREDE], [PAREDE, CAMINHO, PAREDE], [PAREDE, PAREDE, PAREDE]], dtype=np.uint8
+)
+
+
+@pytest.fixture(scope="module")
+def labirinto_real() -> Labirinto:
+    # Uma célula cercada de paredes que já é a saída: nenhuma ação move o
+    # agente nem deixa rastro, então o mesmo labirinto serve a todos os testes
+    return Labirinto(_MATRIZ, (1, 1), (1, 1))
+
 
 @pytest.fixture
-def ambiente_mock() -> MagicMock:
-    matriz = [['#', '#', '#'], ['#', ' ', '#'], ['#', '#', '#']]
-    labirinto_real = Labirinto(matriz, (1, 1), (1, 1))
-    return MagicMock(wraps=labirinto_real)
+def ambiente_mock(labirinto_real: Labirinto) -> MagicMock:
+    # O mock é recriado a cada teste, para que as chamadas registradas não se misturem
+    ambiente = MagicMock(wraps=labirinto_real)
+    # O JogoGrafico desenha o fundo direto das arrays do labirinto
+    ambiente._grade = labirinto_real._grade
+    ambiente._rastro = labirinto_real._rastro
+    return ambiente
 
 # ========================================
 # TESTES DE JogoGrafico
@@ -58,7 +77,10 @@ def test_processar_movimento_continuo(mocker, ambiente_mock: MagicMock) -> None:
     teclado_falso = [False] * 512
     # Agora funciona porque importamos pygame lá em cima
     teclado_falso[pygame.K_w] = True
-    mocker.patch('pygame.key.get_pressed', return_value=teclado_falso)
+    # O MagicMock registra cada tecla consultada, repassando a leitura à lista
+    teclado_espiao = MagicMock()
+    teclado_espiao.__getitem__.side_effect = teclado_falso.__getitem__
+    mocker.patch('pygame.key.get_pressed', return_value=teclado_espiao)
 
     # Instância do jogo
     jogo = JogoGrafico(ambiente_mock, tamanho_celula=10)
@@ -67,10 +89,72 @@ def test_processar_movimento_continuo(mocker, ambiente_mock: MagicMock) -> None:
     # Executa o método
     jogo.processar_movimento_continuo()
 
-    # Verifica se a ação "W" foi chamada no ambiente
-    # Nota: Verifique se seu código usa "W" maiúsculo ou minúsculo.
-    # Se o teste falhar aqui, troque "W" por "w"
-    ambiente_mock.executar_acao.assert_called_once_with("W")
+    # Verifica se a ação "cima" foi chamada no ambiente (já como inteiro)
+    ambiente_mock.executar_acao.assert_called_once_with(Acao.CIMA)
 
     # O último movimento deve ter sido atualizado para o tempo atual (200)
     assert jogo.ultimo_movimento == 200
+
+    # Só as teclas de movimento são lidas (aqui, só a primeira, já pressionada),
+    # nunca o teclado inteiro
+    teclas_lidas = [chamada.args[0] for chamada in teclado_espiao.__getitem__.call_args_list]
+    assert teclas_lidas == [pygame.K_w]
+
+
+
+def test_processar_movimento_com_setas_e_sem_tecla(mocker, ambiente_mock: MagicMock) -> None:
+    # Mock de init/display, tempo, eventos e teclado
+    mocker.patch('pygame.init')
+    mocker.patch('pygame.display.set_mode')
+    mocker.patch('pygame.display.set_caption')
+    mocker.patch('pygame.time.get_ticks', return_value=200)
+    mocker.patch('pygame.event.post')
+    mocker.patch('pygame.event.Event', return_value="EVENTO_FAKE")
+    mocker.patch('pygame.time.wait')
+    teclado_falso = mocker.patch('pygame.key.get_pressed')
+
+    jogo = JogoGrafico(ambiente_mock, tamanho_celula=10)
+
+    # Seta para baixo: as setas usam códigos de tecla grandes, então o
+    # teclado falso é um dicionário em vez de uma lista
+    teclado_falso.return_value = defaultdict(bool, {pygame.K_DOWN: True})
+    jogo.ultimo_movimento = 0
+    jogo.processar_movimento_continuo()
+    ambiente_mock.executar_acao.assert_called_once_with(Acao.BAIXO)
+
+    # Nenhuma tecla de movimento: nada é executado e o cooldown não reinicia
+    ambiente_mock.executar_acao.reset_mock()
+    teclado_vazio = defaultdict(bool)
+    teclado_falso.return_value = teclado_vazio
+    jogo.ultimo_movimento = 0
+    jogo.processar_movimento_continuo()
+    ambiente_mock.executar_acao.assert_not_called()
+    assert jogo.ultimo_movimento == 0
+
+    # Sem tecla pressionada, são lidas só as 8 teclas de movimento
+    assert set(teclado_vazio) == {
+        pygame.K_w, pygame.K_s, pygame.K_a, pygame.K_d,
+        pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT,
+    }
+
+def test_desenhar_labirinto_com_fundo_pre_desenhado(mocker) -> None:
+    # A janela é uma Surface comum: nenhum display é aberto
+    mocker.patch('pygame.init')
+    mocker.patch('pygame.display.set_mode', side_effect=lambda tamanho: pygame.Surface(tamanho))
+    mocker.patch('pygame.display.set_caption')
+
+    matriz = [['#', '#', '#', '#'], ['#', ' ', ' ', '#'], ['#', '#', '#', '#']]
+    labirinto = Labirinto(matriz, (1, 1), (1, 2))
+    jogo = JogoGrafico(labirinto, tamanho_celula=10)
+
+    # O primeiro frame atualiza a tela inteira
+    assert jogo._desenhar_labirinto() == [pygame.Rect(0, 0, 40, 30)]
+    assert jogo.tela.get_at((15, 15))[:3] == COR_AGENTE
+
+    # Depois de um movimento, só as células antiga e nova do agente mudam
+    labirinto.executar_acao("D")
+    areas = jogo._desenhar_labirinto()
+
+    assert areas == [pygame.Rect(10, 10, 10, 10), pygame.Rect(20, 10, 10, 10)]
+    assert jogo._fundo.get_at((15, 15))[:3] == COR_RASTRO[:3], "O rastro deveria ir para o fundo."
+    assert jogo.tela.get_at((25, 15))[:3] == COR_AGENTE, "O agente é desenhado por cima da saída."
@@ -0,0 +1,113 @@
+"""
+Testes unitários para o módulo planejador.
+
+Este arquivo verifica se o caminho calculado é o mais curto, se leva de
+fato o agente até a saída quando executado no Labirinto e se labirintos
+sem solução são reconhecidos.
+"""
+
+import numpy as np
+import pytest
+
+from ..ambiente import Acao, Labirinto
+from ..gerador_labirinto import gerar_grade_labirinto
+from ..planejador import a_estrela, busca_bidirecional, busca_em_largura
+
+
+# --- DADOS DE TESTE ---
+LABIRINTO_EXEMPLO = [
+    [' ', '#', ' '],
+    [' ', ' ', ' '],
+    ['#', '#', ' ']
+]
+PONTO_INICIAL_EXEMPLO = (0, 0)
+PONTO_FINAL_EXEMPLO = (2, 2)
+
+# Todos os planejadores devem encontrar caminhos mais curtos equivalentes
+PLANEJADORES = pytest.mark.parametrize("planejar", [busca_em_largura, a_estrela, busca_bidirecional])
+
+
+# ========================================
+# TESTES DOS PLANEJADORES (BFS, A* E BFS BIDIRECIONAL)
+# ========================================
+
+
+@PLANEJADORES
+def test_caminho_mais_curto_no_exemplo(planejar) -> None:
+    """Verifica se o planejador encontra o único caminho mais curto do exemplo."""
+    # Act
+    acoes = planejar(LABIRINTO_EXEMPLO, PONTO_INICIAL_EXEMPLO, PONTO_FINAL_EXEMPLO)
+
+    # Assert
+    assert acoes == [Acao.BAIXO, Acao.DIREITA, Acao.DIREITA, Acao.BAIXO]
+
+
+@PLANEJADORES
+def test_inicio_igual_ao_objetivo(planejar) -> None:
+    """Verifica se nenhuma ação é necessária quando já se está no objetivo."""
+    assert planejar(LABIRINTO_EXEMPLO, (1, 1), (1, 1)) == []
+
+
+@PLANEJADORES
+def test_labirinto_sem_caminho(planejar) -> None:
+    """Verifica se None é devolvido quando o objetivo está isolado por paredes."""
+    # Arrange: A saída (0, 2) fica cercada pela parede em (0, 1) e por (1, 2)
+    matriz = [[' ', '#', ' '], [' ', ' ', '#'], ['#', '#', ' ']]
+
+    # Act / Assert
+    assert planejar(matriz, (0, 0), (0, 2)) is None
+
+
+@PLANEJADORES
+@pytest.mark.parametrize("semente", [1, 7, 42])
+def test_caminho_leva_a_saida_em_labirinto_gerado(planejar, semente: int) -> None:
+    """Verifica se a sequência planejada resolve um labirinto gerado, com a grade uint8."""
+    # Arrange
+    grade = gerar_grade_labirinto(6, 10, semente=semente)
+    ponto_final = (11, 19)
+    labirinto = Labirinto(grade, (1, 1), ponto_final)
+
+    # Act
+    acoes = planejar(grade, (1, 1), ponto_final)
+    posicao, _, passos, terminou = labirinto.executar_sequencia(np.array(acoes))
+
+    # Assert: O labirinto é perfeito, então o caminho não tem passos desperdiçados
+    assert terminou and posicao == ponto_final
+    assert passos == len(acoes)
+    labirinto.reiniciar()
+    assert not labirinto.executar_sequencia(np.array(acoes[:-1]))[3]
+
+
+@PLANEJADORES
+def test_caminho_mais_curto_em_grade_aberta(planejar) -> None:
+    """Verifica se, sem paredes (muitos caminhos mínimos), o caminho tem a distância de Manhattan."""
+    # Arrange
+    grade = np.zeros((9, 9), dtype=np.uint8)
+    labirinto = Labirinto(grade, (0, 0), (8, 5))
+
+    # Act
+    acoes = planejar(grade, (0, 0), (8, 5))
+
+    # Assert
+    assert len(acoes) == 13
+    assert labirinto.executar_sequencia(np.array(acoes))[3]
+
+
+@pytest.mark.parametrize("semente", range(20))
+def test_busca_bidirecional_igual_a_busca_em_largura_com_ciclos(semente: int) -> None:
+    """Verifica o comprimento mínimo da busca bidirecional em grades com ciclos (paredes aleatórias)."""
+    # Arrange: Paredes sorteadas criam vários caminhos de comprimentos diferentes
+    rng = np.random.default_rng(semente)
+    grade = (rng.random((15, 15)) < 0.3).astype(np.uint8)
+    grade[0, 0] = grade[14, 14] = 0
+
+    # Act
+    acoes_bfs = busca_em_largura(grade, (0, 0), (14, 14))
+    acoes_bidirecional = busca_bidirecional(grade, (0, 0), (14, 14))
+
+    # Assert
+    if acoes_bfs is None:
+        assert acoes_bidirecional is None
+    else:
+        assert len(acoes_bidirecional) == len(acoes_bfs)
+        assert Labirinto(grade, (0, 0), (14, 14)).executar_sequencia(np.array(acoes_bidirecional))[3]